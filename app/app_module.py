@@ -1,7 +1,11 @@
+from typing import Optional
+
 from injector import Injector, Module
 from app.infrastructure.infrastructure_module import InfrastructureModule
 from app.use_cases.use_cases_module import UseCasesModule
 from app.config.config_module import ConfigModule
+from app.ports.metrics import MetricsPort, set_metrics
+from app.ports.tracing import SpanExporterPort, set_span_exporter
 
 
 class AppModule(Module):
@@ -13,4 +17,26 @@ class AppModule(Module):
         binder.install(UseCasesModule())
 
 
-injector = Injector([AppModule()])
+_injector: Optional[Injector] = None
+
+
+def get_injector() -> Injector:
+    """
+    Returns the application injector, building it on first use so importing
+    the app stays free of side effects. The HTTP app builds it in its
+    lifespan startup; scripts and CLIs build it on their first lookup.
+    """
+    if _injector is None:
+        set_injector(Injector([AppModule()]))
+    return _injector
+
+
+def set_injector(injector: Injector) -> None:
+    """
+    Installs `injector` as the application injector, along with the metrics
+    and span exporter it provides.
+    """
+    global _injector
+    _injector = injector
+    set_metrics(injector.get(MetricsPort))
+    set_span_exporter(injector.get(SpanExporterPort))
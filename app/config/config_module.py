@@ -1,62 +1,130 @@
-from contextlib import contextmanager
-from typing import Iterable
-from sqlalchemy.engine.url import URL
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterable, List
+from sqlalchemy.engine.url import URL, make_url
 from injector import Module, inject, singleton
 from app.config.environment import get_environment_variables
+from app.config.pool_metrics import get_pool_class, register_pool_metrics
+from app.config.replica_router import AsyncReplicaRouter, ReplicaRouter
+from app.ports.tracing import span
 from app.ports.transactional.transaction_manager import (
+    AsyncTransactionManagerPort,
     TransactionManagerPort,
 )
-from sqlalchemy_utils import database_exists, create_database
 
 
 from injector import inject
-from sqlalchemy import create_engine, MetaData, Engine
+from sqlalchemy import create_engine, Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from sqlalchemy.ext.declarative import declarative_base
 
 env = get_environment_variables()
 
 
-DATABASE = {
-    "drivername": env.DB_DIALECT,
-    "username": env.DB_USER,
-    "password": env.DB_PASSWORD,
-    "host": env.DB_HOST,
-    "port": env.DB_PORT,
-    "database": env.DB_DATABASE_NAME,
-}
-DATABASE_URL = URL.create(**DATABASE)
+def get_database_url() -> URL:
+    """
+    DATABASE_URL when it is set, otherwise a URL built from the DB_* parts.
+    SQLite URLs only name the database file, so host, port and credentials
+    are left out for it.
+    """
+    if env.DATABASE_URL:
+        return make_url(env.DATABASE_URL)
+    url = URL.create(env.DB_DIALECT, database=env.DB_DATABASE_NAME)
+    if url.get_backend_name() == "sqlite":
+        return url
+    return url.set(
+        username=env.DB_USER,
+        password=env.DB_PASSWORD,
+        host=env.DB_HOST,
+        port=env.DB_PORT,
+    )
 
-print(f"Connecting to database: {DATABASE_URL}")
 
-if not database_exists(DATABASE_URL):
-    create_database(DATABASE_URL)
-    print("Database created!")
-else:
-    print("Database already exists.")
+DATABASE_URL = get_database_url()
+ASYNC_DATABASE_URL = DATABASE_URL.set(drivername=env.DB_ASYNC_DIALECT)
 
 Base = declarative_base()
 
 
-def get_engine() -> Engine:
-    engine = create_engine(
-        DATABASE_URL,
-        echo=env.DEBUG,
-        future=True,
-        pool_size=10,
-        max_overflow=20,
-        pool_recycle=3600,
-        pool_timeout=30,
-    )
-    Base.metadata.create_all(bind=engine)
+def get_engine_options(url: URL) -> dict:
+    """
+    Pool and connection settings shared by the sync and async engines.
+    Schema management lives in the `db` CLI, not in engine construction.
+    """
+    options = {
+        "echo": env.DEBUG,
+        "pool_size": env.DB_POOL_SIZE,
+        "max_overflow": env.DB_MAX_OVERFLOW,
+        "pool_pre_ping": env.DB_POOL_PRE_PING,
+        "pool_recycle": env.DB_POOL_RECYCLE,
+        "pool_timeout": env.DB_POOL_TIMEOUT,
+    }
+    if env.DB_STATEMENT_TIMEOUT_MS and url.get_backend_name() == "postgresql":
+        timeout = str(env.DB_STATEMENT_TIMEOUT_MS)
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": timeout}
+            }
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    if env.METRICS_ENABLED:
+        options["poolclass"] = get_pool_class(url.get_dialect().is_async)
+    return options
+
 
-    engine = create_engine(DATABASE_URL)
-    metadata = MetaData(schema=env.DB_SCHEMA)
-    metadata.reflect(bind=engine)
+def get_replica_urls(url: URL) -> List[URL]:
+    """
+    Builds one URL per `host[:port]` entry of DB_REPLICA_HOSTS, reusing the
+    credentials and database of `url`. For SQLite each entry is a database
+    file, which allows exercising replica routing locally.
+    """
+    urls = []
+    for entry in filter(None, map(str.strip, env.DB_REPLICA_HOSTS.split(","))):
+        if url.get_backend_name() == "sqlite":
+            urls.append(url.set(database=entry))
+            continue
+        host, _, port = entry.partition(":")
+        urls.append(url.set(host=host, port=int(port) if port else url.port))
+    return urls
+
+
+def get_read_only_options(url: URL) -> dict:
+    """
+    Read-only sessions run in autocommit, so no BEGIN/COMMIT round trips are
+    spent on them, and PostgreSQL rejects any write they attempt.
+    """
+    options = {"isolation_level": "AUTOCOMMIT"}
+    if url.get_backend_name() == "postgresql":
+        options["postgresql_readonly"] = True
+    return options
+
+
+def get_engine() -> Engine:
+    engine = create_engine(DATABASE_URL, **get_engine_options(DATABASE_URL))
+    register_pool_metrics(engine, "sync")
     return engine
 
 
+@inject
+def get_replica_router(engine: Engine) -> ReplicaRouter:
+    read_only = get_read_only_options(DATABASE_URL)
+    return ReplicaRouter(
+        primary=engine.execution_options(**read_only),
+        replicas=[
+            create_engine(url, **get_engine_options(url)).execution_options(**read_only)
+            for url in get_replica_urls(DATABASE_URL)
+        ],
+        check_interval=env.DB_REPLICA_CHECK_INTERVAL_SECONDS,
+        max_lag_seconds=env.DB_REPLICA_MAX_LAG_SECONDS,
+    )
+
+
 @inject
 def get_session(engine: Engine) -> sessionmaker[Session]:
     session = sessionmaker(
@@ -67,22 +135,124 @@ def get_session(engine: Engine) -> sessionmaker[Session]:
     return session
 
 
+def get_async_engine() -> AsyncEngine:
+    engine = create_async_engine(
+        ASYNC_DATABASE_URL, **get_engine_options(ASYNC_DATABASE_URL)
+    )
+    register_pool_metrics(engine.sync_engine, "async")
+    return engine
+
+
+@inject
+def get_async_replica_router(engine: AsyncEngine) -> AsyncReplicaRouter:
+    read_only = get_read_only_options(ASYNC_DATABASE_URL)
+    return AsyncReplicaRouter(
+        primary=engine.execution_options(**read_only),
+        replicas=[
+            create_async_engine(url, **get_engine_options(url)).execution_options(
+                **read_only
+            )
+            for url in get_replica_urls(ASYNC_DATABASE_URL)
+        ],
+        check_interval=env.DB_REPLICA_CHECK_INTERVAL_SECONDS,
+        max_lag_seconds=env.DB_REPLICA_MAX_LAG_SECONDS,
+    )
+
+
+@inject
+def get_async_session(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    session = async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    return session
+
+
 class TransactionManager(TransactionManagerPort[Session]):
     @inject
-    def __init__(self, session_local: sessionmaker[Session]):
+    def __init__(
+        self, session_local: sessionmaker[Session], replica_router: ReplicaRouter
+    ):
         self.session_local = session_local
+        self.replica_router = replica_router
+        self.read_session_local = sessionmaker(autoflush=False)
+
+    def get_transaction_context(self, read_only: bool = False) -> Iterable[Session]:
+        if read_only:
+            return self._read_only_context()
+        return self._read_write_context()
 
     @contextmanager
-    def get_transaction_context(self) -> Iterable[Session]:
-        session = self.session_local()
-        try:
-            yield session
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+    def _read_only_context(self) -> Iterable[Session]:
+        with span("db.transaction", **{"db.read_only": True}):
+            engine = self.replica_router.pick()
+            session = self.read_session_local(
+                bind=engine, info={"replica": engine is not self.replica_router.primary}
+            )
+            try:
+                yield session
+            finally:
+                session.close()
+
+    @contextmanager
+    def _read_write_context(self) -> Iterable[Session]:
+        with span("db.transaction", **{"db.read_only": False}):
+            session = self.session_local()
+            try:
+                yield session
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                raise e
+            finally:
+                session.close()
+
+
+class AsyncTransactionManager(AsyncTransactionManagerPort[AsyncSession]):
+    @inject
+    def __init__(
+        self,
+        session_local: async_sessionmaker[AsyncSession],
+        replica_router: AsyncReplicaRouter,
+    ):
+        self.session_local = session_local
+        self.replica_router = replica_router
+        self.read_session_local = async_sessionmaker(
+            autoflush=False, expire_on_commit=False
+        )
+
+    def get_transaction_context(
+        self, read_only: bool = False
+    ) -> AsyncIterator[AsyncSession]:
+        if read_only:
+            return self._read_only_context()
+        return self._read_write_context()
+
+    @asynccontextmanager
+    async def _read_only_context(self) -> AsyncIterator[AsyncSession]:
+        with span("db.transaction", **{"db.read_only": True}):
+            engine = await self.replica_router.pick()
+            session = self.read_session_local(
+                bind=engine, info={"replica": engine is not self.replica_router.primary}
+            )
+            try:
+                yield session
+            finally:
+                await session.close()
+
+    @asynccontextmanager
+    async def _read_write_context(self) -> AsyncIterator[AsyncSession]:
+        with span("db.transaction", **{"db.read_only": False}):
+            session = self.session_local()
+            try:
+                yield session
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                raise e
+            finally:
+                await session.close()
 
 
 class ConfigModule(Module):
@@ -95,8 +265,13 @@ class ConfigModule(Module):
 
         bindings = [
             (Engine, get_engine),
+            (ReplicaRouter, get_replica_router),
             (sessionmaker[Session], get_session),
             (TransactionManagerPort, TransactionManager),
+            (AsyncEngine, get_async_engine),
+            (AsyncReplicaRouter, get_async_replica_router),
+            (async_sessionmaker[AsyncSession], get_async_session),
+            (AsyncTransactionManagerPort, AsyncTransactionManager),
         ]
         for interface, implementation in bindings:
             if interface not in self.exclude_classes:
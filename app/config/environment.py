@@ -1,21 +1,66 @@
 from functools import lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 
 class EnvironmentSettings(BaseSettings):
-    DB_HOST: str
-    DB_PORT: int
-    DB_DATABASE_NAME: str
-    DB_USER: str
-    DB_PASSWORD: str
-    DB_DIALECT: str
+    DATABASE_URL: Optional[str] = None
+    DB_HOST: Optional[str] = None
+    DB_PORT: Optional[int] = None
+    DB_DATABASE_NAME: Optional[str] = None
+    DB_USER: Optional[str] = None
+    DB_PASSWORD: Optional[str] = None
+    DB_DIALECT: str = "postgresql"
     DB_SCHEMA: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_TIMEOUT: int = 30
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    DB_ASYNC: bool = False
+    DB_ASYNC_DIALECT: str = "postgresql+asyncpg"
+    DB_REPLICA_HOSTS: str = ""
+    DB_REPLICA_CHECK_INTERVAL_SECONDS: float = 5.0
+    DB_REPLICA_MAX_LAG_SECONDS: float = 10.0
     API_HOST: str
     API_PORT: int
     DEBUG: bool
     SECRET_KEY: str
     APP_NAME: str
     API_VERSION: str
+    HASHING_POOL_SIZE: Optional[int] = None
+    HASHING_MAX_QUEUE_DEPTH: int = 64
+    PASSWORD_HASH_SCHEME: str = "bcrypt"
+    PASSWORD_HASH_PROFILE: str = "production"
+    BCRYPT_ROUNDS: int = 13
+    BCRYPT_TARGET_MS: float = 250.0
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST_KIB: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    SCRYPT_ROUNDS: int = 16
+    SCRYPT_BLOCK_SIZE: int = 8
+    SCRYPT_PARALLELISM: int = 1
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 60.0
+    EXPORT_BATCH_SIZE: int = 1000
+    OUTBOX_SINK: str = "none"
+    OUTBOX_FILE_PATH: str = "user_events.ndjson"
+    OUTBOX_DISPATCHER_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    LOG_LEVEL: str = "INFO"
+    LOG_INFO_SAMPLE_RATE: float = 1.0
+    METRICS_ENABLED: bool = False
+    METRICS_MULTIPROCESS_DIR: Optional[str] = None
+    TRACING_EXPORTER: str = "none"
+    SERVER_WORKERS: Optional[int] = None
+    SERVER_MAX_REQUESTS: int = 10000
+    SERVER_MAX_REQUESTS_JITTER: int = 1000
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: float = 30.0
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_BACKLOG: int = 2048
+    IMPORT_TIME_BUDGET_MS: float = 1000.0
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,53 @@
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.ports.metrics import POOL_CHECKOUT_SECONDS, get_metrics, timed
+
+
+class TimedCheckoutMixin:
+    """
+    Observes how long each connection checkout waits on the pool, including
+    opening a new connection when the pool has none idle.
+    """
+
+    def connect(self):
+        with timed(POOL_CHECKOUT_SECONDS, pool=self.metrics_name):
+            return super().connect()
+
+
+class TimedQueuePool(TimedCheckoutMixin, QueuePool):
+    metrics_name = "sync"
+
+
+class TimedAsyncAdaptedQueuePool(TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    metrics_name = "async"
+
+
+def get_pool_class(is_async: bool):
+    return TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool
+
+
+def register_pool_metrics(engine, name: str) -> None:
+    """
+    Publishes the utilization of `engine`'s pool as gauges read at scrape time.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+
+    def utilization():
+        labels = {"pool": name}
+        return [
+            ({**labels, "state": "checked_out"}, pool.checkedout()),
+            ({**labels, "state": "idle"}, pool.checkedin()),
+            ({**labels, "state": "overflow"}, max(pool.overflow(), 0)),
+        ]
+
+    metrics = get_metrics()
+    metrics.add_gauge(
+        "db_pool_connections", "Connections of the pool by state.", utilization
+    )
+    metrics.add_gauge(
+        "db_pool_size",
+        "Configured size of the pool, overflow excluded.",
+        lambda: [({"pool": name}, pool.size())],
+    )
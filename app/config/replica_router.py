@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import Callable, Generic, List, Optional, TypeVar
+
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+EngineT = TypeVar("EngineT")
+
+# Seconds the replica is behind the primary. A replica that has replayed
+# everything it received reports 0 even if the primary has been idle.
+POSTGRESQL_LAG_QUERY = """
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+DEFAULT_LAG_QUERY = "SELECT 0"
+
+
+def get_lag_query(engine) -> str:
+    if engine.dialect.name == "postgresql":
+        return POSTGRESQL_LAG_QUERY
+    return DEFAULT_LAG_QUERY
+
+
+class ReplicaState(Generic[EngineT]):
+    def __init__(self, engine: EngineT):
+        self.engine = engine
+        self.healthy = True
+        self.checked_at: Optional[float] = None
+
+
+class BaseReplicaRouter(Generic[EngineT]):
+    """
+    Round-robin over replica engines. Each replica is probed at most once per
+    `check_interval` seconds; it is skipped while the probe fails or reports
+    more than `max_lag_seconds` of replication lag. When no replica is usable
+    the primary serves the read.
+    """
+
+    def __init__(
+        self,
+        primary: EngineT,
+        replicas: List[EngineT],
+        check_interval: float = 5.0,
+        max_lag_seconds: float = 10.0,
+        lag_query: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary = primary
+        self.replicas = [ReplicaState(engine) for engine in replicas]
+        self.check_interval = check_interval
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_query = lag_query
+        self.clock = clock
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _rotation(self) -> List[ReplicaState]:
+        """
+        Returns every replica once, starting one further along than the
+        previous call.
+        """
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % len(self.replicas) if self.replicas else 0
+        return self.replicas[start:] + self.replicas[:start]
+
+    def _claim_probe(self, state: ReplicaState) -> bool:
+        """
+        Returns whether `state` must be probed now, marking it as checked so
+        concurrent callers keep using the last known health meanwhile.
+        """
+        with self._lock:
+            now = self.clock()
+            if state.checked_at is not None and now - state.checked_at < (
+                self.check_interval
+            ):
+                return False
+            state.checked_at = now
+            return True
+
+    def _is_acceptable(self, lag: Optional[float]) -> bool:
+        return lag is None or float(lag) <= self.max_lag_seconds
+
+    def _query_for(self, engine) -> str:
+        return self.lag_query or get_lag_query(engine)
+
+
+class ReplicaRouter(BaseReplicaRouter[Engine]):
+    def pick(self) -> Engine:
+        for state in self._rotation():
+            if self._claim_probe(state):
+                state.healthy = self._probe(state.engine)
+            if state.healthy:
+                return state.engine
+        return self.primary
+
+    def _probe(self, engine: Engine) -> bool:
+        try:
+            with engine.connect() as connection:
+                lag = connection.execute(text(self._query_for(engine))).scalar()
+            return self._is_acceptable(lag)
+        except Exception:
+            return False
+
+
+class AsyncReplicaRouter(BaseReplicaRouter[AsyncEngine]):
+    async def pick(self) -> AsyncEngine:
+        for state in self._rotation():
+            if self._claim_probe(state):
+                state.healthy = await self._probe(state.engine)
+            if state.healthy:
+                return state.engine
+        return self.primary
+
+    async def _probe(self, engine: AsyncEngine) -> bool:
+        try:
+            async with engine.connect() as connection:
+                lag = (await connection.execute(text(self._query_for(engine)))).scalar()
+            return self._is_acceptable(lag)
+        except Exception:
+            return False
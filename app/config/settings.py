@@ -1,14 +1,65 @@
 from functools import lru_cache
+from typing import Any, Dict
+
+from app.config.environment import EnvironmentSettings, get_environment_variables
+
+# Every supported scheme stays enabled so existing hashes keep verifying after
+# PASSWORD_HASH_SCHEME changes; hashes in any other scheme than the default
+# are deprecated and rehashed on the next successful verification.
+PASSWORD_HASH_SCHEMES = ("argon2", "scrypt", "bcrypt")
+
+# PASSWORD_HASH_PROFILE=test: the cheapest parameters each scheme accepts, so
+# test suites do not spend their runtime in the KDF. Never use it in production.
+TEST_HASH_PARAMETERS = {
+    "bcrypt__rounds": 4,
+    "argon2__rounds": 1,
+    "argon2__memory_cost": 8,
+    "argon2__parallelism": 1,
+    "scrypt__rounds": 1,
+    "scrypt__block_size": 1,
+    "scrypt__parallelism": 1,
+}
+
+
+def password_hash_parameters(env: EnvironmentSettings) -> Dict[str, Any]:
+    if env.PASSWORD_HASH_PROFILE == "test":
+        return dict(TEST_HASH_PARAMETERS)
+    if env.PASSWORD_HASH_PROFILE != "production":
+        raise ValueError(
+            f"Unknown PASSWORD_HASH_PROFILE {env.PASSWORD_HASH_PROFILE!r}, "
+            "expected 'production' or 'test'"
+        )
+    return {
+        # Calibrated per host with `python -m app.presentation.cli.hashing
+        # calibrate`; hashes made with other rounds are rehashed on the
+        # next successful verification.
+        "bcrypt__rounds": env.BCRYPT_ROUNDS,
+        "argon2__rounds": env.ARGON2_TIME_COST,
+        "argon2__memory_cost": env.ARGON2_MEMORY_COST_KIB,
+        "argon2__parallelism": env.ARGON2_PARALLELISM,
+        # log2 of the scrypt cost N; memory per hash is 128 * block_size * N.
+        "scrypt__rounds": env.SCRYPT_ROUNDS,
+        "scrypt__block_size": env.SCRYPT_BLOCK_SIZE,
+        "scrypt__parallelism": env.SCRYPT_PARALLELISM,
+    }
 
 
 class Settings:
     def __init__(self):
+        env = get_environment_variables()
+        scheme = env.PASSWORD_HASH_SCHEME.lower()
+        if scheme not in PASSWORD_HASH_SCHEMES:
+            raise ValueError(
+                f"Unknown PASSWORD_HASH_SCHEME {env.PASSWORD_HASH_SCHEME!r}, "
+                f"expected one of {', '.join(PASSWORD_HASH_SCHEMES)}"
+            )
         self.API_V1_STR = "/api/v1"
         self.crypt_context_settings = {
-            "schemes": ["bcrypt"],
-            "default": "bcrypt",
+            "schemes": list(PASSWORD_HASH_SCHEMES),
+            "default": scheme,
             "deprecated": "auto",
-            "bcrypt__rounds": 13,
+            "argon2__type": "ID",
+            **password_hash_parameters(env),
         }
 
 
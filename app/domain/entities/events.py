@@ -0,0 +1,46 @@
+from enum import Enum
+from typing import Any, Dict, Optional
+from uuid import UUID
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field
+
+from app.domain.entities.users import USER_EXPORT_FIELDS, UserInDBBase
+
+
+class UserEventType(str, Enum):
+    CREATED = "user.created"
+    UPDATED = "user.updated"
+    DELETED = "user.deleted"
+
+
+class UserEvent(BaseModel):
+    """
+    A change to a user, recorded in the outbox in the same transaction as the
+    change and delivered to downstream consumers after it commits. `id` is
+    the outbox sequence number, set once the event is stored.
+    """
+
+    id: Optional[int] = None
+    type: UserEventType
+    user_id: UUID
+    occurred_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+def user_changed_event(event_type: UserEventType, user: UserInDBBase) -> UserEvent:
+    """
+    Event carrying the user's public fields as they are after the change.
+    """
+    return UserEvent(
+        type=event_type,
+        user_id=user.id,
+        occurred_at=user.updated_at,
+        data=user.model_dump(mode="json", include=set(USER_EXPORT_FIELDS)),
+    )
+
+
+def user_deleted_event(user_id: UUID, username: str) -> UserEvent:
+    return UserEvent(
+        type=UserEventType.DELETED, user_id=user_id, data={"username": username}
+    )
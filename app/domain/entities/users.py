@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
@@ -35,8 +35,8 @@ class UserUpdate(UserBase):
 class UserInDBBase(UserBase):
     id: UUID = Field(default_factory=uuid4)
     hashed_password: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     deleted_at: Optional[datetime] = None
 
     class Config:
@@ -55,3 +55,44 @@ class UserResponse(UserInDBBase):
     created_at: datetime
     updated_at: datetime
     deleted_at: Optional[datetime] = Field(None, exclude=True)
+
+
+# Columns written by the users export, in output order. Never includes credentials.
+USER_EXPORT_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "role",
+    "active",
+    "created_at",
+    "updated_at",
+)
+
+
+class UserPage(BaseModel):
+    items: List[UserInDBBase]
+    next_cursor: Optional[str] = None
+
+
+class UserBatch(BaseModel):
+    """
+    Users found for a list of ids, in request order, and the ids that matched
+    no active user.
+    """
+
+    users: List[UserInDBBase]
+    missing: List[UUID] = []
+
+
+class BulkCreateStatus(str, Enum):
+    CREATED = "created"
+    CONFLICT = "conflict"
+
+
+class BulkCreateUserResult(BaseModel):
+    index: int
+    status: BulkCreateStatus
+    user: Optional[UserInDBBase] = None
+    detail: Optional[str] = None
@@ -8,3 +8,16 @@ class UserNotFoundError(Exception):
 
 class InvalidCredentialsError(Exception):
     pass
+
+
+class ServiceOverloadedError(Exception):
+    pass
+
+
+class StaleUserVersionError(Exception):
+    """
+    Raised when a conditional update names a version of the user that is no
+    longer current.
+    """
+
+    pass
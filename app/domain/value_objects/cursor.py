@@ -0,0 +1,58 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+
+
+def _encode_token(values: list) -> str:
+    raw = json.dumps(values)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_token(token: str) -> list:
+    padded = token + "=" * (-len(token) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+class UserCursor(BaseModel):
+    """
+    Position of the last user of a page in the `(created_at, id)` ordering,
+    serialized as an opaque URL-safe token for keyset pagination.
+    """
+
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        return _encode_token([self.created_at.isoformat(), str(self.id)])
+
+    @classmethod
+    def decode(cls, token: str) -> "UserCursor":
+        try:
+            created_at, user_id = _decode_token(token)
+            return cls(created_at=created_at, id=user_id)
+        except (ValueError, TypeError, ValidationError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+
+class UserSearchCursor(BaseModel):
+    """
+    Position of the last user of a search page in the `(rank desc, username)`
+    ordering. Usernames are unique, so the pair is a strict total order.
+    """
+
+    rank: int
+    username: str
+
+    def encode(self) -> str:
+        return _encode_token([self.rank, self.username])
+
+    @classmethod
+    def decode(cls, token: str) -> "UserSearchCursor":
+        try:
+            rank, username = _decode_token(token)
+            return cls(rank=rank, username=username)
+        except (ValueError, TypeError, ValidationError) as e:
+            raise ValueError("Invalid pagination cursor") from e
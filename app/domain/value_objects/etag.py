@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ANY = "*"
+
+
+def _micros(updated_at: datetime) -> int:
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return (updated_at - EPOCH) // timedelta(microseconds=1)
+
+
+def user_etag(user_id: UUID, updated_at: datetime) -> str:
+    """
+    Strong entity tag of a user version. Every write bumps `updated_at`, so
+    the pair identifies the representation without hashing the body.
+    """
+    return f'"{user_id.hex}-{_micros(updated_at)}"'
+
+
+def _entity_tags(header: str) -> List[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against the current tag, as
+    RFC 9110 requires for conditional GETs.
+    """
+    tags = _entity_tags(header)
+    return ANY in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def expected_versions(header: str, user_id: UUID) -> Optional[List[datetime]]:
+    """
+    `updated_at` values an If-Match header accepts for `user_id`, or None for
+    `*`. Uses strong comparison: weak tags and tags of other users never match,
+    so they yield no versions and the precondition fails.
+    """
+    versions = []
+    for tag in _entity_tags(header):
+        if tag == ANY:
+            return None
+        owner, _, micros = tag.strip('"').partition("-")
+        if tag.startswith('"') and owner == user_id.hex and micros.isdigit():
+            versions.append(EPOCH + timedelta(microseconds=int(micros)))
+    return versions
@@ -0,0 +1,56 @@
+from typing import List, Optional
+
+# Relevance of one search term against a user, highest first. The SQL and the
+# in-memory repositories implement the same tiers, so results rank alike.
+EXACT_MATCH = 4
+IDENTIFIER_PREFIX = 3
+NAME_PREFIX = 2
+SUBSTRING = 1
+
+MAX_SEARCH_TERMS = 5
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    Lower-cased, whitespace-separated terms of a search query. Extra terms
+    beyond MAX_SEARCH_TERMS are ignored to bound the cost of the query.
+    """
+    return query.lower().split()[:MAX_SEARCH_TERMS]
+
+
+def term_relevance(
+    term: str,
+    username: str,
+    email: str,
+    first_name: Optional[str],
+    last_name: Optional[str],
+) -> int:
+    """
+    Relevance tier of a lower-cased `term` for one user, or 0 when no field
+    contains it.
+    """
+    identifiers = (username.lower(), email.lower())
+    names = tuple(name.lower() for name in (first_name, last_name) if name)
+    if term in identifiers:
+        return EXACT_MATCH
+    if any(value.startswith(term) for value in identifiers):
+        return IDENTIFIER_PREFIX
+    if any(value.startswith(term) for value in names):
+        return NAME_PREFIX
+    if any(term in value for value in identifiers + names):
+        return SUBSTRING
+    return 0
+
+
+def relevance(terms: List[str], **fields: Optional[str]) -> int:
+    """
+    Sum of the term relevances, or 0 when any term matches no field: every
+    term has to match for the user to be a result.
+    """
+    total = 0
+    for term in terms:
+        score = term_relevance(term, **fields)
+        if not score:
+            return 0
+        total += score
+    return total
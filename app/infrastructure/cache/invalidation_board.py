@@ -0,0 +1,38 @@
+import multiprocessing
+import zlib
+
+
+class InvalidationBoard:
+    """
+    Invalidation stamps kept in shared memory, so a delete in one worker
+    reaches the in-process caches of every worker forked after the board was
+    created. Each key hashes to a slot holding the sequence number of its
+    last invalidation; keys sharing a slot only cost each other extra misses.
+    """
+
+    def __init__(self, slots: int = 65536):
+        self.slots = slots
+        self._sequence = multiprocessing.Value("q", 0)
+        self._stamps = multiprocessing.Array("q", slots, lock=False)
+
+    def _slot(self, key: str) -> int:
+        return zlib.crc32(key.encode()) % self.slots
+
+    def stamp(self) -> int:
+        """
+        Returns the sequence number to store alongside a value being cached.
+        """
+        return self._sequence.value
+
+    def invalidate(self, *keys: str) -> None:
+        with self._sequence.get_lock():
+            self._sequence.value += 1
+            for key in keys:
+                self._stamps[self._slot(key)] = self._sequence.value
+
+    def is_stale(self, key: str, stamp: int) -> bool:
+        """
+        Returns whether `key` was invalidated after a value stored with
+        `stamp` was cached.
+        """
+        return self._stamps[self._slot(key)] > stamp
@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.infrastructure.cache.invalidation_board import InvalidationBoard
+from app.ports.cache import CacheServicePort, CacheStats
+
+
+class LRUTTLCache(CacheServicePort):
+    """
+    Thread-safe in-process LRU cache whose entries expire after `ttl_seconds`.
+    With a `board`, deletes are published to it and entries deleted by any
+    process sharing the board are treated as misses.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_seconds: float = 60.0,
+        board: Optional[InvalidationBoard] = None,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.board = board
+        self._entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, stamp, value = entry
+            if expires_at <= time.monotonic() or self.is_stale(key, stamp):
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any, stamp: Optional[int] = None) -> None:
+        if self.max_size <= 0:
+            return
+        if stamp is None:
+            stamp = self.stamp()
+        elif self.is_stale(key, stamp):
+            return
+        # The entry keeps the caller's stamp, so a delete landing between the
+        # check above and the store still turns it into a miss.
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        if self.board is not None:
+            self.board.invalidate(*keys)
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def stamp(self) -> int:
+        return self.board.stamp() if self.board is not None else 0
+
+    def is_stale(self, key: str, stamp: int) -> bool:
+        return self.board is not None and self.board.is_stale(key, stamp)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
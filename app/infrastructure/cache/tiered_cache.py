@@ -0,0 +1,53 @@
+from typing import Any, Optional
+
+from app.ports.cache import CacheServicePort, CacheStats
+
+
+class TieredCache(CacheServicePort):
+    """
+    Two-level cache: an in-process tier in front of a backend shared between
+    workers. Reads fall through to the shared tier and repopulate the local
+    one; writes and deletes go to both. Give the local tier of every worker
+    the same InvalidationBoard so a delete also drops the other workers'
+    local copies.
+    """
+
+    def __init__(self, local: CacheServicePort, shared: CacheServicePort):
+        self.local = local
+        self.shared = shared
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is None:
+            value = self.shared.get(key)
+            if value is not None:
+                self.local.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any, stamp: Optional[int] = None) -> None:
+        if stamp is not None and self.is_stale(key, stamp):
+            return
+        self.local.set(key, value, stamp)
+        self.shared.set(key, value)
+
+    def delete(self, *keys: str) -> None:
+        # Shared tier first: otherwise another worker could refill its local
+        # tier from the shared entry in between.
+        self.shared.delete(*keys)
+        self.local.delete(*keys)
+
+    def stamp(self) -> int:
+        return self.local.stamp()
+
+    def is_stale(self, key: str, stamp: int) -> bool:
+        return self.local.is_stale(key, stamp)
+
+    def stats(self) -> CacheStats:
+        local = self.local.stats()
+        shared = self.shared.stats()
+        return CacheStats(
+            hits=local.hits + shared.hits,
+            misses=shared.misses,
+            evictions=local.evictions + shared.evictions,
+            size=shared.size,
+        )
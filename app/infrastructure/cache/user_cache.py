@@ -0,0 +1,63 @@
+from typing import Optional
+from uuid import UUID
+
+from injector import inject
+
+from app.domain.entities.users import UserInDBBase
+from app.ports.cache import CacheServicePort, CacheStats, UserCachePort
+
+
+class UserCache(UserCachePort):
+    """
+    Stores users by id; email and username entries only point to the id, so
+    invalidating the id entry is enough to drop every lookup of that user.
+    """
+
+    @inject
+    def __init__(self, cache: CacheServicePort):
+        self.cache = cache
+
+    @staticmethod
+    def _id_key(user_id: UUID) -> str:
+        return f"user:id:{user_id}"
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"user:email:{email}"
+
+    @staticmethod
+    def _username_key(username: str) -> str:
+        return f"user:username:{username}"
+
+    def get_by_id(self, user_id: UUID) -> Optional[UserInDBBase]:
+        return self.cache.get(self._id_key(user_id))
+
+    def get_by_email(self, email: str) -> Optional[UserInDBBase]:
+        user_id = self.cache.get(self._email_key(email))
+        if user_id is None:
+            return None
+        user = self.get_by_id(user_id)
+        return user if user is not None and user.email == email else None
+
+    def get_by_username(self, username: str) -> Optional[UserInDBBase]:
+        user_id = self.cache.get(self._username_key(username))
+        if user_id is None:
+            return None
+        user = self.get_by_id(user_id)
+        return user if user is not None and user.username == username else None
+
+    def put(self, user: UserInDBBase, stamp: Optional[int] = None) -> None:
+        self.cache.set(self._id_key(user.id), user, stamp)
+        if user.email:
+            self.cache.set(self._email_key(user.email), user.id, stamp)
+        if user.username:
+            self.cache.set(self._username_key(user.username), user.id, stamp)
+
+    def stamp(self) -> int:
+        return self.cache.stamp()
+
+    def invalidate(self, user_id: UUID) -> None:
+        self.cache.delete(self._id_key(user_id))
+
+    def stats(self) -> CacheStats:
+        return self.cache.stats()
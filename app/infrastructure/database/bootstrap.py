@@ -0,0 +1,28 @@
+from sqlalchemy import Engine, text
+from sqlalchemy_utils import create_database, database_exists
+
+from app.config.config_module import Base
+from app.infrastructure.database import models  # noqa: F401  (registers tables)
+from app.ports.logging import LoggerServicePort
+
+
+def bootstrap_database(engine: Engine, logger: LoggerServicePort) -> None:
+    """
+    Creates the database, missing tables and missing indexes.
+    Idempotent; meant to run once per deploy rather than on every boot.
+    """
+    if not database_exists(engine.url):
+        create_database(engine.url)
+        logger.info("Database created!")
+    else:
+        logger.info("Database already exists.")
+
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as connection:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    Base.metadata.create_all(bind=engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    logger.info("Schema is up to date.")
@@ -1,13 +1,41 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SAEnum
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    Index,
+    Integer,
+    String,
+    Boolean,
+    DateTime,
+    Enum as SAEnum,
+    TypeDecorator,
+)
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import timezone
 from datetime import datetime
+from typing import Any, Mapping
+from app.domain.entities.events import UserEvent
 from app.domain.entities.users import UserRole
 from app.domain.entities.users import UserInDBBase
 from app.config.config_module import Base
 
 
+class UTCDateTime(TypeDecorator):
+    """
+    Timezone-aware DateTime. Backends that drop the offset (SQLite) hand the
+    stored UTC value back as naive; it is tagged as UTC on the way out.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+
 class UserModel(Base):
     __tablename__ = "users"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -18,18 +46,99 @@ class UserModel(Base):
     role = Column(SAEnum(UserRole), default=UserRole.USER, nullable=False)
     hashed_password = Column(String, nullable=False)
     created_at = Column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         default=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
     updated_at = Column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
-    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    deleted_at = Column(UTCDateTime(), nullable=True, index=True)
     active = Column(Boolean, default=True)
 
     def to_pydantic(self) -> UserInDBBase:
-        return UserInDBBase.model_validate(self)
+        return row_to_user(
+            {column.key: getattr(self, column.key) for column in USER_COLUMNS}
+        )
+
+
+USER_COLUMNS = tuple(UserModel.__table__.c)
+
+
+def row_to_user(row: Mapping[str, Any]) -> UserInDBBase:
+    """
+    Builds the domain user from a users row without validating it again: the
+    values were validated on the way in and come back already typed.
+    """
+    return UserInDBBase.model_construct(**row)
+
+
+class UserEventModel(Base):
+    """
+    Transactional outbox of user changes. Rows are inserted in the same
+    transaction as the change they describe and deleted once the
+    OutboxDispatcher has delivered them.
+    """
+
+    __tablename__ = "user_events"
+    # SQLite only autoincrements INTEGER primary keys.
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    event_type = Column(String, nullable=False)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    payload = Column(JSON, nullable=False)
+    occurred_at = Column(UTCDateTime(), nullable=False)
+
+
+def event_to_row(event: UserEvent) -> dict:
+    return {
+        "event_type": event.type.value,
+        "user_id": event.user_id,
+        "payload": event.data,
+        "occurred_at": event.occurred_at,
+    }
+
+
+def row_to_event(row: Mapping[str, Any]) -> UserEvent:
+    return UserEvent(
+        id=row["id"],
+        type=row["event_type"],
+        user_id=row["user_id"],
+        occurred_at=row["occurred_at"],
+        data=row["payload"],
+    )
+
+
+# Serves the listing filter plus the (created_at, id) keyset ordering of GET /users.
+Index(
+    "ix_users_active_deleted_at_created_at_id",
+    UserModel.active,
+    UserModel.deleted_at,
+    UserModel.created_at.desc(),
+    UserModel.id.desc(),
+)
+
+
+# Trigram GIN indexes serve the substring and prefix ILIKE filters of
+# GET /users/search. PostgreSQL only; they need the pg_trgm extension, which
+# bootstrap_database creates. Partial, since search skips soft-deleted users.
+SEARCH_COLUMNS = (
+    UserModel.username,
+    UserModel.email,
+    UserModel.first_name,
+    UserModel.last_name,
+)
+for column in SEARCH_COLUMNS:
+    Index(
+        f"ix_users_{column.key}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column.key: "gin_trgm_ops"},
+        postgresql_where=UserModel.deleted_at.is_(None),
+    ).ddl_if(dialect="postgresql")
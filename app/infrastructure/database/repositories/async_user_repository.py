@@ -0,0 +1,310 @@
+from app.ports.repositories import AsyncUserRepository
+from app.ports.logging import LoggerServicePort
+from app.ports.metrics import instrumented
+from app.ports.tracing import traced_methods
+from app.ports.transactional.transaction_executor import TransactionExecutor
+from app.ports.transactional.transactionable import Transactionable
+from app.domain.entities.users import (
+    UserCreate,
+    UserUpdate,
+    UserInDBBase,
+)
+from datetime import datetime
+from uuid import UUID
+from app.domain.entities.events import (
+    UserEventType,
+    user_changed_event,
+    user_deleted_event,
+)
+from app.infrastructure.database.models import USER_COLUMNS, UserModel, row_to_user
+from app.infrastructure.database.repositories.user_repository import (
+    in_request_order,
+    insert_user_events_statement,
+    search_users_statement,
+    select_active_user_version_statement,
+    select_active_users_by_ids_statement,
+    soft_delete_active_user_statement,
+    update_active_user_statement,
+)
+from app.domain.value_objects.cursor import UserCursor, UserSearchCursor
+from typing import Optional, List, Tuple
+from injector import inject
+from sqlalchemy import select, tuple_
+from app.domain.exceptions import (
+    EmailAlreadyExistsError,
+    InvalidCredentialsError,
+)
+
+
+@traced_methods
+@instrumented
+class AsyncSQLAlchemyUserRepository(AsyncUserRepository, Transactionable):
+    """
+    SQLAlchemy AsyncSession implementation of the AsyncUserRepository.
+    Mirrors SQLAlchemyUserRepository without blocking the event loop.
+    """
+
+    @inject
+    def __init__(
+        self,
+        logger_service: LoggerServicePort,
+    ):
+        self.logger_service = logger_service
+        self.db_handler = TransactionExecutor(logger_service)
+
+    async def _get_active_user_by(self, column, value) -> Optional[UserInDBBase]:
+        with self.db_handler.get_session() as db:
+            result = await db.execute(
+                select(*USER_COLUMNS).where(
+                    column == value, UserModel.deleted_at.is_(None)
+                )
+            )
+            row = result.mappings().first()
+            return row_to_user(row) if row else None
+
+    async def get_by_id(self, user_id: UUID) -> Optional[UserInDBBase]:
+        self.logger_service.debug("Attempting to get user by ID: %s", user_id)
+        try:
+            user = await self._get_active_user_by(UserModel.id, user_id)
+            if user:
+                self.logger_service.debug("User found with ID: %s", user_id)
+                return user
+            self.logger_service.warning(
+                "User not found or soft-deleted with ID: %s", user_id
+            )
+            return None
+        except Exception as e:
+            self.logger_service.error(
+                "Error getting user by ID %s: %s", user_id, e, exc_info=True
+            )
+            return None
+
+    async def get_version(self, user_id: UUID) -> Optional[datetime]:
+        self.logger_service.debug("Attempting to get version of user ID: %s", user_id)
+        try:
+            with self.db_handler.get_session() as db:
+                result = await db.execute(select_active_user_version_statement(user_id))
+                return result.scalar()
+        except Exception as e:
+            self.logger_service.error(
+                "Error getting version of user %s: %s", user_id, e, exc_info=True
+            )
+            return None
+
+    async def get_stored_version(self, user_id: UUID) -> Optional[datetime]:
+        return await self.get_version(user_id)
+
+    async def get_many_by_ids(self, user_ids: List[UUID]) -> List[UserInDBBase]:
+        self.logger_service.debug("Attempting to get %s users by ID", len(user_ids))
+        if not user_ids:
+            return []
+        try:
+            with self.db_handler.get_session() as db:
+                result = await db.execute(
+                    select_active_users_by_ids_statement(user_ids)
+                )
+                rows = result.mappings().all()
+                self.logger_service.debug("Retrieved %s users.", len(rows))
+                return in_request_order(map(row_to_user, rows), user_ids)
+        except Exception as e:
+            self.logger_service.error("Error getting users by ID: %s", e, exc_info=True)
+            return []
+
+    async def get_by_username(self, username: str) -> Optional[UserInDBBase]:
+        self.logger_service.debug("Attempting to get user by username: %s", username)
+        try:
+            user = await self._get_active_user_by(UserModel.username, username)
+            if user:
+                self.logger_service.debug("User found with username: %s", username)
+                return user
+            self.logger_service.warning(
+                "User not found or soft-deleted with username: %s", username
+            )
+            return None
+        except Exception as e:
+            self.logger_service.error(
+                "Error getting user by username %s: %s", username, e, exc_info=True
+            )
+            return None
+
+    async def get_by_email(self, email: str) -> Optional[UserInDBBase]:
+        self.logger_service.debug("Attempting to get user by email: %s", email)
+        try:
+            user = await self._get_active_user_by(UserModel.email, email)
+            if user:
+                self.logger_service.debug("User found with email: %s", email)
+                return user
+            self.logger_service.warning(
+                "User not found or soft-deleted with email: %s", email
+            )
+            return None
+        except Exception as e:
+            self.logger_service.error(
+                "Error getting user by email %s: %s", email, e, exc_info=True
+            )
+            return None
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active: bool = True,
+        include_deleted: bool = False,
+        cursor: Optional[UserCursor] = None,
+    ) -> List[UserInDBBase]:
+        self.logger_service.debug(
+            "Attempting to get all users (skip=%s, limit=%s, active=%s, include_deleted=%s, cursor=%s)",
+            skip,
+            limit,
+            active,
+            include_deleted,
+            cursor,
+        )
+        try:
+            with self.db_handler.get_session() as db:
+                query = select(*USER_COLUMNS).where(UserModel.active == active)
+                if not include_deleted:
+                    query = query.where(UserModel.deleted_at.is_(None))
+
+                if cursor is not None:
+                    query = query.where(
+                        tuple_(UserModel.created_at, UserModel.id)
+                        < tuple_(cursor.created_at, cursor.id)
+                    )
+                else:
+                    query = query.offset(skip)
+
+                result = await db.execute(
+                    query.order_by(
+                        UserModel.created_at.desc(), UserModel.id.desc()
+                    ).limit(limit)
+                )
+                rows = result.mappings().all()
+                self.logger_service.debug("Retrieved %s users.", len(rows))
+                return [row_to_user(row) for row in rows]
+        except Exception as e:
+            self.logger_service.error("Error getting all users: %s", e, exc_info=True)
+            return []
+
+    async def search(
+        self, query: str, limit: int = 20, cursor: Optional[UserSearchCursor] = None
+    ) -> List[Tuple[UserInDBBase, int]]:
+        self.logger_service.debug(
+            "Searching users (query=%s, limit=%s, cursor=%s)", query, limit, cursor
+        )
+        try:
+            with self.db_handler.get_session() as db:
+                result = await db.execute(search_users_statement(query, limit, cursor))
+                rows = result.mappings().all()
+                self.logger_service.debug("Found %s users.", len(rows))
+                return [(row_to_user(row), row["rank"]) for row in rows]
+        except Exception as e:
+            self.logger_service.error("Error searching users: %s", e, exc_info=True)
+            return []
+
+    async def add(
+        self, user_data: UserCreate, hashed_password_str: str
+    ) -> UserInDBBase:
+        self.logger_service.debug("Attempting to add new user: %s", user_data.username)
+        db_user = UserModel(
+            username=user_data.username,
+            email=user_data.email,
+            first_name=user_data.first_name,
+            last_name=user_data.last_name,
+            role=user_data.role,
+            hashed_password=hashed_password_str,
+            active=user_data.active if user_data.active is not None else True,
+        )
+        try:
+            with self.db_handler.get_session() as db:
+                db.add(db_user)
+                await db.flush()
+                user = db_user.to_pydantic()
+                await db.execute(
+                    insert_user_events_statement(
+                        [user_changed_event(UserEventType.CREATED, user)]
+                    )
+                )
+                self.logger_service.info(
+                    "User added successfully: %s (ID: %s)", db_user.username, db_user.id
+                )
+                return user
+        except Exception as e:
+            self.logger_service.error(
+                "Error adding user %s: %s", user_data.username, e, exc_info=True
+            )
+            if "ix_users_email" in str(getattr(e, "orig", e)):
+                self.logger_service.warning("Email already exists: %s", user_data.email)
+                raise EmailAlreadyExistsError("Email already exists")
+            elif "ix_users_username" in str(getattr(e, "orig", e)):
+                self.logger_service.warning(
+                    "Username already exists: %s", user_data.username
+                )
+                raise InvalidCredentialsError("Username already exists")
+            raise e
+
+    async def update(
+        self,
+        user_id: UUID,
+        user_data: UserUpdate,
+        hashed_password: Optional[str] = None,
+        expected_versions: Optional[List[datetime]] = None,
+    ) -> Optional[UserInDBBase]:
+        self.logger_service.debug("Attempting to update user ID: %s", user_id)
+        try:
+            with self.db_handler.get_session() as db:
+                result = await db.execute(
+                    update_active_user_statement(
+                        user_id, user_data, hashed_password, expected_versions
+                    )
+                )
+                row = result.mappings().first()
+                if row is None:
+                    self.logger_service.warning(
+                        "User not found or soft-deleted for update with ID: %s", user_id
+                    )
+                    return None
+
+                user = row_to_user(row)
+                await db.execute(
+                    insert_user_events_statement(
+                        [user_changed_event(UserEventType.UPDATED, user)]
+                    )
+                )
+                self.logger_service.info(
+                    "User updated successfully: %s (ID: %s)", row["username"], user_id
+                )
+                return user
+        except Exception as e:
+            self.logger_service.error(
+                "Error updating user %s: %s", user_id, e, exc_info=True
+            )
+            raise
+
+    async def delete(self, user_id: UUID) -> bool:
+        self.logger_service.debug("Attempting to soft delete user ID: %s", user_id)
+        try:
+            with self.db_handler.get_session() as db:
+                result = await db.execute(soft_delete_active_user_statement(user_id))
+                username = result.scalar()
+                if username is not None:
+                    await db.execute(
+                        insert_user_events_statement(
+                            [user_deleted_event(user_id, username)]
+                        )
+                    )
+                    self.logger_service.info(
+                        "User soft-deleted successfully: %s (ID: %s)",
+                        username,
+                        user_id,
+                    )
+                    return True
+                self.logger_service.warning(
+                    "User not found for soft delete with ID: %s", user_id
+                )
+                return False
+        except Exception as e:
+            self.logger_service.error(
+                "Error soft deleting user %s: %s", user_id, e, exc_info=True
+            )
+            raise
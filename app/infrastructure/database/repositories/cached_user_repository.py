@@ -0,0 +1,267 @@
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from injector import inject
+
+from app.domain.entities.users import (
+    BulkCreateUserResult,
+    UserCreate,
+    UserInDBBase,
+    UserUpdate,
+)
+from app.domain.value_objects.cursor import UserCursor, UserSearchCursor
+from app.infrastructure.database.repositories.async_user_repository import (
+    AsyncSQLAlchemyUserRepository,
+)
+from app.infrastructure.database.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+    in_request_order,
+)
+from app.ports.cache import UserCachePort
+from app.ports.repositories import AsyncUserRepository, UserRepository
+from app.ports.transactional.transaction_context import reads_from_replica
+from app.ports.transactional.transactionable import Transactionable
+
+
+def split_cached(
+    user_cache: UserCachePort, user_ids: List[UUID]
+) -> Tuple[List[UserInDBBase], List[UUID]]:
+    """
+    Splits `user_ids` into the users already cached and the ids to fetch.
+    """
+    hits, misses = [], []
+    for user_id in dict.fromkeys(user_ids):
+        user = user_cache.get_by_id(user_id)
+        if user is not None:
+            hits.append(user)
+        else:
+            misses.append(user_id)
+    return hits, misses
+
+
+class CachedUserRepository(UserRepository, Transactionable):
+    """
+    Read-through cache in front of SQLAlchemyUserRepository for single-user
+    lookups. Writes are delegated untouched; use cases invalidate entries
+    once their transaction commits. The cache stamp is taken before each
+    read, so a row invalidated while it was being read is not cached. Rows
+    read from a replica are returned but not cached either: a lagging
+    replica could put back a row that an update has just invalidated.
+    """
+
+    @inject
+    def __init__(self, repository: SQLAlchemyUserRepository, user_cache: UserCachePort):
+        self.repository = repository
+        self.user_cache = user_cache
+
+    def _remember(
+        self, user: Optional[UserInDBBase], stamp: int
+    ) -> Optional[UserInDBBase]:
+        if user is not None and not reads_from_replica():
+            self.user_cache.put(user, stamp)
+        return user
+
+    def get_by_id(self, user_id: UUID) -> Optional[UserInDBBase]:
+        stamp = self.user_cache.stamp()
+        return self.user_cache.get_by_id(user_id) or self._remember(
+            self.repository.get_by_id(user_id), stamp
+        )
+
+    def get_version(self, user_id: UUID) -> Optional[datetime]:
+        cached = self.user_cache.get_by_id(user_id)
+        if cached is not None:
+            return cached.updated_at
+        return self.repository.get_version(user_id)
+
+    def get_stored_version(self, user_id: UUID) -> Optional[datetime]:
+        return self.repository.get_version(user_id)
+
+    def get_password_hash(self, user_id: UUID) -> Optional[str]:
+        # Always read from the database: a cached hash may predate a rehash.
+        return self.repository.get_password_hash(user_id)
+
+    def get_many_by_ids(self, user_ids: List[UUID]) -> List[UserInDBBase]:
+        stamp = self.user_cache.stamp()
+        users, misses = split_cached(self.user_cache, user_ids)
+        if misses:
+            users += (
+                self._remember(user, stamp)
+                for user in self.repository.get_many_by_ids(misses)
+            )
+        return in_request_order(users, user_ids)
+
+    def get_by_username(self, username: str) -> Optional[UserInDBBase]:
+        stamp = self.user_cache.stamp()
+        return self.user_cache.get_by_username(username) or self._remember(
+            self.repository.get_by_username(username), stamp
+        )
+
+    def get_by_email(self, email: str) -> Optional[UserInDBBase]:
+        stamp = self.user_cache.stamp()
+        return self.user_cache.get_by_email(email) or self._remember(
+            self.repository.get_by_email(email), stamp
+        )
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active: Optional[bool] = True,
+        include_deleted: Optional[bool] = False,
+        cursor: Optional[UserCursor] = None,
+    ) -> List[UserInDBBase]:
+        return self.repository.get_all(
+            skip=skip,
+            limit=limit,
+            active=active,
+            include_deleted=include_deleted,
+            cursor=cursor,
+        )
+
+    def search(
+        self, query: str, limit: int = 20, cursor: Optional[UserSearchCursor] = None
+    ) -> List[Tuple[UserInDBBase, int]]:
+        return self.repository.search(query, limit=limit, cursor=cursor)
+
+    def stream_all(
+        self,
+        active: Optional[bool] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        return self.repository.stream_all(
+            active=active,
+            created_from=created_from,
+            created_to=created_to,
+            batch_size=batch_size,
+        )
+
+    def add(self, user_data: UserCreate, hashed_password: str) -> UserInDBBase:
+        return self.repository.add(user_data, hashed_password)
+
+    def add_many(
+        self, users_data: List[UserCreate], hashed_passwords: List[str]
+    ) -> List[BulkCreateUserResult]:
+        return self.repository.add_many(users_data, hashed_passwords)
+
+    def update(
+        self,
+        user_id: UUID,
+        user_data: UserUpdate,
+        hashed_password: Optional[str] = None,
+        expected_versions: Optional[List[datetime]] = None,
+    ) -> Optional[UserInDBBase]:
+        return self.repository.update(
+            user_id=user_id,
+            user_data=user_data,
+            hashed_password=hashed_password,
+            expected_versions=expected_versions,
+        )
+
+    def replace_password_hash(
+        self, user_id: UUID, current_hash: str, new_hash: str
+    ) -> bool:
+        return self.repository.replace_password_hash(user_id, current_hash, new_hash)
+
+    def delete(self, user_id: UUID) -> bool:
+        return self.repository.delete(user_id)
+
+
+class AsyncCachedUserRepository(AsyncUserRepository, Transactionable):
+    """
+    Async counterpart of CachedUserRepository.
+    """
+
+    @inject
+    def __init__(
+        self, repository: AsyncSQLAlchemyUserRepository, user_cache: UserCachePort
+    ):
+        self.repository = repository
+        self.user_cache = user_cache
+
+    def _remember(
+        self, user: Optional[UserInDBBase], stamp: int
+    ) -> Optional[UserInDBBase]:
+        if user is not None and not reads_from_replica():
+            self.user_cache.put(user, stamp)
+        return user
+
+    async def get_by_id(self, user_id: UUID) -> Optional[UserInDBBase]:
+        stamp = self.user_cache.stamp()
+        return self.user_cache.get_by_id(user_id) or self._remember(
+            await self.repository.get_by_id(user_id), stamp
+        )
+
+    async def get_version(self, user_id: UUID) -> Optional[datetime]:
+        cached = self.user_cache.get_by_id(user_id)
+        if cached is not None:
+            return cached.updated_at
+        return await self.repository.get_version(user_id)
+
+    async def get_stored_version(self, user_id: UUID) -> Optional[datetime]:
+        return await self.repository.get_version(user_id)
+
+    async def get_many_by_ids(self, user_ids: List[UUID]) -> List[UserInDBBase]:
+        stamp = self.user_cache.stamp()
+        users, misses = split_cached(self.user_cache, user_ids)
+        if misses:
+            users += (
+                self._remember(user, stamp)
+                for user in await self.repository.get_many_by_ids(misses)
+            )
+        return in_request_order(users, user_ids)
+
+    async def get_by_username(self, username: str) -> Optional[UserInDBBase]:
+        stamp = self.user_cache.stamp()
+        return self.user_cache.get_by_username(username) or self._remember(
+            await self.repository.get_by_username(username), stamp
+        )
+
+    async def get_by_email(self, email: str) -> Optional[UserInDBBase]:
+        stamp = self.user_cache.stamp()
+        return self.user_cache.get_by_email(email) or self._remember(
+            await self.repository.get_by_email(email), stamp
+        )
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active: Optional[bool] = True,
+        include_deleted: Optional[bool] = False,
+        cursor: Optional[UserCursor] = None,
+    ) -> List[UserInDBBase]:
+        return await self.repository.get_all(
+            skip=skip,
+            limit=limit,
+            active=active,
+            include_deleted=include_deleted,
+            cursor=cursor,
+        )
+
+    async def search(
+        self, query: str, limit: int = 20, cursor: Optional[UserSearchCursor] = None
+    ) -> List[Tuple[UserInDBBase, int]]:
+        return await self.repository.search(query, limit=limit, cursor=cursor)
+
+    async def add(self, user_data: UserCreate, hashed_password: str) -> UserInDBBase:
+        return await self.repository.add(user_data, hashed_password)
+
+    async def update(
+        self,
+        user_id: UUID,
+        user_data: UserUpdate,
+        hashed_password: Optional[str] = None,
+        expected_versions: Optional[List[datetime]] = None,
+    ) -> Optional[UserInDBBase]:
+        return await self.repository.update(
+            user_id=user_id,
+            user_data=user_data,
+            hashed_password=hashed_password,
+            expected_versions=expected_versions,
+        )
+
+    async def delete(self, user_id: UUID) -> bool:
+        return await self.repository.delete(user_id)
@@ -1,17 +1,45 @@
 from app.ports.repositories import UserRepository
 from app.ports.logging import LoggerServicePort
+from app.ports.metrics import instrumented
+from app.ports.tracing import traced_methods
 from app.ports.transactional.transaction_executor import TransactionExecutor
 from app.ports.transactional.transactionable import Transactionable
 from app.domain.entities.users import (
+    BulkCreateStatus,
+    BulkCreateUserResult,
+    USER_EXPORT_FIELDS,
     UserCreate,
     UserUpdate,
     UserInDBBase,
 )
-from uuid import UUID
-from app.infrastructure.database.models import UserModel
+from uuid import UUID, uuid4
+from app.domain.entities.events import (
+    UserEvent,
+    UserEventType,
+    user_changed_event,
+    user_deleted_event,
+)
+from app.infrastructure.database.models import (
+    SEARCH_COLUMNS,
+    USER_COLUMNS,
+    UserEventModel,
+    UserModel,
+    event_to_row,
+    row_to_user,
+)
+from app.domain.value_objects.cursor import UserCursor, UserSearchCursor
+from app.domain.value_objects.search import (
+    EXACT_MATCH,
+    IDENTIFIER_PREFIX,
+    NAME_PREFIX,
+    SUBSTRING,
+    search_terms,
+)
 from datetime import datetime, timezone
-from typing import Optional, List, TypeVar
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Tuple, TypeVar
 from injector import inject
+from sqlalchemy import and_, case, func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
 from app.domain.exceptions import (
     EmailAlreadyExistsError,
     UserNotFoundError,
@@ -20,7 +48,152 @@ from app.domain.exceptions import (
 
 Session = TypeVar("Session")
 
+INSERT_ON_CONFLICT_DO_NOTHING = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def insert_user_events_statement(events: List[UserEvent]):
+    """
+    Outbox INSERT for `events`. Run in the session of the change they describe,
+    so the change and its events commit or roll back together.
+    """
+    return insert(UserEventModel.__table__).values(
+        [event_to_row(event) for event in events]
+    )
+
+
+def update_active_user_statement(
+    user_id: UUID,
+    user_data: UserUpdate,
+    hashed_password: Optional[str] = None,
+    expected_versions: Optional[List[datetime]] = None,
+):
+    """
+    UPDATE ... RETURNING on the active row, so an update is a single round
+    trip instead of a SELECT followed by a flush. With `expected_versions`
+    the row is only updated while its `updated_at` is one of them, which makes
+    the If-Match check and the write atomic.
+    """
+    values = user_data.model_dump(exclude_unset=True)
+    values.pop("password", None)
+    if hashed_password:
+        values["hashed_password"] = hashed_password
+    statement = update(UserModel.__table__).where(
+        UserModel.id == user_id, UserModel.deleted_at.is_(None)
+    )
+    if expected_versions is not None:
+        statement = statement.where(UserModel.updated_at.in_(expected_versions))
+    return statement.values(**values).returning(*UserModel.__table__.c)
+
+
+def select_active_user_version_statement(user_id: UUID):
+    return select(UserModel.updated_at).where(
+        UserModel.id == user_id, UserModel.deleted_at.is_(None)
+    )
+
+
+def select_active_user_password_hash_statement(user_id: UUID):
+    return select(UserModel.hashed_password).where(
+        UserModel.id == user_id, UserModel.deleted_at.is_(None)
+    )
+
+
+def replace_password_hash_statement(user_id: UUID, current_hash: str, new_hash: str):
+    """
+    Compare-and-set on the stored hash, so a rehash never overwrites a hash
+    changed meanwhile. `updated_at` is kept: the user's representation, and
+    so its ETag, does not change.
+    """
+    return (
+        update(UserModel.__table__)
+        .where(
+            UserModel.id == user_id,
+            UserModel.deleted_at.is_(None),
+            UserModel.hashed_password == current_hash,
+        )
+        .values(hashed_password=new_hash, updated_at=UserModel.updated_at)
+    )
+
+
+def select_active_users_by_ids_statement(user_ids: List[UUID]):
+    return select(*USER_COLUMNS).where(
+        UserModel.id.in_(user_ids), UserModel.deleted_at.is_(None)
+    )
+
+
+def in_request_order(
+    users: Iterable[UserInDBBase], user_ids: List[UUID]
+) -> List[UserInDBBase]:
+    """
+    Orders `users` like `user_ids`, dropping repeated ids and ids not found.
+    """
+    by_id = {user.id: user for user in users}
+    return [by_id[user_id] for user_id in dict.fromkeys(user_ids) if user_id in by_id]
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _contains(columns, pattern: str):
+    return or_(*(column.ilike(pattern, escape="\\") for column in columns))
+
+
+def _term_relevance(term: str):
+    """
+    SQL counterpart of `term_relevance`: the tier of `term` for each row.
+    """
+    escaped = _escape_like(term)
+    identifiers = (UserModel.username, UserModel.email)
+    names = (UserModel.first_name, UserModel.last_name)
+    return case(
+        (or_(*(func.lower(column) == term for column in identifiers)), EXACT_MATCH),
+        (_contains(identifiers, f"{escaped}%"), IDENTIFIER_PREFIX),
+        (_contains(names, f"{escaped}%"), NAME_PREFIX),
+        (_contains(SEARCH_COLUMNS, f"%{escaped}%"), SUBSTRING),
+        else_=0,
+    )
+
 
+def search_users_statement(
+    query: str, limit: int, cursor: Optional[UserSearchCursor] = None
+):
+    """
+    Active users matching every term of `query` in any searchable column,
+    most relevant first, with their relevance as a `rank` column. The ILIKE
+    filters are what the trigram indexes serve; relevance is only computed
+    for the rows they return.
+    """
+    terms = search_terms(query)
+    ranks = [_term_relevance(term) for term in terms]
+    rank = sum(ranks[1:], ranks[0])
+    statement = select(*USER_COLUMNS, rank.label("rank")).where(
+        UserModel.deleted_at.is_(None),
+        *(_contains(SEARCH_COLUMNS, f"%{_escape_like(term)}%") for term in terms),
+    )
+    if cursor is not None:
+        statement = statement.where(
+            or_(
+                rank < cursor.rank,
+                and_(rank == cursor.rank, UserModel.username > cursor.username),
+            )
+        )
+    return statement.order_by(rank.desc(), UserModel.username).limit(limit)
+
+
+def soft_delete_active_user_statement(user_id: UUID):
+    return (
+        update(UserModel.__table__)
+        .where(UserModel.id == user_id, UserModel.deleted_at.is_(None))
+        .values(deleted_at=datetime.now(timezone.utc), active=False)
+        .returning(UserModel.username)
+    )
+
+
+@traced_methods
+@instrumented
 class SQLAlchemyUserRepository(UserRepository, Transactionable):
     """
     SQLAlchemy implementation of the UserRepository.
@@ -35,34 +208,82 @@ class SQLAlchemyUserRepository(UserRepository, Transactionable):
         self.logger_service = logger_service
         self.db_handler = TransactionExecutor(logger_service)
 
-    def _get_active_user_by_id(self, db: Session, user_id: UUID) -> Optional[UserModel]:
-        """Helper to get an active (not soft-deleted) user by ID."""
-        return (
-            db.query(UserModel)
-            .filter(UserModel.id == user_id, UserModel.deleted_at == None)
-            .first()
-        )
-
     def get_by_id(self, user_id: UUID) -> Optional[UserInDBBase]:
-        self.logger_service.info(f"Attempting to get user by ID: {user_id}")
+        self.logger_service.debug("Attempting to get user by ID: %s", user_id)
         try:
             with self.db_handler.get_session() as db:
-                db_user = self._get_active_user_by_id(db, user_id)
-                if db_user:
-                    self.logger_service.info(f"User found with ID: {user_id}")
-                    return db_user.to_pydantic()
+                row = (
+                    db.execute(
+                        select(*USER_COLUMNS).where(
+                            UserModel.id == user_id, UserModel.deleted_at.is_(None)
+                        )
+                    )
+                    .mappings()
+                    .first()
+                )
+                if row:
+                    self.logger_service.debug("User found with ID: %s", user_id)
+                    return row_to_user(row)
                 self.logger_service.warning(
-                    f"User not found or soft-deleted with ID: {user_id}"
+                    "User not found or soft-deleted with ID: %s", user_id
                 )
                 return None
         except Exception as e:
             self.logger_service.error(
-                f"Error getting user by ID {user_id}: {e}", exc_info=True
+                "Error getting user by ID %s: %s", user_id, e, exc_info=True
+            )
+            return None
+
+    def get_version(self, user_id: UUID) -> Optional[datetime]:
+        self.logger_service.debug("Attempting to get version of user ID: %s", user_id)
+        try:
+            with self.db_handler.get_session() as db:
+                return db.execute(
+                    select_active_user_version_statement(user_id)
+                ).scalar()
+        except Exception as e:
+            self.logger_service.error(
+                "Error getting version of user %s: %s", user_id, e, exc_info=True
             )
             return None
 
+    def get_stored_version(self, user_id: UUID) -> Optional[datetime]:
+        return self.get_version(user_id)
+
+    def get_password_hash(self, user_id: UUID) -> Optional[str]:
+        self.logger_service.debug(
+            "Attempting to get password hash of user ID: %s", user_id
+        )
+        try:
+            with self.db_handler.get_session() as db:
+                return db.execute(
+                    select_active_user_password_hash_statement(user_id)
+                ).scalar()
+        except Exception as e:
+            self.logger_service.error(
+                "Error getting password hash of user %s: %s", user_id, e, exc_info=True
+            )
+            return None
+
+    def get_many_by_ids(self, user_ids: List[UUID]) -> List[UserInDBBase]:
+        self.logger_service.debug("Attempting to get %s users by ID", len(user_ids))
+        if not user_ids:
+            return []
+        try:
+            with self.db_handler.get_session() as db:
+                rows = (
+                    db.execute(select_active_users_by_ids_statement(user_ids))
+                    .mappings()
+                    .all()
+                )
+                self.logger_service.debug("Retrieved %s users.", len(rows))
+                return in_request_order(map(row_to_user, rows), user_ids)
+        except Exception as e:
+            self.logger_service.error("Error getting users by ID: %s", e, exc_info=True)
+            return []
+
     def get_by_username(self, username: str) -> Optional[UserInDBBase]:
-        self.logger_service.info(f"Attempting to get user by username: {username}")
+        self.logger_service.debug("Attempting to get user by username: %s", username)
         try:
             with self.db_handler.get_session() as db:
                 db_user = (
@@ -73,20 +294,20 @@ class SQLAlchemyUserRepository(UserRepository, Transactionable):
                     .first()
                 )
                 if db_user:
-                    self.logger_service.info(f"User found with username: {username}")
+                    self.logger_service.debug("User found with username: %s", username)
                     return db_user.to_pydantic()
                 self.logger_service.warning(
-                    f"User not found or soft-deleted with username: {username}"
+                    "User not found or soft-deleted with username: %s", username
                 )
                 return None
         except Exception as e:
             self.logger_service.error(
-                f"Error getting user by username {username}: {e}", exc_info=True
+                "Error getting user by username %s: %s", username, e, exc_info=True
             )
             return None
 
     def get_by_email(self, email: str) -> Optional[UserInDBBase]:
-        self.logger_service.info(f"Attempting to get user by email: {email}")
+        self.logger_service.debug("Attempting to get user by email: %s", email)
         try:
             with self.db_handler.get_session() as db:
                 db_user = (
@@ -95,15 +316,15 @@ class SQLAlchemyUserRepository(UserRepository, Transactionable):
                     .first()
                 )
                 if db_user:
-                    self.logger_service.info(f"User found with email: {email}")
+                    self.logger_service.debug("User found with email: %s", email)
                     return db_user.to_pydantic()
                 self.logger_service.warning(
-                    f"User not found or soft-deleted with email: {email}"
+                    "User not found or soft-deleted with email: %s", email
                 )
                 return None
         except Exception as e:
             self.logger_service.error(
-                f"Error getting user by email {email}: {e}", exc_info=True
+                "Error getting user by email %s: %s", email, e, exc_info=True
             )
             return None
 
@@ -113,31 +334,92 @@ class SQLAlchemyUserRepository(UserRepository, Transactionable):
         limit: int = 100,
         active: bool = True,
         include_deleted: bool = False,
+        cursor: Optional[UserCursor] = None,
     ) -> List[UserInDBBase]:
-        self.logger_service.info(
-            f"Attempting to get all users (skip={skip}, limit={limit}, active={active}, include_deleted={include_deleted})"
+        self.logger_service.debug(
+            "Attempting to get all users (skip=%s, limit=%s, active=%s, include_deleted=%s, cursor=%s)",
+            skip,
+            limit,
+            active,
+            include_deleted,
+            cursor,
         )
         try:
             with self.db_handler.get_session() as db:
-                query = db.query(UserModel)
-                query = query.filter(UserModel.active == active)
+                query = select(*USER_COLUMNS).where(UserModel.active == active)
                 if not include_deleted:
-                    query = query.filter(UserModel.deleted_at == None)
+                    query = query.where(UserModel.deleted_at.is_(None))
 
-                db_users = (
-                    query.order_by(UserModel.created_at.desc())
-                    .offset(skip)
-                    .limit(limit)
+                query = query.order_by(UserModel.created_at.desc(), UserModel.id.desc())
+                if cursor is not None:
+                    query = query.where(
+                        tuple_(UserModel.created_at, UserModel.id)
+                        < tuple_(cursor.created_at, cursor.id)
+                    )
+                else:
+                    query = query.offset(skip)
+
+                rows = db.execute(query.limit(limit)).mappings().all()
+                self.logger_service.debug("Retrieved %s users.", len(rows))
+                return [row_to_user(row) for row in rows]
+        except Exception as e:
+            self.logger_service.error("Error getting all users: %s", e, exc_info=True)
+            return []
+
+    def search(
+        self, query: str, limit: int = 20, cursor: Optional[UserSearchCursor] = None
+    ) -> List[Tuple[UserInDBBase, int]]:
+        self.logger_service.debug(
+            "Searching users (query=%s, limit=%s, cursor=%s)", query, limit, cursor
+        )
+        try:
+            with self.db_handler.get_session() as db:
+                rows = (
+                    db.execute(search_users_statement(query, limit, cursor))
+                    .mappings()
                     .all()
                 )
-                self.logger_service.info(f"Retrieved {len(db_users)} users.")
-                return [user.to_pydantic() for user in db_users]
+                self.logger_service.debug("Found %s users.", len(rows))
+                return [(row_to_user(row), row["rank"]) for row in rows]
         except Exception as e:
-            self.logger_service.error(f"Error getting all users: {e}", exc_info=True)
+            self.logger_service.error("Error searching users: %s", e, exc_info=True)
             return []
 
+    def stream_all(
+        self,
+        active: Optional[bool] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        self.logger_service.debug(
+            "Streaming users (active=%s, created_from=%s, created_to=%s, batch_size=%s)",
+            active,
+            created_from,
+            created_to,
+            batch_size,
+        )
+        columns = [UserModel.__table__.c[name] for name in USER_EXPORT_FIELDS]
+        query = select(*columns).where(UserModel.deleted_at == None)
+        if active is not None:
+            query = query.where(UserModel.active == active)
+        if created_from is not None:
+            query = query.where(UserModel.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(UserModel.created_at < created_to)
+        query = query.order_by(UserModel.created_at, UserModel.id)
+
+        with self.db_handler.get_session() as db:
+            result = db.execute(query.execution_options(yield_per=batch_size))
+            count = 0
+            for partition in result.mappings().partitions():
+                for row in partition:
+                    yield row
+                count += len(partition)
+            self.logger_service.info("Streamed %s users.", count)
+
     def add(self, user_data: UserCreate, hashed_password_str: str) -> UserInDBBase:
-        self.logger_service.info(f"Attempting to add new user: {user_data.username}")
+        self.logger_service.debug("Attempting to add new user: %s", user_data.username)
         db_user = UserModel(
             username=user_data.username,
             email=user_data.email,
@@ -151,87 +433,248 @@ class SQLAlchemyUserRepository(UserRepository, Transactionable):
             with self.db_handler.get_session() as db:
                 db.add(db_user)
                 db.flush()
+                user = db_user.to_pydantic()
+                db.execute(
+                    insert_user_events_statement(
+                        [user_changed_event(UserEventType.CREATED, user)]
+                    )
+                )
                 self.logger_service.info(
-                    f"User added successfully: {db_user.username} (ID: {db_user.id})"
+                    "User added successfully: %s (ID: %s)", db_user.username, db_user.id
                 )
-                return db_user.to_pydantic()
+                return user
         except Exception as e:
             self.logger_service.error(
-                f"Error adding user {user_data.username}: {e}", exc_info=True
+                "Error adding user %s: %s", user_data.username, e, exc_info=True
             )
             if "ix_users_email" in str(e.orig):
-                self.logger_service.warning(f"Email already exists: {user_data.email}")
+                self.logger_service.warning("Email already exists: %s", user_data.email)
                 raise EmailAlreadyExistsError("Email already exists")
             elif "ix_users_username" in str(e.orig):
                 self.logger_service.warning(
-                    f"Username already exists: {user_data.username}"
+                    "Username already exists: %s", user_data.username
                 )
                 raise InvalidCredentialsError("Username already exists")
             raise e
 
+    def add_many(
+        self, users_data: List[UserCreate], hashed_passwords: List[str]
+    ) -> List[BulkCreateUserResult]:
+        self.logger_service.debug("Attempting to add %s users in bulk", len(users_data))
+        results: Dict[int, BulkCreateUserResult] = {}
+        emails = {user.email for user in users_data}
+        usernames = {user.username for user in users_data}
+        try:
+            with self.db_handler.get_session() as db:
+                existing = db.execute(
+                    select(UserModel.email, UserModel.username).where(
+                        or_(
+                            UserModel.email.in_(emails),
+                            UserModel.username.in_(usernames),
+                        )
+                    )
+                ).all()
+                taken_emails = {row.email for row in existing}
+                taken_usernames = {row.username for row in existing}
+
+                now = datetime.now(timezone.utc)
+                pending: Dict[str, tuple] = {}
+                for index, (user_data, hashed_password) in enumerate(
+                    zip(users_data, hashed_passwords)
+                ):
+                    if user_data.email in taken_emails:
+                        detail = "Email already exists"
+                    elif user_data.username in taken_usernames:
+                        detail = "Username already exists"
+                    else:
+                        detail = None
+
+                    if detail:
+                        results[index] = BulkCreateUserResult(
+                            index=index, status=BulkCreateStatus.CONFLICT, detail=detail
+                        )
+                        continue
+
+                    taken_emails.add(user_data.email)
+                    taken_usernames.add(user_data.username)
+                    pending[user_data.email] = (
+                        index,
+                        {
+                            "id": uuid4(),
+                            "username": user_data.username,
+                            "email": user_data.email,
+                            "first_name": user_data.first_name,
+                            "last_name": user_data.last_name,
+                            "role": user_data.role,
+                            "hashed_password": hashed_password,
+                            "active": (
+                                user_data.active
+                                if user_data.active is not None
+                                else True
+                            ),
+                            "created_at": now,
+                            "updated_at": now,
+                        },
+                    )
+
+                inserted_count = 0
+                if pending:
+                    dialect_insert = INSERT_ON_CONFLICT_DO_NOTHING.get(
+                        db.get_bind().dialect.name
+                    )
+                    statement = (
+                        dialect_insert(UserModel).on_conflict_do_nothing()
+                        if dialect_insert
+                        else insert(UserModel)
+                    )
+                    inserted_emails = db.scalars(
+                        statement.values(
+                            [row for _, row in pending.values()]
+                        ).returning(UserModel.email)
+                    ).all()
+                    inserted_count = len(inserted_emails)
+                    for email in inserted_emails:
+                        index, row = pending.pop(email)
+                        results[index] = BulkCreateUserResult(
+                            index=index,
+                            status=BulkCreateStatus.CREATED,
+                            user=UserInDBBase(**row),
+                        )
+                    if inserted_emails:
+                        db.execute(
+                            insert_user_events_statement(
+                                [
+                                    user_changed_event(
+                                        UserEventType.CREATED, result.user
+                                    )
+                                    for result in results.values()
+                                    if result.status == BulkCreateStatus.CREATED
+                                ]
+                            )
+                        )
+
+                # Rows skipped by ON CONFLICT were inserted concurrently by another request.
+                for index, _ in pending.values():
+                    results[index] = BulkCreateUserResult(
+                        index=index,
+                        status=BulkCreateStatus.CONFLICT,
+                        detail="Email or username already exists",
+                    )
+
+                self.logger_service.info(
+                    "Bulk insert finished: %s created, %s conflicts",
+                    inserted_count,
+                    len(users_data) - inserted_count,
+                )
+                return [results[index] for index in range(len(users_data))]
+        except Exception as e:
+            self.logger_service.error(
+                "Error adding users in bulk: %s", e, exc_info=True
+            )
+            raise
+
     def update(
         self,
         user_id: UUID,
         user_data: UserUpdate,
-        new_hashed_password_str: Optional[str] = None,
+        hashed_password: Optional[str] = None,
+        expected_versions: Optional[List[datetime]] = None,
     ) -> Optional[UserInDBBase]:
-        self.logger_service.info(f"Attempting to update user ID: {user_id}")
+        self.logger_service.debug("Attempting to update user ID: %s", user_id)
         try:
             with self.db_handler.get_session() as db:
-                db_user = self._get_active_user_by_id(db, user_id)
-                if not db_user:
+                row = (
+                    db.execute(
+                        update_active_user_statement(
+                            user_id, user_data, hashed_password, expected_versions
+                        )
+                    )
+                    .mappings()
+                    .first()
+                )
+                if row is None:
                     self.logger_service.warning(
-                        f"User not found or soft-deleted for update with ID: {user_id}"
+                        "User not found or soft-deleted for update with ID: %s", user_id
                     )
                     return None
 
-                update_data = user_data.model_dump(exclude_unset=True)
-                for key, value in update_data.items():
-                    if key == "password":
-                        continue
-                    setattr(db_user, key, value)
-
-                if new_hashed_password_str:
-                    db_user.hashed_password = new_hashed_password_str
-
-                db.add(db_user)
-                db.flush()
+                user = row_to_user(row)
+                db.execute(
+                    insert_user_events_statement(
+                        [user_changed_event(UserEventType.UPDATED, user)]
+                    )
+                )
                 self.logger_service.info(
-                    f"User updated successfully: {db_user.username} (ID: {user_id})"
+                    "User updated successfully: %s (ID: %s)", row["username"], user_id
+                )
+                return user
+        except Exception as e:
+            self.logger_service.error(
+                "Error updating user %s: %s", user_id, e, exc_info=True
+            )
+            raise
+
+    def replace_password_hash(
+        self, user_id: UUID, current_hash: str, new_hash: str
+    ) -> bool:
+        self.logger_service.debug(
+            "Attempting to rehash password of user ID: %s", user_id
+        )
+        try:
+            with self.db_handler.get_session() as db:
+                replaced = (
+                    db.execute(
+                        replace_password_hash_statement(user_id, current_hash, new_hash)
+                    ).rowcount
+                    == 1
                 )
-                return db_user.to_pydantic()
+                if replaced:
+                    self.logger_service.info(
+                        "Password rehashed for user ID: %s", user_id
+                    )
+                else:
+                    self.logger_service.warning(
+                        "Password of user %s changed before its rehash was stored",
+                        user_id,
+                    )
+                return replaced
         except Exception as e:
             self.logger_service.error(
-                f"Error updating user {user_id}: {e}", exc_info=True
+                "Error rehashing password of user %s: %s", user_id, e, exc_info=True
             )
             raise
 
     def delete(self, user_id: UUID) -> bool:
-        self.logger_service.info(f"Attempting to soft delete user ID: {user_id}")
+        self.logger_service.debug("Attempting to soft delete user ID: %s", user_id)
         try:
             with self.db_handler.get_session() as db:
-                db_user = self._get_active_user_by_id(db, user_id)
-                if db_user:
-                    db_user.deleted_at = datetime.now(timezone.utc)
-                    db_user.active = False
-                    db.add(db_user)
-                    db.flush()
+                username = db.execute(
+                    soft_delete_active_user_statement(user_id)
+                ).scalar()
+                if username is not None:
+                    db.execute(
+                        insert_user_events_statement(
+                            [user_deleted_event(user_id, username)]
+                        )
+                    )
                     self.logger_service.info(
-                        f"User soft-deleted successfully: {db_user.username} (ID: {user_id})"
+                        "User soft-deleted successfully: %s (ID: %s)",
+                        username,
+                        user_id,
                     )
                     return True
                 self.logger_service.warning(
-                    f"User not found for soft delete with ID: {user_id}"
+                    "User not found for soft delete with ID: %s", user_id
                 )
                 return False
         except Exception as e:
             self.logger_service.error(
-                f"Error soft deleting user {user_id}: {e}", exc_info=True
+                "Error soft deleting user %s: %s", user_id, e, exc_info=True
             )
-            return False
+            raise
 
     def hard_delete(self, user_id: UUID) -> bool:
-        self.logger_service.info(f"Attempting to HARD delete user ID: {user_id}")
+        self.logger_service.debug("Attempting to HARD delete user ID: %s", user_id)
         try:
             with self.db_handler.get_session() as db:
                 db_user = db.query(UserModel).filter(UserModel.id == user_id).first()
@@ -239,15 +682,17 @@ class SQLAlchemyUserRepository(UserRepository, Transactionable):
                     db.delete(db_user)
                     db.flush()
                     self.logger_service.info(
-                        f"User hard-deleted successfully: {db_user.username} (ID: {user_id})"
+                        "User hard-deleted successfully: %s (ID: %s)",
+                        db_user.username,
+                        user_id,
                     )
                     return True
                 self.logger_service.warning(
-                    f"User not found for hard delete with ID: {user_id}"
+                    "User not found for hard delete with ID: %s", user_id
                 )
                 return False
         except Exception as e:
             self.logger_service.error(
-                f"Error hard deleting user {user_id}: {e}", exc_info=True
+                "Error hard deleting user %s: %s", user_id, e, exc_info=True
             )
             return False
@@ -0,0 +1,96 @@
+import threading
+from typing import Optional
+
+from sqlalchemy import Engine, delete, select
+
+from app.infrastructure.database.models import UserEventModel, row_to_event
+from app.ports.events import EventSinkPort
+from app.ports.logging import LoggerServicePort
+from app.ports.tracing import span
+
+
+class OutboxDispatcher:
+    """
+    Delivers the user events outbox to an EventSinkPort from a background
+    thread, so requests only pay for one INSERT and never wait for consumers.
+
+    Each pass reads up to `batch_size` events in outbox order, publishes them
+    and deletes them in the same transaction: if the sink fails, the batch
+    stays in the outbox and is retried after `poll_interval`. On PostgreSQL
+    the rows are claimed with FOR UPDATE SKIP LOCKED, so the dispatchers of
+    every server worker share the outbox without delivering a batch twice.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        sink: EventSinkPort,
+        logger_service: LoggerServicePort,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+    ):
+        self.engine = engine
+        self.sink = sink
+        self.logger_service = logger_service
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def dispatch_once(self) -> int:
+        """
+        Delivers one batch and returns how many events it held.
+        """
+        table = UserEventModel.__table__
+        with self.engine.begin() as connection:
+            rows = (
+                connection.execute(
+                    select(table)
+                    .order_by(table.c.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                .mappings()
+                .all()
+            )
+            if not rows:
+                return 0
+            with span("OutboxDispatcher.publish", **{"outbox.batch_size": len(rows)}):
+                self.sink.publish([row_to_event(row) for row in rows])
+            connection.execute(
+                delete(table).where(table.c.id.in_([row["id"] for row in rows]))
+            )
+        self.logger_service.debug("Dispatched %s user events", len(rows))
+        return len(rows)
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                dispatched = self.dispatch_once()
+            except Exception as e:
+                self.logger_service.error(
+                    "Error dispatching user events: %s", e, exc_info=True
+                )
+                dispatched = 0
+            # A full batch means there is a backlog: keep draining.
+            if dispatched < self.batch_size:
+                self._stopped.wait(self.poll_interval)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="outbox-dispatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops after the batch in progress, if any. Undelivered events stay in
+        the outbox for the next start.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,40 @@
+import os
+import queue
+import threading
+from typing import List
+
+from app.domain.entities.events import UserEvent
+from app.ports.events import EventSinkPort
+
+
+class FileEventSink(EventSinkPort):
+    """
+    Appends each event as one JSON line to a local file, a stand-in for a
+    message broker that downstream jobs can tail.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def publish(self, events: List[UserEvent]) -> None:
+        lines = "".join(event.model_dump_json() + "\n" for event in events)
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(lines)
+            file.flush()
+            # The batch is deleted from the outbox right after this returns.
+            os.fsync(file.fileno())
+
+
+class InMemoryEventSink(EventSinkPort):
+    """
+    Puts delivered events on an in-process queue, for tests and local
+    inspection.
+    """
+
+    def __init__(self):
+        self.events: "queue.Queue[UserEvent]" = queue.Queue()
+
+    def publish(self, events: List[UserEvent]) -> None:
+        for event in events:
+            self.events.put(event)
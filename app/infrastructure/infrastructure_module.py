@@ -1,22 +1,46 @@
 from injector import Module, inject, singleton
+from sqlalchemy import Engine
+from app.config.environment import get_environment_variables
 from app.ports.repositories import (
+    AsyncUserRepository,
     UserRepository,
 )
 from app.ports.logging import LoggerServicePort
+from app.ports.metrics import MetricsPort, NoopMetrics
+from app.ports.tracing import NoopSpanExporter, SpanExporterPort
+from app.ports.cache import CacheServicePort, UserCachePort
+from app.ports.events import EventSinkPort, NoopEventSink
 
 from app.ports.services.hasher_service_port import (
+    AsyncHasherServicePort,
+    BulkHasherServicePort,
     HasherServicePort,
+    PasswordRehashPort,
     VerifyDataServicePort,
 )
 
 from app.infrastructure.database.repositories.user_repository import (
     SQLAlchemyUserRepository,
 )
-from app.infrastructure.logging import (
-    ConsoleLoggerService,
+from app.infrastructure.database.repositories.async_user_repository import (
+    AsyncSQLAlchemyUserRepository,
 )
+from app.infrastructure.database.repositories.cached_user_repository import (
+    AsyncCachedUserRepository,
+    CachedUserRepository,
+)
+from app.infrastructure.events.outbox_dispatcher import OutboxDispatcher
+from app.infrastructure.events.sinks import FileEventSink, InMemoryEventSink
+from app.infrastructure.logging import QueueLoggerService
+from app.infrastructure.metrics import (
+    MultiprocessMetricsService,
+    PrometheusMetricsService,
+)
+from app.infrastructure.tracing import InMemorySpanExporter, LoggingSpanExporter
 
 from app.infrastructure.security.passlib_data_hasher import (
+    PasslibAsyncDataHasher,
+    PasslibBulkDataHasher,
     PasslibDataHasher,
 )
 
@@ -24,6 +48,89 @@ from app.infrastructure.security.passlib_data_verifier import (
     PasslibDataVerifier,
 )
 
+from app.infrastructure.security.hashing_executor import HashingExecutor
+from app.infrastructure.security.password_rehasher import BackgroundPasswordRehasher
+from app.infrastructure.cache.invalidation_board import InvalidationBoard
+from app.infrastructure.cache.lru_cache import LRUTTLCache
+from app.infrastructure.cache.user_cache import UserCache
+
+
+def get_hashing_executor() -> HashingExecutor:
+    env = get_environment_variables()
+    return HashingExecutor(
+        max_workers=env.HASHING_POOL_SIZE,
+        max_queue_depth=env.HASHING_MAX_QUEUE_DEPTH,
+    )
+
+
+def get_logger_service() -> LoggerServicePort:
+    env = get_environment_variables()
+    return QueueLoggerService(
+        level=env.LOG_LEVEL,
+        info_sample_rate=env.LOG_INFO_SAMPLE_RATE,
+    )
+
+
+def get_metrics_service() -> MetricsPort:
+    env = get_environment_variables()
+    if not env.METRICS_ENABLED:
+        return NoopMetrics()
+    if env.METRICS_MULTIPROCESS_DIR:
+        return MultiprocessMetricsService(env.METRICS_MULTIPROCESS_DIR)
+    return PrometheusMetricsService()
+
+
+@inject
+def get_span_exporter(logger: LoggerServicePort) -> SpanExporterPort:
+    exporter = get_environment_variables().TRACING_EXPORTER.lower()
+    if exporter == "memory":
+        return InMemorySpanExporter()
+    if exporter == "log":
+        return LoggingSpanExporter(logger)
+    return NoopSpanExporter()
+
+
+OUTBOX_SINKS = ("none", "file", "memory")
+
+
+def get_event_sink() -> EventSinkPort:
+    env = get_environment_variables()
+    sink = env.OUTBOX_SINK.lower()
+    if sink not in OUTBOX_SINKS:
+        raise ValueError(
+            f"Unknown OUTBOX_SINK {env.OUTBOX_SINK!r}, "
+            f"expected one of {', '.join(OUTBOX_SINKS)}"
+        )
+    if sink == "file":
+        return FileEventSink(env.OUTBOX_FILE_PATH)
+    if sink == "memory":
+        return InMemoryEventSink()
+    return NoopEventSink()
+
+
+@inject
+def get_outbox_dispatcher(
+    engine: Engine, sink: EventSinkPort, logger: LoggerServicePort
+) -> OutboxDispatcher:
+    env = get_environment_variables()
+    return OutboxDispatcher(
+        engine,
+        sink,
+        logger,
+        batch_size=env.OUTBOX_BATCH_SIZE,
+        poll_interval=env.OUTBOX_POLL_INTERVAL_SECONDS,
+    )
+
+
+@inject
+def get_cache_service(board: InvalidationBoard) -> CacheServicePort:
+    env = get_environment_variables()
+    return LRUTTLCache(
+        max_size=env.USER_CACHE_MAX_SIZE,
+        ttl_seconds=env.USER_CACHE_TTL_SECONDS,
+        board=board,
+    )
+
 
 class InfrastructureModule(Module):
     def __init__(self, *arg, exclude_classes=None, **kwargs):
@@ -33,13 +140,38 @@ class InfrastructureModule(Module):
     def configure(self, binder):
         super().configure(binder)
 
+        # Commands keep their params on the instance, so each resolution gets
+        # its own object; they are cheap since their collaborators are shared.
         bindings = [
-            (UserRepository, SQLAlchemyUserRepository),
-            (LoggerServicePort, ConsoleLoggerService),
             (HasherServicePort, PasslibDataHasher),
+            (AsyncHasherServicePort, PasslibAsyncDataHasher),
+            (BulkHasherServicePort, PasslibBulkDataHasher),
             (VerifyDataServicePort, PasslibDataVerifier),
         ]
 
         for interface, implementation in bindings:
             if interface not in self.exclude_classes:
                 binder.bind(interface, to=implementation)
+
+        # Stateless services are built once per process. Repositories read the
+        # session from the transaction context, not from their attributes.
+        singletons = [
+            (SQLAlchemyUserRepository, SQLAlchemyUserRepository),
+            (AsyncSQLAlchemyUserRepository, AsyncSQLAlchemyUserRepository),
+            (UserRepository, CachedUserRepository),
+            (AsyncUserRepository, AsyncCachedUserRepository),
+            (UserCachePort, UserCache),
+            (HashingExecutor, get_hashing_executor),
+            (PasswordRehashPort, BackgroundPasswordRehasher),
+            (InvalidationBoard, InvalidationBoard),
+            (CacheServicePort, get_cache_service),
+            (LoggerServicePort, get_logger_service),
+            (MetricsPort, get_metrics_service),
+            (SpanExporterPort, get_span_exporter),
+            (EventSinkPort, get_event_sink),
+            (OutboxDispatcher, get_outbox_dispatcher),
+        ]
+
+        for interface, implementation in singletons:
+            if interface not in self.exclude_classes:
+                binder.bind(interface, to=implementation, scope=singleton)
@@ -1,29 +1,177 @@
-from app.ports.logging import LoggerServicePort
+import atexit
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import traceback
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Dict, Optional, TextIO
+
+from app.ports.logging import LoggerServicePort
 
 
 class ConsoleLoggerService(LoggerServicePort):
-    def info(self, message: str):
+    def debug(self, message: str, *args):
+        """
+        Debug messages are not written to the console.
+        """
+        pass
+
+    def info(self, message: str, *args):
         """
         Logs an informational message to the console.
         """
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        print(f"{timestamp} - INFO: {message}")
+        print(f"{timestamp} - INFO: {message % args if args else message}")
 
-    def error(self, message: str, exc_info: bool = False):
+    def error(self, message: str, *args, exc_info: bool = False):
         """
         Logs an error message to the console.
         """
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        print(f"{timestamp} - ERROR: {message}")
+        print(f"{timestamp} - ERROR: {message % args if args else message}")
         if exc_info:
-            import traceback
-
             print(traceback.format_exc())
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """
         Logs a warning message to the console.
         """
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        print(f"{timestamp} - WARNING: {message}")
+        print(f"{timestamp} - WARNING: {message % args if args else message}")
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Renders each record as a single JSON line.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    The stock QueueHandler formats the message before enqueuing it so records
+    can cross process boundaries. The queue here is in-process, so the record
+    is passed untouched and all formatting happens on the writer thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class QueueLoggerService(LoggerServicePort):
+    """
+    LoggerServicePort backed by the standard logging module. Callers only pay
+    for the level check and for enqueuing the record; formatting and writing
+    happen on a background QueueListener thread. INFO records are sampled
+    with `info_sample_rate` (1.0 keeps all of them), except those logged with
+    `info_unsampled`.
+    """
+
+    def __init__(
+        self,
+        name: str = "app",
+        level: str = "INFO",
+        info_sample_rate: float = 1.0,
+        stream: Optional[TextIO] = None,
+    ):
+        self.info_sample_rate = info_sample_rate
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(level.upper())
+        self.logger.propagate = False
+
+        self.writer = logging.StreamHandler(stream or sys.stdout)
+        self.writer.setFormatter(JsonFormatter())
+        # Handlers live on the shared logger: the service that installed the
+        # current ones is stopped, flushing its records, before they change.
+        with _services_lock:
+            replaced = _services.get(name)
+            _services[name] = self
+        if replaced is not None:
+            replaced.shutdown()
+        self._start_listener()
+
+    def _start_listener(self) -> None:
+        queue = SimpleQueue()
+        self.logger.handlers = [DeferredQueueHandler(queue)]
+        self.listener = QueueListener(queue, self.writer, respect_handler_level=True)
+        self.listener.start()
+        self._running = True
+
+    def _restart_after_fork(self) -> None:
+        # The writer thread does not survive fork(). A forked server worker
+        # gets a fresh queue and thread; records still queued belong to the
+        # parent, which writes them.
+        if self._running:
+            self._start_listener()
+
+    def _sampled_out(self) -> bool:
+        return self.info_sample_rate < 1.0 and random.random() >= self.info_sample_rate
+
+    def debug(self, message: str, *args):
+        self.logger.debug(message, *args)
+
+    def info(self, message: str, *args):
+        if self.logger.isEnabledFor(logging.INFO) and not self._sampled_out():
+            self.logger.info(message, *args)
+
+    def info_unsampled(self, message: str, *args):
+        self.logger.info(message, *args)
+
+    def error(self, message: str, *args, exc_info: bool = False):
+        self.logger.error(message, *args, exc_info=exc_info)
+
+    def warning(self, message: str, *args):
+        self.logger.warning(message, *args)
+
+    def shutdown(self) -> None:
+        """
+        Flushes pending records and stops the writer thread.
+        """
+        if self._running:
+            self._running = False
+            self.listener.stop()
+        with _services_lock:
+            if _services.get(self.logger.name) is self:
+                del _services[self.logger.name]
+
+
+# The running service of each logger name. The exit and fork hooks below go
+# through it, so they are registered once however many services are built.
+_services: Dict[str, QueueLoggerService] = {}
+_services_lock = threading.Lock()
+
+
+def _shutdown_services() -> None:
+    for service in list(_services.values()):
+        service.shutdown()
+
+
+def _restart_services_after_fork() -> None:
+    global _services_lock
+    # The lock may have been held by another parent thread at fork time.
+    _services_lock = threading.Lock()
+    for service in list(_services.values()):
+        service._restart_after_fork()
+
+
+atexit.register(_shutdown_services)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_services_after_fork)
@@ -0,0 +1,354 @@
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from app.ports.metrics import HISTOGRAMS, GaugeReader, MetricsPort
+
+# Upper bounds in seconds, from sub-millisecond lookups to slow password hashes.
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+LabelSet = Tuple[Tuple[str, str], ...]
+GaugeSamples = List[Tuple[Dict[str, str], float]]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class Histogram:
+    """
+    Cumulative histogram keyed by label set. Counts are stored per bucket and
+    accumulated when rendered, so an observation is a bisect and an increment.
+    """
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float]):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self._series: Dict[LabelSet, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, labels: Dict[str, str]) -> None:
+        key = tuple(sorted(labels.items()))
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # One counter per bucket, one for +Inf, then the sum.
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += seconds
+
+    def snapshot(self) -> Dict[LabelSet, List[float]]:
+        with self._lock:
+            return {key: list(series) for key, series in self._series.items()}
+
+    def render(self) -> List[str]:
+        return render_histogram(
+            self.name, self.description, self.buckets, self.snapshot()
+        )
+
+
+def render_histogram(
+    name: str,
+    description: str,
+    buckets: Sequence[float],
+    snapshot: Dict[LabelSet, List[float]],
+) -> List[str]:
+    lines = [
+        f"# HELP {name} {description}",
+        f"# TYPE {name} histogram",
+    ]
+    for key, series in sorted(snapshot.items()):
+        cumulative = 0
+        for bound, count in zip(tuple(buckets) + (float("inf"),), series):
+            cumulative += count
+            labels = _format_labels(key + (("le", _format_value(bound)),))
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(key)} {series[-1]!r}")
+        lines.append(f"{name}_count{_format_labels(key)} {cumulative}")
+    return lines
+
+
+def render_gauge(name: str, description: str, samples: GaugeSamples) -> List[str]:
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} gauge"]
+    for labels, value in samples:
+        key = tuple(sorted(labels.items()))
+        lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+    return lines
+
+
+class PrometheusMetricsService(MetricsPort):
+    """
+    In-process MetricsPort rendered in the Prometheus text exposition format.
+    Histograms are created on first observation; gauges are read on render.
+    """
+
+    enabled = True
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms: Dict[str, Histogram] = {}
+        self._gauges: Dict[str, Tuple[str, List[GaugeReader]]] = {}
+        self._lock = threading.Lock()
+
+    def _histogram(self, name: str) -> Histogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    name, Histogram(name, HISTOGRAMS.get(name, name), self.buckets)
+                )
+        return histogram
+
+    def observe(self, name: str, seconds: float, labels: Dict[str, str]) -> None:
+        self._histogram(name).observe(seconds, labels)
+
+    def add_gauge(self, name: str, description: str, read: GaugeReader) -> None:
+        with self._lock:
+            self._gauges.setdefault(name, (description, []))[1].append(read)
+
+    def gauge_samples(self) -> Dict[str, Tuple[str, GaugeSamples]]:
+        """
+        Reads every gauge now, keyed by name, with its description.
+        """
+        with self._lock:
+            gauges = dict(self._gauges)
+        samples = {}
+        for name, (description, readers) in gauges.items():
+            samples[name] = (description, [item for read in readers for item in read()])
+        return samples
+
+    def render(self) -> str:
+        lines = []
+        for name in sorted(self._histograms):
+            lines += self._histograms[name].render()
+        for name, (description, samples) in sorted(self.gauge_samples().items()):
+            lines += render_gauge(name, description, samples)
+        return "\n".join(lines) + "\n"
+
+
+class MultiprocessMetricsService(PrometheusMetricsService):
+    """
+    PrometheusMetricsService for the workers forked by app.serve, which share
+    one listening socket, so any of them may answer a scrape. Each worker
+    writes its histograms and gauges to `directory` every `flush_interval`
+    seconds and when it exits. A scrape renders the sum of every worker's
+    histograms, and each running worker's gauges under a `worker` label.
+    Histograms of exited workers are folded into an archive file, so totals
+    do not drop when workers are recycled.
+    """
+
+    ARCHIVE = "archive"
+
+    def __init__(
+        self,
+        directory: str,
+        flush_interval: float = 1.0,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(buckets)
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._flusher = None
+        _multiprocess_services.add(self)
+
+    def observe(self, name: str, seconds: float, labels: Dict[str, str]) -> None:
+        if self._flusher is None:
+            self._start_flusher()
+        super().observe(name, seconds, labels)
+
+    def _start_flusher(self) -> None:
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name="metrics-flush", daemon=True
+            )
+            self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                # Retried on the next tick; a scrape flushes on its own too.
+                pass
+
+    def _after_fork(self) -> None:
+        # Observations made before the fork belong to the parent, and its
+        # flusher thread does not exist in the child.
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._flusher = None
+
+    def _path(self, name) -> str:
+        return os.path.join(self.directory, f"metrics-{name}.json")
+
+    def flush(self) -> None:
+        """
+        Writes this worker's histograms and gauges to its file.
+        """
+        snapshot = {
+            "histograms": _serialize_histograms(
+                {name: h.snapshot() for name, h in list(self._histograms.items())}
+            ),
+            "gauges": self.gauge_samples(),
+        }
+        _write_json(self._path(os.getpid()), snapshot)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        import fcntl
+
+        with open(os.path.join(self.directory, "metrics.lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _snapshots(self) -> Dict[str, dict]:
+        snapshots = {}
+        for entry in os.listdir(self.directory):
+            if entry.startswith("metrics-") and entry.endswith(".json"):
+                with open(os.path.join(self.directory, entry)) as file:
+                    snapshots[entry[len("metrics-") : -len(".json")]] = json.load(file)
+        return snapshots
+
+    def _archive_exited(self, snapshots: Dict[str, dict]) -> None:
+        exited = [
+            worker
+            for worker in snapshots
+            if worker != self.ARCHIVE and not _is_running(int(worker))
+        ]
+        if not exited:
+            return
+        archive = snapshots.setdefault(self.ARCHIVE, {"histograms": {}, "gauges": {}})
+        archive["histograms"] = _serialize_histograms(
+            _merge_histograms([archive] + [snapshots[worker] for worker in exited])
+        )
+        _write_json(self._path(self.ARCHIVE), archive)
+        for worker in exited:
+            del snapshots[worker]
+            os.remove(self._path(worker))
+
+    def render(self) -> str:
+        with self._exclusive():
+            self.flush()
+            snapshots = self._snapshots()
+            self._archive_exited(snapshots)
+
+        lines = []
+        for name, series in sorted(_merge_histograms(snapshots.values()).items()):
+            lines += render_histogram(
+                name, HISTOGRAMS.get(name, name), self.buckets, series
+            )
+        gauges: Dict[str, Tuple[str, GaugeSamples]] = {}
+        for worker, snapshot in sorted(snapshots.items()):
+            for name, (description, samples) in snapshot["gauges"].items():
+                gauges.setdefault(name, (description, []))[1].extend(
+                    ({**labels, "worker": worker}, value) for labels, value in samples
+                )
+        for name, (description, samples) in sorted(gauges.items()):
+            lines += render_gauge(name, description, samples)
+        return "\n".join(lines) + "\n"
+
+
+def _serialize_histograms(histograms: Dict[str, Dict[LabelSet, List[float]]]) -> dict:
+    return {
+        name: [[list(key), series] for key, series in series_by_key.items()]
+        for name, series_by_key in histograms.items()
+    }
+
+
+def _merge_histograms(snapshots) -> Dict[str, Dict[LabelSet, List[float]]]:
+    """
+    Sums the histograms of serialized snapshots, series by series.
+    """
+    merged: Dict[str, Dict[LabelSet, List[float]]] = {}
+    for snapshot in snapshots:
+        for name, entries in snapshot["histograms"].items():
+            target = merged.setdefault(name, {})
+            for key, series in entries:
+                key = tuple(tuple(pair) for pair in key)
+                if key in target:
+                    target[key] = [a + b for a, b in zip(target[key], series)]
+                else:
+                    target[key] = list(series)
+    return merged
+
+
+def _write_json(path: str, data) -> None:
+    # Written aside and renamed, so readers never see a partial file.
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporary, "w") as file:
+        json.dump(data, file)
+    os.replace(temporary, path)
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+_multiprocess_services: "weakref.WeakSet[MultiprocessMetricsService]" = (
+    weakref.WeakSet()
+)
+
+
+def _after_fork_in_child() -> None:
+    for service in list(_multiprocess_services):
+        service._after_fork()
+
+
+def _flush_at_exit() -> None:
+    for service in list(_multiprocess_services):
+        if service._flusher is not None:
+            service.flush()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+atexit.register(_flush_at_exit)
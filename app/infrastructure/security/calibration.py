@@ -0,0 +1,57 @@
+import statistics
+from time import perf_counter
+from typing import Callable, Dict, NamedTuple
+
+from passlib.hash import bcrypt
+
+# Por debajo de este coste bcrypt deja de ser una defensa razonable, aunque
+# el host sea lento.
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+
+SAMPLE_DATA = "calibration-sample-password"
+
+
+class CalibrationResult(NamedTuple):
+    rounds: int
+    timings_ms: Dict[int, float]
+    target_ms: float
+
+    @property
+    def meets_target(self) -> bool:
+        return self.timings_ms[self.rounds] <= self.target_ms
+
+
+def measure_bcrypt_ms(rounds: int, samples: int = 3) -> float:
+    """
+    Mide la mediana, en milisegundos, de `samples` hashes bcrypt con `rounds`.
+    """
+    handler = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        started = perf_counter()
+        handler.hash(SAMPLE_DATA)
+        timings.append((perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = MIN_BCRYPT_ROUNDS,
+    max_rounds: int = MAX_BCRYPT_ROUNDS,
+    measure: Callable[[int], float] = measure_bcrypt_ms,
+) -> CalibrationResult:
+    """
+    Elige el mayor número de rondas cuyo hash tarda como mucho `target_ms` en
+    este host. Cada ronda duplica el coste, así que se mide de menor a mayor y
+    se detiene en la primera que supera el objetivo: la calibración cuesta
+    alrededor de dos veces el objetivo por muestra. Nunca baja de `min_rounds`.
+    """
+    timings: Dict[int, float] = {}
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        timings[rounds] = measure(rounds)
+        if timings[rounds] > target_ms:
+            break
+        chosen = rounds
+    return CalibrationResult(chosen, timings, target_ms)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from passlib.context import CryptContext
 from typing import Optional, Any
 
@@ -16,3 +18,13 @@ def initialize_crypt_context(config: Optional[dict[str, Any]] = None) -> CryptCo
         return pwd_context
     except Exception as e:
         raise RuntimeError(f"No se pudo inicializar CryptContext: {e}")
+
+
+@lru_cache
+def get_crypt_context() -> CryptContext:
+    """
+    CryptContext compartido con la configuración por defecto. CryptContext es
+    seguro entre hilos para hash/verify, así que se construye una sola vez por
+    proceso en lugar de una vez por instancia.
+    """
+    return initialize_crypt_context()
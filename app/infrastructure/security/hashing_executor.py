@@ -0,0 +1,231 @@
+import os
+import threading
+from concurrent.futures import Future, InvalidStateError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+from typing import Any, List, Optional, Tuple
+
+from app.domain.exceptions import ServiceOverloadedError
+from app.ports.metrics import HASHING_SECONDS, get_metrics
+from app.ports.tracing import (
+    Span,
+    SpanContext,
+    current_span,
+    get_span_exporter,
+    tracing_enabled,
+)
+from app.infrastructure.security.crypt_constext import initialize_crypt_context
+
+_worker_context = None
+
+
+def _initialize_worker(crypt_settings: Optional[dict[str, Any]]) -> None:
+    """
+    Inicializa el CryptContext una sola vez por proceso del pool.
+    """
+    global _worker_context
+    _worker_context = initialize_crypt_context(crypt_settings)
+
+
+def _hash_in_worker(data_to_hash: str) -> str:
+    return _worker_context.hash(data_to_hash)
+
+
+def _hash_many_in_worker(data_to_hash: List[str]) -> List[str]:
+    return [_worker_context.hash(data) for data in data_to_hash]
+
+
+def _verify_in_worker(payload: Tuple[str, str]) -> Tuple[bool, bool]:
+    plain_data, hashed_data = payload
+    try:
+        is_valid = _worker_context.verify(plain_data, hashed_data)
+    except (ValueError, TypeError):
+        # Hash con formato inválido: se trata como una verificación fallida.
+        return False, False
+    return is_valid, is_valid and _worker_context.needs_update(hashed_data)
+
+
+def _traced_in_worker(fn, traceparent: str, operation: str, payload):
+    """
+    Ejecuta `fn` en el worker dentro de un span hijo del `traceparent` recibido
+    y lo retorna junto al resultado, ya que el exportador vive en el proceso
+    principal.
+    """
+    worker_span = Span(
+        f"hashing.{operation}",
+        SpanContext.from_traceparent(traceparent),
+        {"process.pid": os.getpid()},
+    )
+    result = fn(payload)
+    worker_span.end()
+    return result, worker_span
+
+
+def _export_worker_span(traced: Future) -> Future:
+    """
+    Retorna un Future con solo el resultado de `traced` y exporta el span del
+    worker cuando termina. Cancelar el Future retornado cancela `traced`.
+    """
+    future = Future()
+
+    def relay(done: Future) -> None:
+        try:
+            if done.cancelled():
+                future.cancel()
+            elif done.exception() is not None:
+                future.set_exception(done.exception())
+            else:
+                result, worker_span = done.result()
+                get_span_exporter().export(worker_span)
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    traced.add_done_callback(relay)
+    future.add_done_callback(lambda done: done.cancelled() and traced.cancel())
+    return future
+
+
+class HashingExecutor:
+    """
+    Ejecuta el hashing de datos en un pool de procesos acotado, fuera del hilo
+    de la petición. Limita el número de trabajos en vuelo (en ejecución más en
+    cola) y rechaza los nuevos con ServiceOverloadedError cuando se alcanza el
+    límite, en lugar de acumular latencia sin control.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_depth: int = 64,
+        crypt_settings: Optional[dict[str, Any]] = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue_depth = max_queue_depth
+        self.crypt_settings = crypt_settings
+        self._slots = threading.BoundedSemaphore(max_queue_depth)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        initializer=_initialize_worker,
+                        initargs=(self.crypt_settings,),
+                    )
+        return self._pool
+
+    def _submit(self, fn, payload, operation: str) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise ServiceOverloadedError(
+                "El servicio de hashing está saturado, inténtalo más tarde."
+            )
+        parent = current_span() if tracing_enabled() else None
+        try:
+            if parent is None:
+                future = self._get_pool().submit(fn, payload)
+            else:
+                future = self._get_pool().submit(
+                    _traced_in_worker, fn, parent.traceparent, operation, payload
+                )
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        if get_metrics().enabled:
+            self._observe(future, operation)
+        if parent is not None:
+            return _export_worker_span(future)
+        return future
+
+    @staticmethod
+    def _observe(future: Future, operation: str) -> None:
+        """
+        Registra en HASHING_SECONDS el tiempo desde que el trabajo se encola
+        hasta que termina, así la espera en la cola del pool queda incluida.
+        """
+        started = perf_counter()
+
+        def record(done: Future) -> None:
+            failed = done.cancelled() or done.exception() is not None
+            get_metrics().observe(
+                HASHING_SECONDS,
+                perf_counter() - started,
+                {"operation": operation, "outcome": "error" if failed else "success"},
+            )
+
+        future.add_done_callback(record)
+
+    def _reset_broken_pool(self) -> RuntimeError:
+        with self._pool_lock:
+            self._pool = None
+        return RuntimeError("El pool de hashing dejó de responder.")
+
+    def submit(self, data_to_hash: str) -> Future:
+        """
+        Encola el hashing de `data_to_hash` y retorna un Future con el resultado.
+        Lanza ServiceOverloadedError si la cola está llena.
+        """
+        return self._submit(_hash_in_worker, data_to_hash, "hash")
+
+    def submit_verify(self, plain_data: str, hashed_data: str) -> Future:
+        """
+        Encola la verificación de `plain_data` contra `hashed_data` y retorna
+        un Future con la tupla (is_valid, needs_update).
+        """
+        return self._submit(_verify_in_worker, (plain_data, hashed_data), "verify")
+
+    def hash(self, data_to_hash: str) -> str:
+        """
+        Hashea `data_to_hash` en el pool y espera el resultado.
+        """
+        try:
+            return self.submit(data_to_hash).result()
+        except BrokenProcessPool as e:
+            raise self._reset_broken_pool() from e
+
+    def verify(self, plain_data: str, hashed_data: str) -> Tuple[bool, bool]:
+        """
+        Verifica `plain_data` contra `hashed_data` en el pool y espera el
+        resultado (is_valid, needs_update).
+        """
+        try:
+            return self.submit_verify(plain_data, hashed_data).result()
+        except BrokenProcessPool as e:
+            raise self._reset_broken_pool() from e
+
+    def hash_many(self, data_to_hash: List[str]) -> List[str]:
+        """
+        Hashea un lote repartiéndolo en un bloque por worker, de modo que el lote
+        ocupa como mucho `max_workers` plazas de la cola (y nunca más que
+        `max_queue_depth`) y se procesa en paralelo. Retorna los hashes en el
+        mismo orden que la entrada.
+        """
+        if not data_to_hash:
+            return []
+        chunk_count = max(1, min(self.max_workers, self.max_queue_depth))
+        chunk_size = -(-len(data_to_hash) // chunk_count)
+        chunks = [
+            data_to_hash[start : start + chunk_size]
+            for start in range(0, len(data_to_hash), chunk_size)
+        ]
+        futures = []
+        try:
+            for chunk in chunks:
+                futures.append(self._submit(_hash_many_in_worker, chunk, "hash_many"))
+            return [hashed for future in futures for hashed in future.result()]
+        except ServiceOverloadedError:
+            for future in futures:
+                future.cancel()
+            raise
+        except BrokenProcessPool as e:
+            raise self._reset_broken_pool() from e
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
@@ -1,6 +1,17 @@
-from app.ports.services.hasher_service_port import HasherServicePort
+import asyncio
+from typing import List
+
+from injector import inject
+
+from app.ports.services.hasher_service_port import (
+    AsyncHasherServicePort,
+    BulkHasherServicePort,
+    HasherServicePort,
+)
 from app.config.settings import get_settings
-from app.infrastructure.security.crypt_constext import initialize_crypt_context
+from app.domain.exceptions import ServiceOverloadedError
+from app.infrastructure.security.hashing_executor import HashingExecutor
+from app.ports.tracing import span
 
 
 settings = get_settings()
@@ -10,14 +21,17 @@ class PasslibDataHasher(HasherServicePort):
     """
     Implementación concreta de HasherServicePort que utiliza Passlib (bcrypt por defecto)
     para hashear datos. Sigue el patrón Command.
+    El trabajo de hashing se delega al HashingExecutor para no bloquear el hilo
+    de la petición con CPU.
     """
 
-    def __init__(self):
+    @inject
+    def __init__(self, hashing_executor: HashingExecutor):
         """
         Constructor para PasslibDataHasher.
         """
         super().__init__()
-        self.pwd_context = initialize_crypt_context()
+        self.hashing_executor = hashing_executor
 
     def execute(self) -> str:
         """
@@ -34,9 +48,90 @@ class PasslibDataHasher(HasherServicePort):
             )
 
         try:
-            hashed_value = self.pwd_context.hash(self.params.data_to_hash)
-            return hashed_value
+            with span("PasslibDataHasher.execute"):
+                return self.hashing_executor.hash(self.params.data_to_hash)
+        except ServiceOverloadedError:
+            raise
         except Exception as e:
             raise RuntimeError(
                 "Ocurrió un error interno durante el proceso de hashing."
+            ) from e
+
+
+class PasslibAsyncDataHasher(AsyncHasherServicePort):
+    """
+    Variante asíncrona de PasslibDataHasher: espera el resultado del
+    HashingExecutor sin bloquear el event loop ni ocupar un hilo.
+    """
+
+    @inject
+    def __init__(self, hashing_executor: HashingExecutor):
+        """
+        Constructor para PasslibAsyncDataHasher.
+        """
+        super().__init__()
+        self.hashing_executor = hashing_executor
+
+    async def execute(self) -> str:
+        """
+        Hashea los datos de `self.params.data_to_hash` en el pool de procesos.
+        """
+        if not hasattr(self, "params") or not self.params:
+            raise ValueError(
+                "Parámetros no establecidos para PasslibAsyncDataHasher. Llama a set_params con HashDataSchema primero."
             )
+        if not self.params.data_to_hash:
+            raise ValueError(
+                "No se proporcionaron datos para hashear (data_to_hash no puede estar vacío)."
+            )
+
+        try:
+            with span("PasslibAsyncDataHasher.execute"):
+                future = self.hashing_executor.submit(self.params.data_to_hash)
+                return await asyncio.wrap_future(future)
+        except ServiceOverloadedError:
+            raise
+        except Exception as e:
+            raise RuntimeError(
+                "Ocurrió un error interno durante el proceso de hashing."
+            ) from e
+
+
+class PasslibBulkDataHasher(BulkHasherServicePort):
+    """
+    Hashea un lote completo en el HashingExecutor, repartido entre sus workers.
+    """
+
+    @inject
+    def __init__(self, hashing_executor: HashingExecutor):
+        """
+        Constructor para PasslibBulkDataHasher.
+        """
+        super().__init__()
+        self.hashing_executor = hashing_executor
+
+    def execute(self) -> List[str]:
+        """
+        Hashea los datos de `self.params.data_to_hash` y retorna los hashes en orden.
+        """
+        if not hasattr(self, "params") or not self.params:
+            raise ValueError(
+                "Parámetros no establecidos para PasslibBulkDataHasher. Llama a set_params con BulkHashDataSchema primero."
+            )
+        if any(not data for data in self.params.data_to_hash):
+            raise ValueError(
+                "No se proporcionaron datos para hashear (data_to_hash no puede contener valores vacíos)."
+            )
+
+        try:
+            with span(
+                "PasslibBulkDataHasher.execute",
+                **{"hashing.batch_size": len(self.params.data_to_hash)}
+            ):
+                return self.hashing_executor.hash_many(self.params.data_to_hash)
+        except ServiceOverloadedError:
+            raise
+        except Exception as e:
+            raise RuntimeError(
+                "Ocurrió un error interno durante el proceso de hashing."
+            ) from e
@@ -1,4 +1,8 @@
-from app.infrastructure.security.crypt_constext import initialize_crypt_context
+from injector import inject
+
+from app.domain.exceptions import ServiceOverloadedError
+from app.infrastructure.security.hashing_executor import HashingExecutor
+from app.ports.tracing import span
 from app.ports.services.hasher_service_port import (
     VerifyDataServicePort,
     VerifyResultSchema,
@@ -9,14 +13,17 @@ class PasslibDataVerifier(VerifyDataServicePort):
     """
     Implementación concreta de VerifyDataServicePort que utiliza Passlib para
     verificar datos contra un hash. Sigue el patrón Command.
+    Como el hashing, la verificación se delega al HashingExecutor: cuesta lo
+    mismo que un hash y no debe ocupar el hilo de la petición con CPU.
     """
 
-    def __init__(self):
+    @inject
+    def __init__(self, hashing_executor: HashingExecutor):
         """
         Constructor para PasslibDataVerifier.
         """
         super().__init__()
-        self.pwd_context = initialize_crypt_context()
+        self.hashing_executor = hashing_executor
 
     def execute(self) -> VerifyResultSchema:
         """
@@ -33,11 +40,12 @@ class PasslibDataVerifier(VerifyDataServicePort):
             )
 
         try:
-            is_valid = self.pwd_context.verify(
-                self.params.plain_data, self.params.hashed_data
-            )
-            if is_valid and self.pwd_context.needs_update(self.params.hashed_data):
-                return VerifyResultSchema(is_valid=True, needs_update=True)
-            return VerifyResultSchema(is_valid=is_valid, needs_update=False)
+            with span("PasslibDataVerifier.execute"):
+                is_valid, needs_update = self.hashing_executor.verify(
+                    self.params.plain_data, self.params.hashed_data
+                )
+            return VerifyResultSchema(is_valid=is_valid, needs_update=needs_update)
+        except ServiceOverloadedError:
+            raise
         except Exception as e:
             return VerifyResultSchema(is_valid=False, needs_update=False)
@@ -0,0 +1,67 @@
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
+from uuid import UUID
+
+from injector import ProviderOf, inject
+
+from app.domain.exceptions import ServiceOverloadedError
+from app.infrastructure.security.hashing_executor import HashingExecutor
+from app.ports.logging import LoggerServicePort
+from app.ports.services.hasher_service_port import PasswordRehashPort
+from app.ports.use_cases.users import (
+    RehashUserPasswordUseCase,
+    RehashUserPasswordUseCaseSchema,
+)
+
+
+class BackgroundPasswordRehasher(PasswordRehashPort):
+    """
+    Rehashea contraseñas fuera de la petición. El nuevo hash se calcula en el
+    HashingExecutor y se guarda desde un único hilo propio con el caso de uso
+    RehashUserPassword, que solo lo escribe si el hash no cambió entretanto.
+
+    El rehash es oportunista: si el pool de hashing está saturado o algo
+    falla, se descarta y se volverá a intentar en la próxima verificación.
+    """
+
+    @inject
+    def __init__(
+        self,
+        hashing_executor: HashingExecutor,
+        rehash_use_case: ProviderOf[RehashUserPasswordUseCase],
+        logger_service: LoggerServicePort,
+    ):
+        self.hashing_executor = hashing_executor
+        self.rehash_use_case = rehash_use_case
+        self.logger_service = logger_service
+        # Un solo hilo basta: cada escritura es un UPDATE por clave primaria.
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="password-rehash"
+        )
+        atexit.register(self._writer.shutdown)
+
+    def schedule(self, user_id: UUID, plain_data: str, current_hash: str) -> None:
+        try:
+            future = self.hashing_executor.submit(plain_data)
+        except ServiceOverloadedError:
+            self.logger_service.debug(
+                "Hashing pool saturated, skipping rehash of user ID: %s", user_id
+            )
+            return
+        future.add_done_callback(
+            lambda done: self._writer.submit(self._store, user_id, current_hash, done)
+        )
+
+    def _store(self, user_id: UUID, current_hash: str, hashed: Future) -> None:
+        try:
+            use_case = self.rehash_use_case.get()
+            use_case.set_params(
+                RehashUserPasswordUseCaseSchema(
+                    user_id=user_id, current_hash=current_hash, new_hash=hashed.result()
+                )
+            )
+            use_case.execute()
+        except Exception as e:
+            self.logger_service.error(
+                "Error rehashing password of user %s: %s", user_id, e, exc_info=True
+            )
@@ -0,0 +1,50 @@
+import json
+import threading
+from typing import List
+
+from injector import inject
+
+from app.ports.logging import LoggerServicePort
+from app.ports.tracing import Span, SpanExporterPort
+
+
+class InMemorySpanExporter(SpanExporterPort):
+    """
+    Keeps finished spans in memory, for tests and local inspection.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class LoggingSpanExporter(SpanExporterPort):
+    """
+    Writes each finished span as one JSON log record, so traces can be
+    rebuilt from the logs by trace_id without running a collector. Spans skip
+    INFO sampling: a trace with sampled-out spans cannot be rebuilt.
+    """
+
+    enabled = True
+
+    @inject
+    def __init__(self, logger: LoggerServicePort):
+        self.logger = logger
+
+    def export(self, span: Span) -> None:
+        self.logger.info_unsampled("span %s", json.dumps(span.to_dict(), default=str))
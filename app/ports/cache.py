@@ -0,0 +1,86 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.domain.entities.users import UserInDBBase
+
+
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class CacheServicePort(ABC):
+    """
+    Key/value cache backend (in-process or shared between workers).
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, stamp: Optional[int] = None) -> None:
+        """
+        Stores `value`. With a `stamp` taken by `stamp()` before the value was
+        read from its source, the value is dropped if `key` was deleted since.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        pass
+
+    def stamp(self) -> int:
+        """
+        Returns a token to take before reading a value that will be cached.
+        """
+        return 0
+
+    def is_stale(self, key: str, stamp: int) -> bool:
+        """
+        Returns whether `key` was deleted after `stamp` was taken.
+        """
+        return False
+
+
+class UserCachePort(ABC):
+    """
+    Read-through cache of user records keyed by id, email and username.
+    """
+
+    @abstractmethod
+    def get_by_id(self, user_id: UUID) -> Optional[UserInDBBase]:
+        pass
+
+    @abstractmethod
+    def get_by_email(self, email: str) -> Optional[UserInDBBase]:
+        pass
+
+    @abstractmethod
+    def get_by_username(self, username: str) -> Optional[UserInDBBase]:
+        pass
+
+    @abstractmethod
+    def put(self, user: UserInDBBase, stamp: Optional[int] = None) -> None:
+        pass
+
+    @abstractmethod
+    def stamp(self) -> int:
+        pass
+
+    @abstractmethod
+    def invalidate(self, user_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        pass
@@ -22,3 +22,21 @@ class Command(ABC, Generic[Return, Attributes]):
     def set_params(self, attributes: Attributes) -> None:
         """Sets the parameters for command execution."""
         self.params = attributes
+
+
+class AsyncCommand(ABC, Generic[Return, Attributes]):
+    """
+    Asynchronous counterpart of `Command` for use cases and services that
+    await I/O instead of blocking a worker thread.
+    """
+
+    params: Attributes
+
+    @abstractmethod
+    async def execute(self) -> Return:
+        """Executes the command with the previously set parameters."""
+        pass
+
+    def set_params(self, attributes: Attributes) -> None:
+        """Sets the parameters for command execution."""
+        self.params = attributes
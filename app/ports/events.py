@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.domain.entities.events import UserEvent
+
+
+class EventSinkPort(ABC):
+    """
+    Destination of the user events delivered from the outbox.
+    """
+
+    @abstractmethod
+    def publish(self, events: List[UserEvent]) -> None:
+        """
+        Delivers a batch of events in outbox order. Raising leaves the whole
+        batch in the outbox to be retried, so delivery is at-least-once and
+        consumers must tolerate duplicates (dedupe on `id`).
+        """
+        pass
+
+
+class NoopEventSink(EventSinkPort):
+    def publish(self, events: List[UserEvent]) -> None:
+        pass
@@ -2,14 +2,30 @@ from abc import ABC, abstractmethod
 
 
 class LoggerServicePort(ABC):
+    """
+    Messages use %-style placeholders, formatted with `args` only when the
+    record is actually emitted, e.g. `logger.info("User found: %s", user_id)`.
+    """
+
     @abstractmethod
-    def info(self, message: str):
+    def debug(self, message: str, *args):
         pass
 
     @abstractmethod
-    def error(self, message: str, exc_info: bool = False):
+    def info(self, message: str, *args):
+        pass
+
+    def info_unsampled(self, message: str, *args):
+        """
+        Logs an INFO message that INFO sampling never drops, for records that
+        are only useful complete, such as exported spans.
+        """
+        self.info(message, *args)
+
+    @abstractmethod
+    def error(self, message: str, *args, exc_info: bool = False):
         pass
 
     @abstractmethod
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         pass
@@ -0,0 +1,157 @@
+import inspect
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Tuple
+
+# Histograms recorded by the application, with their help text.
+USE_CASE_SECONDS = "use_case_duration_seconds"
+REPOSITORY_SECONDS = "repository_call_duration_seconds"
+HASHING_SECONDS = "password_hashing_duration_seconds"
+POOL_CHECKOUT_SECONDS = "db_pool_checkout_duration_seconds"
+
+HISTOGRAMS = {
+    USE_CASE_SECONDS: "Time spent in a use case execute(), transaction included.",
+    REPOSITORY_SECONDS: "Time spent in a repository method.",
+    HASHING_SECONDS: "Time to hash or verify a password, pool queueing included.",
+    POOL_CHECKOUT_SECONDS: "Time waiting for a connection from the pool.",
+}
+
+GaugeReader = Callable[[], Iterable[Tuple[Dict[str, str], float]]]
+
+
+class MetricsPort(ABC):
+    """
+    Collects latency histograms and gauges and renders them for scraping.
+    Instrumented code checks `enabled` first, so a disabled implementation
+    costs one attribute read per call.
+    """
+
+    enabled: bool = False
+
+    @abstractmethod
+    def observe(self, name: str, seconds: float, labels: Dict[str, str]) -> None:
+        pass
+
+    @abstractmethod
+    def add_gauge(self, name: str, description: str, read: GaugeReader) -> None:
+        """
+        Registers a gauge whose samples are produced by `read` at render time.
+        """
+        pass
+
+    @abstractmethod
+    def render(self) -> str:
+        pass
+
+
+class NoopMetrics(MetricsPort):
+    def observe(self, name: str, seconds: float, labels: Dict[str, str]) -> None:
+        pass
+
+    def add_gauge(self, name: str, description: str, read: GaugeReader) -> None:
+        pass
+
+    def render(self) -> str:
+        return ""
+
+
+_metrics: MetricsPort = NoopMetrics()
+
+
+def get_metrics() -> MetricsPort:
+    return _metrics
+
+
+def set_metrics(metrics: MetricsPort) -> None:
+    """
+    Installs the process-wide metrics implementation.
+    """
+    global _metrics
+    _metrics = metrics
+
+
+class _Timer:
+    __slots__ = ("name", "labels", "started")
+
+    def __init__(self, name: str, labels: Dict[str, str]):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        labels = {**self.labels, "outcome": "error" if exc_type else "success"}
+        _metrics.observe(self.name, perf_counter() - self.started, labels)
+        return False
+
+
+_NOT_TIMED = nullcontext()
+
+
+def timed(name: str, **labels: str):
+    """
+    Context manager observing its duration in histogram `name`, labelled
+    with `labels` plus the outcome (success or error).
+    """
+    if not _metrics.enabled:
+        return _NOT_TIMED
+    return _Timer(name, labels)
+
+
+def instrument(function: Callable, name: str, **labels: str) -> Callable:
+    """
+    Wraps a function, coroutine function or generator function so each call
+    is observed in histogram `name`. Generators are timed until exhausted.
+    """
+    if inspect.iscoroutinefunction(function):
+
+        @wraps(function)
+        async def instrumented_coroutine(*args, **kwargs):
+            if not _metrics.enabled:
+                return await function(*args, **kwargs)
+            with _Timer(name, labels):
+                return await function(*args, **kwargs)
+
+        return instrumented_coroutine
+
+    if inspect.isgeneratorfunction(function):
+
+        @wraps(function)
+        def instrumented_generator(*args, **kwargs):
+            if not _metrics.enabled:
+                return (yield from function(*args, **kwargs))
+            with _Timer(name, labels):
+                return (yield from function(*args, **kwargs))
+
+        return instrumented_generator
+
+    @wraps(function)
+    def instrumented_function(*args, **kwargs):
+        if not _metrics.enabled:
+            return function(*args, **kwargs)
+        with _Timer(name, labels):
+            return function(*args, **kwargs)
+
+    return instrumented_function
+
+
+def instrumented(cls):
+    """
+    Class decorator timing every public method of a repository in
+    REPOSITORY_SECONDS, labelled with the class and method names.
+    """
+    for attribute, member in list(vars(cls).items()):
+        if attribute.startswith("_") or not inspect.isfunction(member):
+            continue
+        setattr(
+            cls,
+            attribute,
+            instrument(
+                member, REPOSITORY_SECONDS, repository=cls.__name__, method=attribute
+            ),
+        )
+    return cls
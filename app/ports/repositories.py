@@ -1,11 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 from app.domain.entities.users import (
+    BulkCreateUserResult,
     UserCreate,
     UserUpdate,
     UserInDBBase,
 )
+from app.domain.value_objects.cursor import UserCursor, UserSearchCursor
 
 
 class UserRepository(ABC):
@@ -13,6 +16,38 @@ class UserRepository(ABC):
     def get_by_id(self, user_id: UUID) -> Optional[UserInDBBase]:
         pass
 
+    @abstractmethod
+    def get_version(self, user_id: UUID) -> Optional[datetime]:
+        """
+        `updated_at` of the active user, without loading the row: enough to
+        answer conditional requests. None when there is no such user.
+        """
+        pass
+
+    @abstractmethod
+    def get_stored_version(self, user_id: UUID) -> Optional[datetime]:
+        """
+        Like `get_version`, but read from the database even when the user is
+        cached, for decisions a stale cache entry must not sway.
+        """
+        pass
+
+    @abstractmethod
+    def get_password_hash(self, user_id: UUID) -> Optional[str]:
+        """
+        Stored password hash of the active user, read from the database even
+        when the user is cached. None when there is no such user.
+        """
+        pass
+
+    @abstractmethod
+    def get_many_by_ids(self, user_ids: List[UUID]) -> List[UserInDBBase]:
+        """
+        Fetches the active users among `user_ids` in a single query, in the
+        order of `user_ids` and without duplicates. Unknown ids are skipped.
+        """
+        pass
+
     @abstractmethod
     def get_by_username(self, username: str) -> Optional[UserInDBBase]:
         pass
@@ -28,19 +63,134 @@ class UserRepository(ABC):
         limit: int = 100,
         active: Optional[bool] = True,
         include_deleted: Optional[bool] = False,
+        cursor: Optional[UserCursor] = None,
     ) -> List[UserInDBBase]:
         pass
 
+    @abstractmethod
+    def search(
+        self, query: str, limit: int = 20, cursor: Optional[UserSearchCursor] = None
+    ) -> List[Tuple[UserInDBBase, int]]:
+        """
+        Active users matching every term of `query` in username, email, first
+        or last name, paired with their relevance and ordered by relevance
+        then username. `cursor` resumes after the last user of a page.
+        """
+        pass
+
+    @abstractmethod
+    def stream_all(
+        self,
+        active: Optional[bool] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the USER_EXPORT_FIELDS of every non-deleted user as plain rows,
+        fetching `batch_size` rows at a time through a server-side cursor.
+        """
+        pass
+
     @abstractmethod
     def add(self, user_data: UserCreate, hashed_password: str) -> UserInDBBase:
         pass
 
+    @abstractmethod
+    def add_many(
+        self, users_data: List[UserCreate], hashed_passwords: List[str]
+    ) -> List[BulkCreateUserResult]:
+        """
+        Inserts the users in a single statement and reports, per input index,
+        either the created user or the unique constraint it conflicts with.
+        """
+        pass
+
     @abstractmethod
     def update(
-        self, user_id: UUID, user_data: UserUpdate, hashed_password: Optional[str]
+        self,
+        user_id: UUID,
+        user_data: UserUpdate,
+        hashed_password: Optional[str],
+        expected_versions: Optional[List[datetime]] = None,
     ) -> Optional[UserInDBBase]:
+        """
+        Updates the active user. With `expected_versions`, only while its
+        `updated_at` is one of them; otherwise returns None as for a miss.
+        """
+        pass
+
+    @abstractmethod
+    def replace_password_hash(
+        self, user_id: UUID, current_hash: str, new_hash: str
+    ) -> bool:
+        """
+        Stores `new_hash` only while the active user's hash is still
+        `current_hash`. Returns whether it was replaced.
+        """
         pass
 
     @abstractmethod
     def delete(self, user_id: UUID) -> bool:
         pass
+
+
+class AsyncUserRepository(ABC):
+    @abstractmethod
+    async def get_by_id(self, user_id: UUID) -> Optional[UserInDBBase]:
+        pass
+
+    @abstractmethod
+    async def get_version(self, user_id: UUID) -> Optional[datetime]:
+        pass
+
+    @abstractmethod
+    async def get_stored_version(self, user_id: UUID) -> Optional[datetime]:
+        pass
+
+    @abstractmethod
+    async def get_many_by_ids(self, user_ids: List[UUID]) -> List[UserInDBBase]:
+        pass
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> Optional[UserInDBBase]:
+        pass
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[UserInDBBase]:
+        pass
+
+    @abstractmethod
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active: Optional[bool] = True,
+        include_deleted: Optional[bool] = False,
+        cursor: Optional[UserCursor] = None,
+    ) -> List[UserInDBBase]:
+        pass
+
+    @abstractmethod
+    async def search(
+        self, query: str, limit: int = 20, cursor: Optional[UserSearchCursor] = None
+    ) -> List[Tuple[UserInDBBase, int]]:
+        pass
+
+    @abstractmethod
+    async def add(self, user_data: UserCreate, hashed_password: str) -> UserInDBBase:
+        pass
+
+    @abstractmethod
+    async def update(
+        self,
+        user_id: UUID,
+        user_data: UserUpdate,
+        hashed_password: Optional[str],
+        expected_versions: Optional[List[datetime]] = None,
+    ) -> Optional[UserInDBBase]:
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: UUID) -> bool:
+        pass
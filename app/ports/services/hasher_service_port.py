@@ -1,5 +1,8 @@
+from typing import List
+from uuid import UUID
+
 from pydantic import BaseModel
-from app.ports.command import Command
+from app.ports.command import AsyncCommand, Command
 from abc import ABC, abstractmethod
 
 
@@ -11,6 +14,14 @@ class HashDataSchema(BaseModel):
     data_to_hash: str
 
 
+class BulkHashDataSchema(BaseModel):
+    """
+    Define los parámetros para hashear un lote de datos.
+    """
+
+    data_to_hash: List[str]
+
+
 class VerifyDataSchema(BaseModel):
     """
     Define los parámetros para la operación de verificación de hash.
@@ -43,6 +54,33 @@ class HasherServicePort(Command[HashDataSchema, str], ABC):
         pass
 
 
+class AsyncHasherServicePort(AsyncCommand[str, HashDataSchema], ABC):
+    """
+    Puerto (Interfaz) asíncrono para un servicio de hashing.
+    Permite esperar el hash sin bloquear el event loop.
+    """
+
+    @abstractmethod
+    async def execute(self) -> str:
+        """
+        Hashea los datos proporcionados y retorna la cadena hasheada.
+        """
+        pass
+
+
+class BulkHasherServicePort(Command[BulkHashDataSchema, List[str]], ABC):
+    """
+    Puerto (Interfaz) para hashear un lote de datos en paralelo.
+    """
+
+    @abstractmethod
+    def execute(self) -> List[str]:
+        """
+        Hashea cada elemento del lote y retorna los hashes en el mismo orden.
+        """
+        pass
+
+
 class VerifyDataServicePort(Command[VerifyDataSchema, VerifyResultSchema], ABC):
     """
     Puerto (Interfaz) para un servicio de verificación de datos.
@@ -56,3 +94,19 @@ class VerifyDataServicePort(Command[VerifyDataSchema, VerifyResultSchema], ABC):
         Retorna un objeto VerifyResultSchema con el resultado de la verificación.
         """
         pass
+
+
+class PasswordRehashPort(ABC):
+    """
+    Puerto (Interfaz) para rehashear en segundo plano una contraseña cuyo hash
+    usa parámetros obsoletos (`VerifyResultSchema.needs_update`), de modo que
+    un cambio de coste se aplique gradualmente en cada verificación exitosa.
+    """
+
+    @abstractmethod
+    def schedule(self, user_id: UUID, plain_data: str, current_hash: str) -> None:
+        """
+        Programa el rehash sin esperar a que termine. El nuevo hash solo se
+        guarda si el almacenado sigue siendo `current_hash`.
+        """
+        pass
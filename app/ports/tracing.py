@@ -0,0 +1,246 @@
+import inspect
+import os
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class SpanContext:
+    """
+    Identifies a span across boundaries. Serialized as a W3C `traceparent`
+    header so it can travel in HTTP requests and to process pool workers.
+    """
+
+    __slots__ = ("trace_id", "span_id")
+
+    def __init__(self, trace_id: str, span_id: str):
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @classmethod
+    def from_traceparent(cls, header: Optional[str]) -> Optional["SpanContext"]:
+        """
+        Parses a `traceparent` header, returning None when it is missing or
+        malformed so a bad header starts a new trace instead of failing.
+        """
+        if not header:
+            return None
+        parts = header.strip().split("-")
+        if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+            return None
+        trace_id, span_id = parts[1].lower(), parts[2].lower()
+        try:
+            # All-zero ids are invalid per the spec.
+            if not int(trace_id, 16) or not int(span_id, 16):
+                return None
+        except ValueError:
+            return None
+        return cls(trace_id, span_id)
+
+
+class Span(SpanContext):
+    """
+    One timed operation, modelled on the OpenTelemetry span: ids, parent,
+    attributes, epoch nanosecond timestamps and an OK/ERROR status.
+    """
+
+    __slots__ = ("name", "parent_id", "attributes", "start_time", "end_time", "status")
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional[SpanContext] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            parent.trace_id if parent else os.urandom(16).hex(), os.urandom(8).hex()
+        )
+        self.name = name
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = dict(attributes or {})
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+        self.status = "OK"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status = "ERROR"
+        self.attributes["exception.type"] = type(exc).__name__
+
+    def end(self) -> None:
+        if self.end_time is None:
+            self.end_time = time.time_ns()
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_time or time.time_ns()) - self.start_time) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class SpanExporterPort(ABC):
+    """
+    Receives every finished span. Instrumented code checks `enabled` first,
+    so a disabled exporter costs one attribute read per call.
+    """
+
+    enabled: bool = False
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        pass
+
+
+class NoopSpanExporter(SpanExporterPort):
+    def export(self, span: Span) -> None:
+        pass
+
+
+_exporter: SpanExporterPort = NoopSpanExporter()
+_current_span: ContextVar[Optional[SpanContext]] = ContextVar(
+    "current_span", default=None
+)
+
+
+def get_span_exporter() -> SpanExporterPort:
+    return _exporter
+
+
+def set_span_exporter(exporter: SpanExporterPort) -> None:
+    """
+    Installs the process-wide span exporter.
+    """
+    global _exporter
+    _exporter = exporter
+
+
+def tracing_enabled() -> bool:
+    return _exporter.enabled
+
+
+def current_span() -> Optional[SpanContext]:
+    return _current_span.get()
+
+
+@contextmanager
+def span(
+    name: str, parent: Optional[SpanContext] = None, **attributes: Any
+) -> Iterator[Optional[Span]]:
+    """
+    Opens a child of `parent` (the current span by default) for the duration
+    of the block and exports it on exit. Yields None when tracing is off.
+
+    The previous span is restored with `set` rather than a reset token, so a
+    span entered and exited in different contexts (a stream consumed one
+    threadpool call per chunk) does not fail when it closes.
+    """
+    if not _exporter.enabled:
+        yield None
+        return
+    previous = _current_span.get()
+    current = Span(name, parent or previous, attributes)
+    _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.record_exception(exc)
+        raise
+    finally:
+        _current_span.set(previous)
+        current.end()
+        _exporter.export(current)
+
+
+def traced(function: Callable, name: str, **attributes: Any) -> Callable:
+    """
+    Wraps a function, coroutine function or generator function in a span.
+    Generators are traced until exhausted, and the span is made current only
+    around each step, since steps may run in different contexts.
+    """
+    if inspect.iscoroutinefunction(function):
+
+        @wraps(function)
+        async def traced_coroutine(*args, **kwargs):
+            if not _exporter.enabled:
+                return await function(*args, **kwargs)
+            with span(name, **attributes):
+                return await function(*args, **kwargs)
+
+        return traced_coroutine
+
+    if inspect.isgeneratorfunction(function):
+
+        @wraps(function)
+        def traced_generator(*args, **kwargs):
+            if not _exporter.enabled:
+                return (yield from function(*args, **kwargs))
+            current = Span(name, _current_span.get(), attributes)
+            items = function(*args, **kwargs)
+            try:
+                while True:
+                    previous = _current_span.get()
+                    _current_span.set(current)
+                    try:
+                        item = next(items)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        _current_span.set(previous)
+                    yield item
+            except BaseException as exc:
+                if not isinstance(exc, GeneratorExit):
+                    current.record_exception(exc)
+                raise
+            finally:
+                items.close()
+                current.end()
+                _exporter.export(current)
+
+        return traced_generator
+
+    @wraps(function)
+    def traced_function(*args, **kwargs):
+        if not _exporter.enabled:
+            return function(*args, **kwargs)
+        with span(name, **attributes):
+            return function(*args, **kwargs)
+
+    return traced_function
+
+
+def traced_methods(cls):
+    """
+    Class decorator opening a span named `Class.method` around every public
+    method of a repository.
+    """
+    for attribute, member in list(vars(cls).items()):
+        if attribute.startswith("_") or not inspect.isfunction(member):
+            continue
+        setattr(
+            cls,
+            attribute,
+            traced(
+                member, f"{cls.__name__}.{attribute}", **{"code.function": attribute}
+            ),
+        )
+    return cls
@@ -0,0 +1,34 @@
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+_current_session: ContextVar[Optional[Any]] = ContextVar(
+    "current_session", default=None
+)
+
+
+def get_current_session() -> Optional[Any]:
+    """
+    Returns the session of the transaction running in the current context
+    (thread or task), or None outside a transaction.
+    """
+    return _current_session.get()
+
+
+def reads_from_replica() -> bool:
+    """
+    Returns whether the current session reads from a replica, which may lag
+    behind the primary.
+    """
+    info = getattr(get_current_session(), "info", None) or {}
+    return bool(info.get("replica"))
+
+
+def bind_session(session: Any) -> Token:
+    """
+    Makes `session` the current session until the returned token is reset.
+    """
+    return _current_session.set(session)
+
+
+def reset_session(token: Token) -> None:
+    _current_session.reset(token)
@@ -2,6 +2,7 @@ from typing import TypeVar, Generic, Iterator
 from abc import abstractmethod, ABC
 from contextlib import contextmanager
 from app.ports.logging import LoggerServicePort
+from app.ports.transactional.transaction_context import get_current_session
 
 Session = TypeVar("Session")
 
@@ -17,7 +18,13 @@ class TransactionExecutor(Generic[Session]):
 
     @contextmanager
     def get_session(self) -> Iterator[Session]:
-        if not hasattr(self, "session") and self.session is None:
+        """
+        Yields the session bound to the current context by Atom, falling back to
+        one set explicitly with set_transaction_context. Reading it from the
+        context lets a single repository instance serve concurrent requests.
+        """
+        session = get_current_session() or self.session
+        if session is None:
             self.logger.error("Session is not set", exc_info=True)
             raise Exception("Session is not set")
-        yield self.session
+        yield session
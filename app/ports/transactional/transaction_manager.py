@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Iterable, TypeVar
+from typing import AsyncIterator, Generic, Iterable, TypeVar
 
 Session = TypeVar("Session")
 
 
 class TransactionManagerPort(ABC, Generic[Session]):
     @abstractmethod
-    def get_transaction_context(self) -> Iterable[Session]:
+    def get_transaction_context(self, read_only: bool = False) -> Iterable[Session]:
+        """
+        Yields a session for one unit of work. Read-only contexts may be served
+        by a replica and are never committed.
+        """
+        pass
+
+
+class AsyncTransactionManagerPort(ABC, Generic[Session]):
+    @abstractmethod
+    def get_transaction_context(
+        self, read_only: bool = False
+    ) -> AsyncIterator[Session]:
         pass
@@ -1,4 +1,3 @@
-import inspect
 from abc import ABC
 from typing import TypeVar
 
@@ -10,11 +9,16 @@ Session = TypeVar("Session")
 
 
 class Transactionable(ABC, Generic[Session]):
+    """
+    Marks objects that run inside the transaction opened by Atom. They get the
+    session from the transaction context; set_transaction_context only pins a
+    session explicitly for code that runs outside an Atom.
+    """
+
     transactionable_session: Session
 
     def set_transaction_context(self, transaction_context: Session):
         self.session = transaction_context
-        for attr_name, attr_value in inspect.getmembers(self):
-            if not attr_name.startswith("__") and not inspect.ismethod(attr_value):
-                if isinstance(attr_value, (TransactionExecutor, Transactionable)):
-                    attr_value.set_transaction_context(transaction_context)
+        for attr_value in list(vars(self).values()):
+            if isinstance(attr_value, (TransactionExecutor, Transactionable)):
+                attr_value.set_transaction_context(transaction_context)
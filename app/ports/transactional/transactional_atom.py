@@ -1,9 +1,14 @@
 import inspect
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List
 
-from app.ports.transactional.transaction_manager import TransactionManagerPort
-from app.ports.transactional.transactionable import Transactionable
+from app.ports.transactional.transaction_manager import (
+    AsyncTransactionManagerPort,
+    TransactionManagerPort,
+)
+from app.ports.metrics import USE_CASE_SECONDS, instrument
+from app.ports.tracing import traced
+from app.ports.transactional.transaction_context import bind_session, reset_session
 
 
 class NotDefinedTransactionManagerError(Exception):
@@ -21,6 +26,8 @@ class AtomClass(ABC):
 
     Methods:
     - execute() -> None : Execute atom
+    - before_transaction() -> None : Work done before the transaction is opened
+    - after_transaction(result) -> Any : Work done once the transaction is closed
     """
 
     transaction_manager: TransactionManagerPort = None
@@ -31,6 +38,22 @@ class AtomClass(ABC):
     def execute(self) -> None:
         pass
 
+    def before_transaction(self) -> None:
+        """
+        Runs before the transaction is opened, so expensive work that does not
+        need a session (e.g. hashing) does not hold a database connection.
+        """
+        pass
+
+    def after_transaction(self, result: Any) -> Any:
+        """
+        Runs once the transaction is closed and its connection released, with
+        what the transaction returned; its return value is what `execute`
+        returns. Expensive work on data read in the transaction (e.g.
+        verifying a password hash) belongs here.
+        """
+        return result
+
     def after_transaction_execute(self, callback: callable):
         if not hasattr(self, "post_transactions"):
             self.post_transactions = []
@@ -38,10 +61,46 @@ class AtomClass(ABC):
         self.post_transactions.append(callback)
 
 
+class AsyncAtomClass(AtomClass):
+    """
+    Description:
+    Async atom use cases port class
+
+    Methods:
+    - execute() -> None : Await atom
+    - before_transaction() -> None : Awaited before the transaction is opened
+    - after_transaction(result) -> Any : Awaited once the transaction is closed
+    """
+
+    transaction_manager: AsyncTransactionManagerPort = None
+
+    @abstractmethod
+    async def execute(self) -> None:
+        pass
+
+    async def before_transaction(self) -> None:
+        pass
+
+    async def after_transaction(self, result: Any) -> Any:
+        return result
+
+
 class Atom:
     @staticmethod
-    def on_class(cls):
+    def on_class(cls=None, *, read_only: bool = False):
+        """
+        Wraps `execute` in a transaction. Use `@Atom.on_class(read_only=True)`
+        for query use cases: they get a read-only session, possibly from a
+        replica, and nothing is committed.
+        """
+        if cls is None:
+            return lambda cls: Atom.on_class(cls, read_only=read_only)
+
         original_execute = cls.execute
+        if inspect.iscoroutinefunction(original_execute):
+            return Atom._on_async_class(cls, original_execute, read_only)
+        if inspect.isgeneratorfunction(original_execute):
+            return Atom._on_generator_class(cls, original_execute, read_only)
 
         def execute(self) -> None:
             if self.transaction_manager is None:
@@ -49,43 +108,114 @@ class Atom:
                     f"Transaction manager is not set on {self.__class__.__name__}"
                 )
 
+            self.before_transaction()
+
             result = None
-            with self.transaction_manager.get_transaction_context() as session:
-                Atom._set_transaction_context_for_attrs(self, session)
-                result = original_execute(self)
+            with self.transaction_manager.get_transaction_context(
+                read_only=read_only
+            ) as session:
+                token = bind_session(session)
+                try:
+                    result = original_execute(self)
+                finally:
+                    reset_session(token)
 
                 post_transaction = getattr(self, "post_transactions", [])
                 if len(post_transaction) > 0:
-                    session.commit()
+                    if not read_only:
+                        session.commit()
                     for callback in post_transaction:
                         callback()
 
-                Atom._clear_transaction_context_for_attrs(self)
-
             self.post_transactions = []
             self.pre_transactions = []
 
-            return result
+            return self.after_transaction(result)
 
-        cls.execute = execute
+        cls.execute = Atom._observed(cls, execute)
         return cls
 
     @staticmethod
-    def _set_transaction_context_for_attrs(instance, session):
-        for attr_name, attr_value in inspect.getmembers(instance):
-            if Atom._is_transactionable_attr(attr_name, attr_value):
-                attr_value.set_transaction_context(session)
+    def _observed(cls, execute):
+        """
+        Times `execute` in the use case histogram and traces it in a span
+        named after the use case.
+        """
+        timed_execute = instrument(execute, USE_CASE_SECONDS, use_case=cls.__name__)
+        return traced(timed_execute, cls.__name__, **{"use_case": cls.__name__})
 
     @staticmethod
-    def _clear_transaction_context_for_attrs(instance):
-        for attr_name, attr_value in inspect.getmembers(instance):
-            if Atom._is_transactionable_attr(attr_name, attr_value):
-                attr_value.set_transaction_context(None)
+    def _on_async_class(cls, original_execute, read_only):
+        async def execute(self) -> None:
+            if self.transaction_manager is None:
+                raise NotDefinedTransactionManagerError(
+                    f"Transaction manager is not set on {self.__class__.__name__}"
+                )
+
+            await self.before_transaction()
+
+            result = None
+            async with self.transaction_manager.get_transaction_context(
+                read_only=read_only
+            ) as session:
+                token = bind_session(session)
+                try:
+                    result = await original_execute(self)
+                finally:
+                    reset_session(token)
+
+                post_transaction = getattr(self, "post_transactions", [])
+                if len(post_transaction) > 0:
+                    if not read_only:
+                        await session.commit()
+                    for callback in post_transaction:
+                        outcome = callback()
+                        if inspect.isawaitable(outcome):
+                            await outcome
+
+            self.post_transactions = []
+            self.pre_transactions = []
+
+            return await self.after_transaction(result)
+
+        cls.execute = Atom._observed(cls, execute)
+        return cls
 
     @staticmethod
-    def _is_transactionable_attr(attr_name, attr_value):
-        return (
-            not attr_name.startswith("__")
-            and not inspect.ismethod(attr_value)
-            and isinstance(attr_value, Transactionable)
-        )
+    def _on_generator_class(cls, original_execute, read_only):
+        # The transaction is opened on the first item and closed once the
+        # consumer exhausts or discards the stream, so it lives as long as
+        # the stream instead of ending when execute() returns. Each step may
+        # run in a different context (e.g. a threadpool call per chunk), so
+        # the session is bound around every step rather than once.
+        def stream(self):
+            with self.transaction_manager.get_transaction_context(
+                read_only=read_only
+            ) as session:
+                rows = original_execute(self)
+                try:
+                    while True:
+                        token = bind_session(session)
+                        try:
+                            row = next(rows)
+                        except StopIteration:
+                            return
+                        finally:
+                            reset_session(token)
+                        yield row
+                finally:
+                    rows.close()
+
+        timed_stream = Atom._observed(cls, stream)
+
+        def execute(self):
+            if self.transaction_manager is None:
+                raise NotDefinedTransactionManagerError(
+                    f"Transaction manager is not set on {self.__class__.__name__}"
+                )
+
+            self.before_transaction()
+            return timed_stream(self)
+
+        cls.execute = execute
+        return cls
@@ -1,11 +1,15 @@
 from pydantic import BaseModel
 from uuid import UUID
-from typing import Optional
-from app.ports.command import Command
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+from app.ports.command import AsyncCommand, Command
 from app.domain.entities.users import (
+    BulkCreateUserResult,
     UserCreate,
     UserUpdate,
     UserResponse,
+    UserBatch,
+    UserPage,
 )
 from abc import ABC, abstractmethod
 from typing import List
@@ -15,40 +19,107 @@ class CreateUserUseCaseSchema(BaseModel):
     user: UserCreate
 
 
+class BulkCreateUsersUseCaseSchema(BaseModel):
+    users: List[UserCreate]
+
+
 class GetUserUseCaseSchema(BaseModel):
     user_id: UUID
 
 
+class GetUsersByIdsUseCaseSchema(BaseModel):
+    user_ids: List[UUID]
+
+
 class ListUsersUseCaseSchema(BaseModel):
     skip: int = 0
     limit: int = 100
     active: Optional[bool] = None
+    cursor: Optional[str] = None
+
+
+class SearchUsersUseCaseSchema(BaseModel):
+    query: str
+    limit: int = 20
+    cursor: Optional[str] = None
+
+
+class ExportUsersUseCaseSchema(BaseModel):
+    active: Optional[bool] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
 
 
 class UpdateUserUseCaseSchema(BaseModel):
     user_id: UUID
     user: UserUpdate
+    expected_versions: Optional[List[datetime]] = None
 
 
 class DeleteUserUseCaseSchema(BaseModel):
     user_id: UUID
 
 
+class VerifyUserPasswordUseCaseSchema(BaseModel):
+    user_id: UUID
+    password: str
+
+
+class RehashUserPasswordUseCaseSchema(BaseModel):
+    user_id: UUID
+    current_hash: str
+    new_hash: str
+
+
 class CreateUserUseCase(Command[UserResponse, CreateUserUseCaseSchema], ABC):
     @abstractmethod
     def execute(self) -> UserResponse:
         pass
 
 
+class BulkCreateUsersUseCase(
+    Command[List[BulkCreateUserResult], BulkCreateUsersUseCaseSchema], ABC
+):
+    @abstractmethod
+    def execute(self) -> List[BulkCreateUserResult]:
+        pass
+
+
 class GetUserUseCase(Command[Optional[UserResponse], GetUserUseCaseSchema], ABC):
     @abstractmethod
     def execute(self) -> Optional[UserResponse]:
         pass
 
 
-class ListUsersUseCase(Command[List[UserResponse], ListUsersUseCaseSchema], ABC):
+class GetUserVersionUseCase(Command[Optional[datetime], GetUserUseCaseSchema], ABC):
     @abstractmethod
-    def execute(self) -> List[UserResponse]:
+    def execute(self) -> Optional[datetime]:
+        pass
+
+
+class GetUsersByIdsUseCase(Command[UserBatch, GetUsersByIdsUseCaseSchema], ABC):
+    @abstractmethod
+    def execute(self) -> UserBatch:
+        pass
+
+
+class ListUsersUseCase(Command[UserPage, ListUsersUseCaseSchema], ABC):
+    @abstractmethod
+    def execute(self) -> UserPage:
+        pass
+
+
+class SearchUsersUseCase(Command[UserPage, SearchUsersUseCaseSchema], ABC):
+    @abstractmethod
+    def execute(self) -> UserPage:
+        pass
+
+
+class ExportUsersUseCase(
+    Command[Iterator[Dict[str, Any]], ExportUsersUseCaseSchema], ABC
+):
+    @abstractmethod
+    def execute(self) -> Iterator[Dict[str, Any]]:
         pass
 
 
@@ -62,3 +133,73 @@ class DeleteUserUseCase(Command[bool, DeleteUserUseCaseSchema], ABC):
     @abstractmethod
     def execute(self) -> bool:
         pass
+
+
+class VerifyUserPasswordUseCase(
+    Command[Optional[bool], VerifyUserPasswordUseCaseSchema], ABC
+):
+    @abstractmethod
+    def execute(self) -> Optional[bool]:
+        pass
+
+
+class RehashUserPasswordUseCase(Command[bool, RehashUserPasswordUseCaseSchema], ABC):
+    @abstractmethod
+    def execute(self) -> bool:
+        pass
+
+
+class AsyncCreateUserUseCase(AsyncCommand[UserResponse, CreateUserUseCaseSchema], ABC):
+    @abstractmethod
+    async def execute(self) -> UserResponse:
+        pass
+
+
+class AsyncGetUserUseCase(
+    AsyncCommand[Optional[UserResponse], GetUserUseCaseSchema], ABC
+):
+    @abstractmethod
+    async def execute(self) -> Optional[UserResponse]:
+        pass
+
+
+class AsyncGetUserVersionUseCase(
+    AsyncCommand[Optional[datetime], GetUserUseCaseSchema], ABC
+):
+    @abstractmethod
+    async def execute(self) -> Optional[datetime]:
+        pass
+
+
+class AsyncGetUsersByIdsUseCase(
+    AsyncCommand[UserBatch, GetUsersByIdsUseCaseSchema], ABC
+):
+    @abstractmethod
+    async def execute(self) -> UserBatch:
+        pass
+
+
+class AsyncListUsersUseCase(AsyncCommand[UserPage, ListUsersUseCaseSchema], ABC):
+    @abstractmethod
+    async def execute(self) -> UserPage:
+        pass
+
+
+class AsyncSearchUsersUseCase(AsyncCommand[UserPage, SearchUsersUseCaseSchema], ABC):
+    @abstractmethod
+    async def execute(self) -> UserPage:
+        pass
+
+
+class AsyncUpdateUserUseCase(
+    AsyncCommand[Optional[UserResponse], UpdateUserUseCaseSchema], ABC
+):
+    @abstractmethod
+    async def execute(self) -> Optional[UserResponse]:
+        pass
+
+
+class AsyncDeleteUserUseCase(AsyncCommand[bool, DeleteUserUseCaseSchema], ABC):
+    @abstractmethod
+    async def execute(self) -> bool:
+        pass
@@ -0,0 +1,35 @@
+"""
+Database management commands.
+
+Usage:
+    python -m app.presentation.cli.db bootstrap
+"""
+
+import argparse
+
+from sqlalchemy import Engine
+
+from app.app_module import get_injector
+from app.infrastructure.database.bootstrap import bootstrap_database
+from app.ports.logging import LoggerServicePort
+
+
+def bootstrap() -> None:
+    injector = get_injector()
+    bootstrap_database(injector.get(Engine), injector.get(LoggerServicePort))
+
+
+COMMANDS = {
+    "bootstrap": bootstrap,
+}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.presentation.cli.db")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+    COMMANDS[args.command]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Password hashing commands.
+
+Usage:
+    python -m app.presentation.cli.hashing calibrate [--target-ms 250]
+
+`calibrate` measures bcrypt on this host and prints the BCRYPT_ROUNDS that
+keeps one hash within the target latency. Deploying a new value is gradual:
+existing hashes are rehashed with it on the user's next verification.
+"""
+
+import argparse
+
+from app.config.environment import get_environment_variables
+from app.infrastructure.security.calibration import (
+    MAX_BCRYPT_ROUNDS,
+    MIN_BCRYPT_ROUNDS,
+    calibrate_bcrypt_rounds,
+)
+
+
+def calibrate(args) -> None:
+    result = calibrate_bcrypt_rounds(
+        args.target_ms, min_rounds=args.min_rounds, max_rounds=args.max_rounds
+    )
+    print(f"{'rounds':>8}{'hash ms':>10}")
+    for rounds, elapsed in result.timings_ms.items():
+        marker = "  <-" if rounds == result.rounds else ""
+        print(f"{rounds:>8}{elapsed:>10.1f}{marker}")
+    if not result.meets_target:
+        print(
+            f"\nEven {result.rounds} rounds exceed {args.target_ms:.0f} ms on this "
+            "host; keeping the minimum."
+        )
+    current = get_environment_variables().BCRYPT_ROUNDS
+    print(f"\nBCRYPT_ROUNDS={result.rounds}  (currently {current})")
+
+
+COMMANDS = {
+    "calibrate": calibrate,
+}
+
+
+def main(argv=None) -> None:
+    env = get_environment_variables()
+    parser = argparse.ArgumentParser(prog="python -m app.presentation.cli.hashing")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=env.BCRYPT_TARGET_MS,
+        help="Latency budget for one hash on this host.",
+    )
+    parser.add_argument("--min-rounds", type=int, default=MIN_BCRYPT_ROUNDS)
+    parser.add_argument("--max-rounds", type=int, default=MAX_BCRYPT_ROUNDS)
+    args = parser.parse_args(argv)
+    COMMANDS[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
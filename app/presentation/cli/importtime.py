@@ -0,0 +1,98 @@
+"""
+Cold-start report: imports the HTTP app in a fresh interpreter under
+`python -X importtime` and prints the slowest modules.
+
+Usage:
+    python -m app.presentation.cli.importtime
+    python -m app.presentation.cli.importtime --runs 5 --top 20 --budget-ms 800
+
+Exits with status 1 when the median import time exceeds the budget
+(IMPORT_TIME_BUDGET_MS), so it can gate CI.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple
+
+from app.config.environment import get_environment_variables
+
+APP_MODULE = "app.presentation.http.app"
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> List[ImportTime]:
+    """
+    Parses the `import time: self | cumulative | module` lines written to
+    stderr by `-X importtime`, skipping the header and any other output.
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        entries.append(ImportTime(fields[2].strip(), int(fields[0]), int(fields[1])))
+    return entries
+
+
+def measure(module: str) -> Dict[str, ImportTime]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {entry.module: entry for entry in parse_importtime(result.stderr)}
+
+
+def report(module: str, runs: int, top: int, budget_ms: float) -> bool:
+    samples = [measure(module) for _ in range(runs)]
+    totals = [sample[module].cumulative_us / 1000 for sample in samples]
+    median_ms = statistics.median(totals)
+
+    # The slowest modules of the median run, by cumulative and by self time.
+    median_run = samples[totals.index(sorted(totals)[len(totals) // 2])]
+    entries = [entry for name, entry in median_run.items() if name != module]
+    print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+    for entry in sorted(entries, key=lambda e: e.cumulative_us, reverse=True)[:top]:
+        print(
+            f"{entry.cumulative_us / 1000:>14.1f}{entry.self_us / 1000:>10.1f}  "
+            f"{entry.module}"
+        )
+    print(f"\n{'self ms':>14}  module")
+    for entry in sorted(entries, key=lambda e: e.self_us, reverse=True)[:top]:
+        print(f"{entry.self_us / 1000:>14.1f}  {entry.module}")
+
+    within_budget = median_ms <= budget_ms
+    print(
+        f"\nimport {module}: median {median_ms:.1f} ms over {runs} runs "
+        f"(min {min(totals):.1f}, max {max(totals):.1f}), "
+        f"budget {budget_ms:.0f} ms: {'OK' if within_budget else 'OVER BUDGET'}"
+    )
+    return within_budget
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.presentation.cli.importtime")
+    parser.add_argument("--module", default=APP_MODULE)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=get_environment_variables().IMPORT_TIME_BUDGET_MS,
+    )
+    args = parser.parse_args(argv)
+    return 0 if report(args.module, args.runs, args.top, args.budget_ms) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
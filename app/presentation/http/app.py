@@ -1,12 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.presentation.http.routers.users import router as users_router
+from app.presentation.http.routers.diagnostics import router as diagnostics_router
+from app.presentation.http.routers.metrics import router as metrics_router
 from app.config.environment import get_environment_variables
 from app.config.settings import get_settings
 from app.presentation.http.exceptions.register import (
     register_exception_handlers_from_config,
 )
 from app.presentation.http.exceptions.mapper import error_mapper
+from app.presentation.http.tracing import TracingMiddleware
+from app.presentation.http.lifespan import lifespan
 
 envs = get_environment_variables()
 settings = get_settings()
@@ -17,9 +21,12 @@ app = FastAPI(
     title=envs.APP_NAME,
     version=envs.API_VERSION,
     swagger_ui_parameters={"syntaxHighlight": {"theme": "obsidian"}},
+    lifespan=lifespan,
 )
 
 app.include_router(users_router, tags=["users"])
+app.include_router(diagnostics_router, tags=["diagnostics"])
+app.include_router(metrics_router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -29,4 +36,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Added last so it is the outermost middleware and its span covers the others.
+app.add_middleware(TracingMiddleware)
+
 register_exception_handlers_from_config(app, error_mapper)
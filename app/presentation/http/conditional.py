@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+from uuid import UUID
+
+from fastapi import Response, status
+
+from app.domain.value_objects.etag import etag_matches, user_etag
+
+
+def validator_headers(user_id: UUID, updated_at: datetime) -> Dict[str, str]:
+    """
+    ETag and Last-Modified of a user version, sent with every representation
+    so clients can revalidate it.
+    """
+    return {
+        "ETag": user_etag(user_id, updated_at),
+        "Last-Modified": format_datetime(
+            updated_at.astimezone(timezone.utc), usegmt=True
+        ),
+    }
+
+
+def is_not_modified(
+    user_id: UUID,
+    updated_at: datetime,
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+) -> bool:
+    """
+    Evaluates the GET preconditions. If-Modified-Since is only considered
+    when If-None-Match is absent, and is ignored when it cannot be parsed.
+    """
+    if if_none_match is not None:
+        return etag_matches(if_none_match, user_etag(user_id, updated_at))
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have second resolution.
+    return updated_at.replace(microsecond=0) <= since
+
+
+def not_modified_response(user_id: UUID, updated_at: datetime) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(user_id, updated_at),
+    )
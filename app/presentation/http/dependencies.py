@@ -0,0 +1,30 @@
+from typing import Optional, Type
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.app_module import get_injector
+from app.config.environment import get_environment_variables
+from app.ports.command import AsyncCommand
+
+
+def provide_use_case(port: Type, async_port: Optional[Type] = None):
+    """
+    Builds a FastAPI dependency that resolves `port` from the injector, or
+    `async_port` when the async database path is enabled (`DB_ASYNC`).
+    """
+    use_async = async_port is not None and get_environment_variables().DB_ASYNC
+    interface = async_port if use_async else port
+
+    async def dependency():
+        return get_injector().get(interface)
+
+    return dependency
+
+
+async def execute_use_case(use_case):
+    """
+    Awaits async use cases on the event loop and runs sync ones in the threadpool.
+    """
+    if isinstance(use_case, AsyncCommand):
+        return await use_case.execute()
+    return await run_in_threadpool(use_case.execute)
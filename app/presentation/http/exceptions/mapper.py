@@ -2,6 +2,8 @@ from app.domain.exceptions import (
     EmailAlreadyExistsError,
     UserNotFoundError,
     InvalidCredentialsError,
+    ServiceOverloadedError,
+    StaleUserVersionError,
 )
 
 error_mapper = {
@@ -17,6 +19,14 @@ error_mapper = {
         "status_code": 401,
         "response_key": "detail",
     },
+    ServiceOverloadedError: {
+        "status_code": 503,
+        "response_key": "detail",
+    },
+    StaleUserVersionError: {
+        "status_code": 412,
+        "response_key": "detail",
+    },
     ValueError: {
         "status_code": 422,
         "response_key": "detail",
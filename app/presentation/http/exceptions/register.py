@@ -1,10 +1,8 @@
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
-from app.app_module import injector
+from app.app_module import get_injector
 from app.ports.logging import LoggerServicePort
 
-logger = injector.get(LoggerServicePort)
-
 
 def register_exception_handlers_from_config(app: FastAPI, exception_config: dict):
     for exc_type, config in exception_config.items():
@@ -12,11 +10,14 @@ def register_exception_handlers_from_config(app: FastAPI, exception_config: dict
         response_key = config.get("response_key", "detail")
 
         @app.exception_handler(exc_type)
-        async def custom_exception_handler(request, exc):
+        async def custom_exception_handler(
+            request, exc, status_code=status_code, response_key=response_key
+        ):
+            logger = get_injector().get(LoggerServicePort)
             # Log the exception
-            logger.error(f"Exception occurred: {exc}")
+            logger.error("Exception occurred: %s", exc)
             # Log the request details
-            logger.error(f"Request details: {request.method} {request.url}")
+            logger.error("Request details: %s %s", request.method, request.url)
             return JSONResponse(
                 status_code=status_code,
                 content={response_key: str(exc)},
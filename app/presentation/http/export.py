@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, Sequence
+from uuid import UUID
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+# Rows are buffered into chunks of this size before being handed to the
+# response, so each write to the socket carries more than a single line.
+ROWS_PER_CHUNK = 500
+
+
+def _to_text(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _chunked(lines: Iterable[str]) -> Iterator[str]:
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= ROWS_PER_CHUNK:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+
+def to_ndjson(rows: Iterable[Dict[str, Any]], fields: Sequence[str]) -> Iterator[str]:
+    """
+    Encodes each row as one JSON object per line.
+    """
+    return _chunked(
+        json.dumps({field: _to_text(row[field]) for field in fields}) + "\n"
+        for row in rows
+    )
+
+
+def to_csv(rows: Iterable[Dict[str, Any]], fields: Sequence[str]) -> Iterator[str]:
+    """
+    Encodes the rows as CSV with a header line.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    def lines() -> Iterator[str]:
+        writer.writerow(fields)
+        yield flush()
+        for row in rows:
+            writer.writerow([_to_text(row[field]) for field in fields])
+            yield flush()
+
+    return _chunked(lines())
+
+
+ENCODERS = {
+    ExportFormat.NDJSON: to_ndjson,
+    ExportFormat.CSV: to_csv,
+}
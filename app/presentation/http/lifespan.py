@@ -0,0 +1,53 @@
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.app_module import get_injector
+from app.config.environment import get_environment_variables
+from app.infrastructure.events.outbox_dispatcher import OutboxDispatcher
+from app.infrastructure.security.hashing_executor import HashingExecutor
+
+
+def check_connection(engine: Engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup and shutdown of the HTTP app. Importing the app performs no I/O:
+    the injector is built and the database reached here, so a misconfigured
+    database fails the boot instead of the first request. Each worker then
+    starts its outbox dispatcher, unless there is no sink to deliver to: with
+    OUTBOX_SINK=none events are kept in the outbox. On shutdown the
+    dispatcher is stopped and the connection pool and the hashing pool are
+    released.
+    """
+    env = get_environment_variables()
+    injector = get_injector()
+    if env.DB_ASYNC:
+        async_engine = injector.get(AsyncEngine)
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    else:
+        await run_in_threadpool(check_connection, injector.get(Engine))
+
+    dispatcher = None
+    if env.OUTBOX_DISPATCHER_ENABLED and env.OUTBOX_SINK.lower() != "none":
+        dispatcher = injector.get(OutboxDispatcher)
+        dispatcher.start()
+
+    try:
+        yield
+    finally:
+        if dispatcher is not None:
+            await run_in_threadpool(dispatcher.stop)
+        await run_in_threadpool(injector.get(HashingExecutor).shutdown)
+        if env.DB_ASYNC:
+            await injector.get(AsyncEngine).dispose()
+        else:
+            await run_in_threadpool(injector.get(Engine).dispose)
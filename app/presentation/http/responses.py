@@ -0,0 +1,50 @@
+from typing import Dict, List, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.domain.entities.users import UserBatch, UserInDBBase
+from app.presentation.http.schemas.users import UserResponseApiSchema
+
+# Fields of UserResponseApiSchema; everything else on the domain user, such as
+# hashed_password or deleted_at, stays out of the body.
+USER_RESPONSE_FIELDS = frozenset(UserResponseApiSchema.model_fields)
+
+_user_adapter = TypeAdapter(UserInDBBase)
+_users_adapter = TypeAdapter(List[UserInDBBase])
+_user_batch_adapter = TypeAdapter(UserBatch)
+
+
+class PreSerializedJSONResponse(Response):
+    """
+    JSON body that was already encoded by the route. FastAPI hands returned
+    Response objects through as they are, so the route's response_model only
+    documents the shape and is not validated or serialized a second time.
+    """
+
+    media_type = "application/json"
+
+
+def user_response(
+    user: UserInDBBase, headers: Optional[Dict[str, str]] = None
+) -> PreSerializedJSONResponse:
+    return PreSerializedJSONResponse(
+        _user_adapter.dump_json(user, include=USER_RESPONSE_FIELDS), headers=headers
+    )
+
+
+def users_response(
+    users: List[UserInDBBase], headers: Optional[Dict[str, str]] = None
+) -> PreSerializedJSONResponse:
+    return PreSerializedJSONResponse(
+        _users_adapter.dump_json(users, include={"__all__": USER_RESPONSE_FIELDS}),
+        headers=headers,
+    )
+
+
+def user_batch_response(batch: UserBatch) -> PreSerializedJSONResponse:
+    return PreSerializedJSONResponse(
+        _user_batch_adapter.dump_json(
+            batch, include={"users": {"__all__": USER_RESPONSE_FIELDS}, "missing": True}
+        )
+    )
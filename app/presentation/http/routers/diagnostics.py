@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+
+from app.app_module import get_injector
+from app.ports.cache import CacheStats, UserCachePort
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+
+@router.get(
+    "/cache",
+    response_model=CacheStats,
+    summary="User cache statistics",
+)
+async def user_cache_stats(
+    user_cache: UserCachePort = Depends(lambda: get_injector().get(UserCachePort)),
+):
+    """
+    Returns hit/miss counters of the user read-through cache for tuning its
+    size and TTL.
+    """
+    return user_cache.stats()
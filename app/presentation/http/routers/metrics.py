@@ -0,0 +1,25 @@
+from fastapi import APIRouter, HTTPException, Response, status
+
+from app.infrastructure.metrics import CONTENT_TYPE
+from app.ports.metrics import get_metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get(
+    "/metrics",
+    response_class=Response,
+    summary="Prometheus metrics",
+    include_in_schema=False,
+)
+async def metrics():
+    """
+    Latency histograms and pool gauges in the Prometheus text format.
+    Responds 404 unless METRICS_ENABLED is set.
+    """
+    metrics_service = get_metrics()
+    if not metrics_service.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Metrics are disabled"
+        )
+    return Response(metrics_service.render(), media_type=CONTENT_TYPE)
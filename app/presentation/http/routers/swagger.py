@@ -81,6 +81,157 @@ A successful response indicates that the user was created successfully. The resp
 | `500 Internal Server Error` | An unexpected error occurred during user creation.                      | `{"detail": "Error al crear el usuario"}`             |
 """
 
+BULK_CREATE_USERS_SWAGGER = """
+
+## Bulk Create Users
+
+This API endpoint allows you to create up to 1000 users in a single request.
+
+### Use Case
+
+This endpoint is used for imports and back-office onboarding, where creating users one by one would cost one round trip per user.
+
+### Request
+
+**Method:** `POST`
+
+**Path:** `/users/bulk`
+
+**Request Body:**
+
+```json
+{
+  "users": [
+    {"email": "jane@example.com", "username": "jane", "first_name": "Jane", "last_name": "Doe"},
+    {"email": "john@example.com", "username": "john", "first_name": "John", "last_name": "Doe"}
+  ]
+}
+```
+
+Each item follows the `UserCreateSchema` (see Create User documentation). The list must contain between 1 and 1000 items.
+
+### Response
+
+#### Successful Response (`200 OK`)
+
+The response contains one result per submitted item, in the same order. An item that collides with an existing user (or with an earlier item of the same batch) is reported as a `conflict`; the rest of the batch is still created.
+
+```json
+[
+  {"index": 0, "status": "created", "user": {"id": "a1b2c3d4-e5f6-7890-1234-567890abcdef", "email": "jane@example.com", "...": "..."}, "detail": null},
+  {"index": 1, "status": "conflict", "user": null, "detail": "Email already exists"}
+]
+```
+
+| Field    | Description                                            | Type      |
+|----------|--------------------------------------------------------|-----------|
+| `index`  | Position of the item in the request.                   | `integer` |
+| `status` | `created` or `conflict`.                               | `string`  |
+| `user`   | The created user, when `status` is `created`.          | `object`  |
+| `detail` | The reason of the conflict, when `status` is `conflict`. | `string`  |
+
+#### Error Responses
+
+| Status Code                 | Description                                          | Example Response |
+|-----------------------------|------------------------------------------------------|------------------|
+| `422 Unprocessable Entity`  | The list is empty, too long or an item is invalid.   | `{"detail": [...]}` |
+| `503 Service Unavailable`   | The hashing pool is saturated.                       | `{"detail": "..."}` |
+"""
+
+BATCH_GET_USERS_SWAGGER = """
+
+## Get Users by ID
+
+This API endpoint allows you to retrieve up to 1000 users by their unique IDs in a single request.
+
+### Use Case
+
+This endpoint is used by services that need to resolve many user IDs at once, replacing one `GET /users/{user_id}` call per ID with a single request served by a single database query.
+
+### Request
+
+**Method:** `POST`
+
+**Path:** `/users/batch-get`
+
+**Request Body:**
+
+```json
+{
+  "ids": [
+    "a1b2c3d4-e5f6-7890-1234-567890abcdef",
+    "b2c3d4e5-f6a7-8901-2345-67890abcdef1"
+  ]
+}
+```
+
+The list must contain between 1 and 1000 IDs. Repeated IDs are returned once.
+
+### Response
+
+#### Successful Response (`200 OK`)
+
+Users are returned in the order their IDs were requested. IDs that do not match an active user are listed in `missing` instead of failing the request.
+
+```json
+{
+  "users": [
+    {"id": "a1b2c3d4-e5f6-7890-1234-567890abcdef", "email": "jane@example.com", "...": "..."}
+  ],
+  "missing": ["b2c3d4e5-f6a7-8901-2345-67890abcdef1"]
+}
+```
+
+| Field     | Description                                           | Type     |
+|-----------|-------------------------------------------------------|----------|
+| `users`   | The users found, in request order.                    | `array`  |
+| `missing` | Requested IDs with no active user, in request order.  | `array`  |
+
+#### Error Responses
+
+| Status Code                 | Description                                          | Example Response |
+|-----------------------------|------------------------------------------------------|------------------|
+| `422 Unprocessable Entity`  | The list is empty, too long or an ID is not a UUID.  | `{"detail": [...]}` |
+"""
+
+EXPORT_USERS_SWAGGER = """
+
+## Export Users
+
+This API endpoint streams every user matching the filters as NDJSON or CSV.
+
+### Use Case
+
+This endpoint is used for reporting and data exports. Rows are read from the database in batches through a server-side cursor and written to the response as they arrive, so memory usage stays constant regardless of the size of the table.
+
+### Request
+
+**Method:** `GET`
+
+**Path:** `/users/export`
+
+**Query Parameters:**
+
+| Parameter      | Description                                             | Required | Type       | Default  | Example                |
+|----------------|---------------------------------------------------------|----------|------------|----------|------------------------|
+| `format`       | Output format: `ndjson` or `csv`.                       | No       | `string`   | `ndjson` | `csv`                  |
+| `active`       | Only export users with this activation status.          | No       | `boolean`  | (all)    | `true`                 |
+| `created_from` | Only export users created at or after this instant.     | No       | `datetime` | (none)   | `2025-01-01T00:00:00Z` |
+| `created_to`   | Only export users created before this instant.          | No       | `datetime` | (none)   | `2025-02-01T00:00:00Z` |
+
+### Response
+
+#### Successful Response (`200 OK`)
+
+`application/x-ndjson`, one user per line:
+
+```
+{"id": "a1b2c3d4-e5f6-7890-1234-567890abcdef", "username": "newuser", "email": "user@example.com", "first_name": "John", "last_name": "Doe", "role": "user", "active": true, "created_at": "2025-05-15T02:05:00+00:00", "updated_at": "2025-05-15T02:05:00+00:00"}
+```
+
+or `text/csv`, with a header line and the same columns. Users are ordered by creation date; soft-deleted users are never exported.
+"""
+
 GET_USER_SWAGGER = """
 
 ## Get User by ID
@@ -103,14 +254,25 @@ This endpoint is used to fetch the information of a particular user when their I
 |------------|----------------------------------|----------|----------|-------------------------------------|
 | `user_id`  | The unique ID of the user.       | Yes      | `string` | `a1b2c3d4-e5f6-7890-1234-567890abcdef` |
 
+**Headers:**
+
+| Header              | Description                                                  | Required | Example |
+|---------------------|--------------------------------------------------------------|----------|---------|
+| `If-None-Match`     | ETag from a previous response. Answered with `304` if it still matches. | No | `"a1b2c3d4e5f678901234567890abcdef-1747274700000000"` |
+| `If-Modified-Since` | Date from `Last-Modified`. Ignored when `If-None-Match` is sent. | No | `Thu, 15 May 2025 02:05:00 GMT` |
+
 ### Response
 
 #### Successful Response (`200 OK`)
 
-A successful response contains the details of the requested user.
+A successful response contains the details of the requested user, with `ETag` and `Last-Modified` headers identifying its version.
 
 **Response Body:** (See `UserResponseSchema` in Create User documentation)
 
+#### Not Modified (`304 Not Modified`)
+
+The cached version is still current. The body is empty; `ETag` and `Last-Modified` are repeated. This check reads only the user's version, so polling with `If-None-Match` is much cheaper than fetching the user.
+
 #### Error Response
 
 | Status Code           | Description                                          | Example Response                  |
@@ -141,12 +303,13 @@ This endpoint is used to fetch multiple user records, optionally allowing you to
 | `skip`    | Number of users to skip for pagination.      | No       | `integer`| `0`     | `10`    |
 | `limit`   | Maximum number of users to return.         | No       | `integer`| `100`   | `50`    |
 | `active`  | Filter users by their active status.         | No       | `boolean`| `None`  | `true`  |
+| `cursor`  | Opaque cursor from `X-Next-Cursor`. Replaces `skip` with keyset pagination. | No | `string` | `None` | `WyIyMDI1LTA1...` |
 
 ### Response
 
 #### Successful Response (`200 OK`)
 
-A successful response contains a list of user objects.
+A successful response contains a list of user objects. When the page is full, the `X-Next-Cursor` response header carries the cursor for the next page; deep pages fetched with `cursor` cost the same as the first one.
 
 **Response Body:**
 
@@ -184,6 +347,45 @@ A successful response contains a list of user objects.
 This endpoint typically returns `200 OK` even if no users match the criteria (in which case an empty list is returned). Server errors might result in a `500 Internal Server Error`.
 """
 
+SEARCH_USERS_SWAGGER = """
+
+## Search Users
+
+This API endpoint looks users up by part of their username, email, first name or last name.
+
+### Use Case
+
+This endpoint is used by admin tools to find users without paging through the whole table.
+
+### Request
+
+**Method:** `GET`
+
+**Path:** `/users/search`
+
+**Query Parameters:**
+
+| Parameter | Description                                  | Required | Type    | Default | Example |
+|-----------|----------------------------------------------|----------|---------|---------|---------|
+| `q`       | Search text, 2 to 100 characters. Every whitespace-separated term (up to 5) must appear in one of the fields; matching is case-insensitive. | Yes | `string` | | `ada love` |
+| `limit`   | Maximum number of users to return, up to `100`. | No    | `integer`| `20`    | `50`    |
+| `cursor`  | Opaque cursor from `X-Next-Cursor` to fetch the next page. | No | `string` | `None` | `WzcsICJhZGEiXQ` |
+
+### Response
+
+#### Successful Response (`200 OK`)
+
+A list of active users, most relevant first and then by username. For each term, an exact username or email match ranks above a username or email prefix, which ranks above a name prefix, which ranks above a match anywhere in a field. When the page is full, the `X-Next-Cursor` response header carries the cursor for the next page.
+
+**Schema:** `List[UserResponseSchema]`
+
+#### Error Responses
+
+| Status Code                 | Description                                          | Example Response |
+|-----------------------------|------------------------------------------------------|------------------|
+| `422 Unprocessable Entity`  | `q` is missing, too short or too long, `limit` is out of range or the cursor is not valid. | `{"detail": [...]}` |
+"""
+
 UPDATE_USER_SWAGGER = """
 
 ## Update User by ID
@@ -206,6 +408,12 @@ This endpoint is used to modify the details of a user, such as their name or act
 |------------|----------------------------------|----------|----------|-------------------------------------|
 | `user_id`  | The unique ID of the user to update.| Yes      | `string` | `a1b2c3d4-e5f6-7890-1234-567890abcdef` |
 
+**Headers:**
+
+| Header     | Description                                                                 | Required | Example |
+|------------|-----------------------------------------------------------------------------|----------|---------|
+| `If-Match` | ETag of the version being edited. The update only applies if the user is still at that version. | No | `"a1b2c3d4e5f678901234567890abcdef-1747274700000000"` |
+
 **Request Body:**
 
 The request body should be a JSON object conforming to the `UserUpdateSchema`. Only the fields you want to update need to be included.
@@ -232,7 +440,7 @@ The request body should be a JSON object conforming to the `UserUpdateSchema`. O
 
 #### Successful Response (`200 OK`)
 
-A successful response contains the details of the updated user.
+A successful response contains the details of the updated user, with the `ETag` and `Last-Modified` of its new version.
 
 **Response Body:** (See `UserResponseSchema` in Create User documentation)
 
@@ -241,6 +449,7 @@ A successful response contains the details of the updated user.
 | Status Code           | Description                                          | Example Response                  |
 |-----------------------|------------------------------------------------------|-----------------------------------|
 | `404 Not Found`       | No user found with the specified ID.               | `{"detail": "Usuario no encontrado"}` |
+| `412 Precondition Failed` | `If-Match` does not name the current version: someone else updated the user first. | `{"detail": "User was modified since it was read"}` |
 """
 
 DELETE_USER_SWAGGER = """
@@ -277,3 +486,49 @@ A successful response indicates that the user was deleted successfully. There is
 |-----------------------|------------------------------------------------------|-----------------------------------|
 | `404 Not Found`       | No user found with the specified ID.               | `{"detail": "Usuario no encontrado"}` |
 """
+
+VERIFY_USER_PASSWORD_SWAGGER = """
+
+## Verify User Password
+
+This API endpoint checks a password against the hash stored for a user.
+
+### Use Case
+
+This endpoint is used by authentication flows. When the password is valid but its hash was made with an older work factor (for example after `BCRYPT_ROUNDS` changes), the hash is recomputed in the background and stored, so a new cost rolls out as users sign in without a bulk migration. The response does not wait for the rehash.
+
+### Request
+
+**Method:** `POST`
+
+**Path:** `/users/{user_id}/verify-password`
+
+**Request Body:**
+
+```json
+{
+  "password": "jane@example.com"
+}
+```
+
+### Response
+
+#### Successful Response (`200 OK`)
+
+```json
+{
+  "valid": true
+}
+```
+
+| Field   | Description                                    | Type      |
+|---------|------------------------------------------------|-----------|
+| `valid` | Whether the password matches the stored hash.  | `boolean` |
+
+#### Error Responses
+
+| Status Code                 | Description                                        | Example Response |
+|-----------------------------|----------------------------------------------------|------------------|
+| `404 Not Found`             | No user found with the specified ID.               | `{"detail": "User not found"}` |
+| `503 Service Unavailable`   | The hashing pool is saturated; retry later.        | `{"detail": "..."}` |
+"""
@@ -1,38 +1,92 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from datetime import datetime
 
 from uuid import UUID
 
 from typing import List, Optional
 
-from app.app_module import injector
+from app.presentation.http.dependencies import provide_use_case, execute_use_case
 from app.presentation.http.routers.swagger import (
     CREATE_USER_SWAGGER,
+    BULK_CREATE_USERS_SWAGGER,
+    BATCH_GET_USERS_SWAGGER,
+    EXPORT_USERS_SWAGGER,
     GET_USER_SWAGGER,
     LIST_USERS_SWAGGER,
+    SEARCH_USERS_SWAGGER,
     UPDATE_USER_SWAGGER,
     DELETE_USER_SWAGGER,
+    VERIFY_USER_PASSWORD_SWAGGER,
+)
+from app.domain.entities.users import (
+    USER_EXPORT_FIELDS,
+    UserCreate,
+    UserUpdate,
+    UserResponse,
 )
-from app.domain.entities.users import UserCreate, UserUpdate, UserResponse
 from app.ports.use_cases.users import (
     GetUserUseCase,
     GetUserUseCaseSchema,
+    GetUserVersionUseCase,
+    GetUsersByIdsUseCase,
+    GetUsersByIdsUseCaseSchema,
     CreateUserUseCase,
     CreateUserUseCaseSchema,
+    BulkCreateUsersUseCase,
+    BulkCreateUsersUseCaseSchema,
+    ExportUsersUseCase,
+    ExportUsersUseCaseSchema,
     ListUsersUseCase,
     ListUsersUseCaseSchema,
+    SearchUsersUseCase,
+    SearchUsersUseCaseSchema,
     UpdateUserUseCase,
     UpdateUserUseCaseSchema,
     DeleteUserUseCase,
     DeleteUserUseCaseSchema,
+    VerifyUserPasswordUseCase,
+    VerifyUserPasswordUseCaseSchema,
+    AsyncCreateUserUseCase,
+    AsyncGetUserUseCase,
+    AsyncGetUserVersionUseCase,
+    AsyncGetUsersByIdsUseCase,
+    AsyncListUsersUseCase,
+    AsyncSearchUsersUseCase,
+    AsyncUpdateUserUseCase,
+    AsyncDeleteUserUseCase,
+)
+from app.domain.value_objects.etag import expected_versions
+from app.presentation.http.conditional import (
+    is_not_modified,
+    not_modified_response,
+    validator_headers,
+)
+from app.presentation.http.export import ENCODERS, MEDIA_TYPES, ExportFormat
+from app.presentation.http.responses import (
+    user_batch_response,
+    user_response,
+    users_response,
 )
 from app.presentation.http.schemas.users import (
     UserCreateApiSchema,
+    BulkUserCreateApiSchema,
+    BulkUserCreateResultApiSchema,
+    UserBatchGetApiSchema,
+    UserBatchGetResponseApiSchema,
     UserUpdateApiSchema,
     UserResponseApiSchema,
+    VerifyPasswordApiSchema,
+    VerifyPasswordResponseApiSchema,
 )
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+provide_get_user_version_use_case = provide_use_case(
+    GetUserVersionUseCase, AsyncGetUserVersionUseCase
+)
+
 
 @router.post(
     "/",
@@ -40,10 +94,10 @@ router = APIRouter(prefix="/users", tags=["users"])
     response_model=UserResponseApiSchema,
     description=CREATE_USER_SWAGGER,
 )
-def create_user(
+async def create_user(
     user_data: UserCreateApiSchema,
     create_user_use_case: CreateUserUseCase = Depends(
-        lambda: injector.get(CreateUserUseCase)
+        provide_use_case(CreateUserUseCase, AsyncCreateUserUseCase)
     ),
 ):
     """
@@ -51,7 +105,104 @@ def create_user(
     """
     attributes = CreateUserUseCaseSchema(user=UserCreate(**user_data.dict()))
     create_user_use_case.set_params(attributes)
-    return create_user_use_case.execute()
+    return await execute_use_case(create_user_use_case)
+
+
+@router.post(
+    "/bulk",
+    response_model=List[BulkUserCreateResultApiSchema],
+    summary="Bulk create users",
+    description=BULK_CREATE_USERS_SWAGGER,
+)
+async def bulk_create_users(
+    users_data: BulkUserCreateApiSchema,
+    bulk_create_users_use_case: BulkCreateUsersUseCase = Depends(
+        provide_use_case(BulkCreateUsersUseCase)
+    ),
+):
+    """
+    Creates a batch of users, reporting the outcome of each item by index.
+    """
+    attributes = BulkCreateUsersUseCaseSchema(
+        users=[UserCreate(**user.dict()) for user in users_data.users]
+    )
+    bulk_create_users_use_case.set_params(attributes)
+    return await execute_use_case(bulk_create_users_use_case)
+
+
+@router.post(
+    "/batch-get",
+    response_model=UserBatchGetResponseApiSchema,
+    summary="Read users by ID",
+    description=BATCH_GET_USERS_SWAGGER,
+)
+async def batch_get_users(
+    ids_data: UserBatchGetApiSchema,
+    get_users_by_ids_use_case: GetUsersByIdsUseCase = Depends(
+        provide_use_case(GetUsersByIdsUseCase, AsyncGetUsersByIdsUseCase)
+    ),
+):
+    """
+    Retrieves many users by ID in one query, in request order, listing the IDs not found.
+    """
+    attributes = GetUsersByIdsUseCaseSchema(user_ids=ids_data.ids)
+    get_users_by_ids_use_case.set_params(attributes)
+    return user_batch_response(await execute_use_case(get_users_by_ids_use_case))
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export users",
+    description=EXPORT_USERS_SWAGGER,
+)
+async def export_users(
+    format: ExportFormat = ExportFormat.NDJSON,
+    active: Optional[bool] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    export_users_use_case: ExportUsersUseCase = Depends(
+        provide_use_case(ExportUsersUseCase)
+    ),
+):
+    """
+    Streams every matching user as NDJSON or CSV without loading the table in memory.
+    """
+    attributes = ExportUsersUseCaseSchema(
+        active=active, created_from=created_from, created_to=created_to
+    )
+    export_users_use_case.set_params(attributes)
+    rows = await execute_use_case(export_users_use_case)
+    return StreamingResponse(
+        ENCODERS[format](rows, USER_EXPORT_FIELDS),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="users.{format.value}"'},
+    )
+
+
+@router.get(
+    "/search",
+    response_model=List[UserResponseApiSchema],
+    summary="Search users",
+    description=SEARCH_USERS_SWAGGER,
+)
+async def search_users(
+    q: str = Query(min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    search_users_use_case: SearchUsersUseCase = Depends(
+        provide_use_case(SearchUsersUseCase, AsyncSearchUsersUseCase)
+    ),
+):
+    """
+    Searches users by partial username, email, first or last name, most relevant first.
+    The cursor for the next page, if any, is returned in `X-Next-Cursor`.
+    """
+    attributes = SearchUsersUseCaseSchema(query=q, limit=limit, cursor=cursor)
+    search_users_use_case.set_params(attributes)
+    page = await execute_use_case(search_users_use_case)
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else None
+    return users_response(page.items, headers=headers)
 
 
 @router.get(
@@ -60,21 +211,36 @@ def create_user(
     summary="Read user",
     description=GET_USER_SWAGGER,
 )
-def get_user(
+async def get_user(
     user_id: UUID,
-    get_user_use_case: GetUserUseCase = Depends(lambda: injector.get(GetUserUseCase)),
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    get_user_use_case: GetUserUseCase = Depends(
+        provide_use_case(GetUserUseCase, AsyncGetUserUseCase)
+    ),
 ):
     """
-    Retrieves a user by their ID.
+    Retrieves a user by their ID. Conditional requests are answered with
+    `304 Not Modified` from the user's version alone, without loading it.
     """
     attributes = GetUserUseCaseSchema(user_id=user_id)
+    if if_none_match is not None or if_modified_since is not None:
+        # Resolved here, not as a dependency: most reads are unconditional.
+        get_user_version_use_case = await provide_get_user_version_use_case()
+        get_user_version_use_case.set_params(attributes)
+        updated_at = await execute_use_case(get_user_version_use_case)
+        if updated_at is not None and is_not_modified(
+            user_id, updated_at, if_none_match, if_modified_since
+        ):
+            return not_modified_response(user_id, updated_at)
+
     get_user_use_case.set_params(attributes)
-    user = get_user_use_case.execute()
+    user = await execute_use_case(get_user_use_case)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
-    return UserResponseApiSchema(**user.dict())
+    return user_response(user, headers=validator_headers(user.id, user.updated_at))
 
 
 @router.get(
@@ -83,22 +249,26 @@ def get_user(
     summary="Read users",
     description=LIST_USERS_SWAGGER,
 )
-def list_users(
+async def list_users(
     skip: int = 0,
     limit: int = 100,
     active: Optional[bool] = True,
+    cursor: Optional[str] = None,
     list_users_use_case: ListUsersUseCase = Depends(
-        lambda: injector.get(ListUsersUseCase)
+        provide_use_case(ListUsersUseCase, AsyncListUsersUseCase)
     ),
 ):
     """
     Retrieves a list of users with support for pagination and filtering.
+    The cursor for the next page, if any, is returned in `X-Next-Cursor`.
     """
-    attributes = ListUsersUseCaseSchema(skip=skip, limit=limit, active=active)
+    attributes = ListUsersUseCaseSchema(
+        skip=skip, limit=limit, active=active, cursor=cursor
+    )
     list_users_use_case.set_params(attributes)
-    return [
-        UserResponseApiSchema(**user.dict()) for user in list_users_use_case.execute()
-    ]
+    page = await execute_use_case(list_users_use_case)
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else None
+    return users_response(page.items, headers=headers)
 
 
 @router.put(
@@ -107,26 +277,35 @@ def list_users(
     summary="Update user",
     description=UPDATE_USER_SWAGGER,
 )
-def update_user(
+async def update_user(
     user_id: UUID,
     user_data: UserUpdateApiSchema,
+    if_match: Optional[str] = Header(None),
     update_user_use_case: UpdateUserUseCase = Depends(
-        lambda: injector.get(UpdateUserUseCase)
+        provide_use_case(UpdateUserUseCase, AsyncUpdateUserUseCase)
     ),
 ):
     """
-    Updates the information of an existing user.
+    Updates the information of an existing user. With `If-Match`, the update
+    only applies while the user is still at that version (412 otherwise).
     """
     attributes = UpdateUserUseCaseSchema(
-        user_id=user_id, user=UserUpdate(**user_data.dict(exclude_unset=True))
+        user_id=user_id,
+        user=UserUpdate(**user_data.dict(exclude_unset=True)),
+        expected_versions=(
+            expected_versions(if_match, user_id) if if_match is not None else None
+        ),
     )
     update_user_use_case.set_params(attributes)
-    updated_user = update_user_use_case.execute()
+    updated_user = await execute_use_case(update_user_use_case)
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
-    return UserResponseApiSchema(**updated_user.dict())
+    return user_response(
+        updated_user,
+        headers=validator_headers(updated_user.id, updated_user.updated_at),
+    )
 
 
 @router.delete(
@@ -135,10 +314,10 @@ def update_user(
     summary="Delete user",
     description=DELETE_USER_SWAGGER,
 )
-def delete_user(
+async def delete_user(
     user_id: UUID,
     delete_user_use_case: DeleteUserUseCase = Depends(
-        lambda: injector.get(DeleteUserUseCase)
+        provide_use_case(DeleteUserUseCase, AsyncDeleteUserUseCase)
     ),
 ):
     """
@@ -146,8 +325,37 @@ def delete_user(
     """
     attributes = DeleteUserUseCaseSchema(user_id=user_id)
     delete_user_use_case.set_params(attributes)
-    if not delete_user_use_case.execute():
+    if not await execute_use_case(delete_user_use_case):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
     return None
+
+
+@router.post(
+    "/{user_id}/verify-password",
+    response_model=VerifyPasswordResponseApiSchema,
+    summary="Verify user password",
+    description=VERIFY_USER_PASSWORD_SWAGGER,
+)
+async def verify_user_password(
+    user_id: UUID,
+    password_data: VerifyPasswordApiSchema,
+    verify_user_password_use_case: VerifyUserPasswordUseCase = Depends(
+        provide_use_case(VerifyUserPasswordUseCase)
+    ),
+):
+    """
+    Checks a password against the user's stored hash, rehashing it in the
+    background when it uses outdated parameters.
+    """
+    attributes = VerifyUserPasswordUseCaseSchema(
+        user_id=user_id, password=password_data.password
+    )
+    verify_user_password_use_case.set_params(attributes)
+    is_valid = await execute_use_case(verify_user_password_use_case)
+    if is_valid is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    return VerifyPasswordResponseApiSchema(valid=is_valid)
@@ -44,6 +44,14 @@ class UserCreateApiSchema(BaseModel):
         return value
 
 
+class BulkUserCreateApiSchema(BaseModel):
+    users: List[UserCreateApiSchema] = Field(..., min_length=1, max_length=1000)
+
+
+class UserBatchGetApiSchema(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+
+
 class UserUpdateApiSchema(BaseModel):
     email: Optional[EmailStr] = None
     username: Optional[str] = Field(
@@ -108,6 +116,14 @@ class UserUpdateApiSchema(BaseModel):
         return values
 
 
+class VerifyPasswordApiSchema(BaseModel):
+    password: str = Field(..., min_length=1, max_length=1024)
+
+
+class VerifyPasswordResponseApiSchema(BaseModel):
+    valid: bool
+
+
 class UserResponseApiSchema(BaseModel):
     id: UUID
     email: str
@@ -123,6 +139,18 @@ class UserResponseApiSchema(BaseModel):
         from_attributes = True
 
 
+class BulkUserCreateResultApiSchema(BaseModel):
+    index: int
+    status: str
+    user: Optional[UserResponseApiSchema] = None
+    detail: Optional[str] = None
+
+
+class UserBatchGetResponseApiSchema(BaseModel):
+    users: List[UserResponseApiSchema]
+    missing: List[UUID]
+
+
 class UserListResponseApiSchema(BaseModel):
     users: List[UserResponseApiSchema]
 
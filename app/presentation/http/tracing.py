@@ -0,0 +1,50 @@
+from app.ports.tracing import SpanContext, span, tracing_enabled
+
+TRACE_ID_HEADER = b"x-trace-id"
+
+
+class TracingMiddleware:
+    """
+    Opens the root span of each HTTP request, continuing the caller's trace
+    when a W3C `traceparent` header is sent, and returns the trace id in
+    `X-Trace-Id`. A plain ASGI middleware rather than BaseHTTPMiddleware so
+    the span also covers streamed response bodies.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        parent = SpanContext.from_traceparent(
+            headers.get(b"traceparent", b"").decode("latin-1")
+        )
+        with span(
+            f"HTTP {scope['method']}",
+            parent,
+            **{"http.method": scope["method"], "http.target": scope["path"]},
+        ) as request_span:
+
+            async def send_with_trace_id(message):
+                if message["type"] == "http.response.start":
+                    request_span.set_attribute("http.status_code", message["status"])
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (TRACE_ID_HEADER, request_span.trace_id.encode())
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                # The router stores the matched route in the scope, which
+                # gives a low-cardinality name such as "GET /users/{user_id}".
+                route = scope.get("route")
+                if route is not None:
+                    request_span.name = f"HTTP {scope['method']} {route.path}"
+                    request_span.set_attribute("http.route", route.path)
+                if request_span.attributes.get("http.status_code", 0) >= 500:
+                    request_span.status = "ERROR"
@@ -0,0 +1,292 @@
+"""
+Production entry point. Preloads the application once, binds the listening
+socket, then forks a fixed number of uvicorn workers that share it:
+
+    python -m app.serve
+    python -m app.serve --workers 4 --max-requests 20000
+
+Importing the app and building the injector before forking leaves them,
+the routes and the pydantic models in pages shared copy-on-write by every
+worker. The user cache's invalidation board is created here too, so a
+user updated in one worker is dropped from every worker's cache. Each
+worker connects to the database in its own lifespan startup and creates
+its hashing pool lazily, after the fork.
+
+With METRICS_ENABLED, the workers share their metrics through files in
+METRICS_MULTIPROCESS_DIR (a temporary directory unless set), so whichever
+worker answers GET /metrics reports the totals of the whole service.
+
+SIGTERM or SIGINT stops the workers gracefully: they stop accepting, drain
+in-flight requests for up to SERVER_GRACEFUL_TIMEOUT_SECONDS and exit; any
+worker still running after that is killed. A worker that exits on its own,
+such as after serving its max-requests, is replaced.
+"""
+
+import argparse
+import gc
+import importlib.util
+import os
+import random
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+from typing import Dict, Optional
+
+import uvicorn
+
+from app.config.environment import get_environment_variables
+
+APP = "app.presentation.http.app:app"
+# A worker that exits this soon after starting is failing to boot; respawning
+# it in a loop would only hide the error.
+MIN_WORKER_LIFETIME_SECONDS = 1.0
+REAP_INTERVAL_SECONDS = 0.5
+
+
+def log(message: str) -> None:
+    print(f"[serve] {message}", file=sys.stderr, flush=True)
+
+
+def available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def event_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def prepare_metrics_dir(env) -> Optional[str]:
+    """
+    Points METRICS_MULTIPROCESS_DIR at an empty directory before the workers
+    are forked. Returns the temporary directory created when it was unset.
+    """
+    if env.METRICS_MULTIPROCESS_DIR:
+        os.makedirs(env.METRICS_MULTIPROCESS_DIR, exist_ok=True)
+        # Totals restart with the service, as Prometheus expects on restart.
+        for entry in os.listdir(env.METRICS_MULTIPROCESS_DIR):
+            if entry.startswith("metrics-"):
+                os.remove(os.path.join(env.METRICS_MULTIPROCESS_DIR, entry))
+        return None
+    # Not a TemporaryDirectory: its finalizer would also run in every worker.
+    env.METRICS_MULTIPROCESS_DIR = tempfile.mkdtemp(prefix="app-metrics-")
+    return env.METRICS_MULTIPROCESS_DIR
+
+
+class Supervisor:
+    """
+    Pre-fork process manager: keeps `workers` children serving `sock` and
+    stops them gracefully on SIGTERM or SIGINT.
+    """
+
+    def __init__(
+        self,
+        app,
+        sock: socket.socket,
+        workers: int,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        graceful_timeout: float = 30.0,
+        keep_alive: int = 5,
+    ):
+        self.app = app
+        self.sock = sock
+        self.workers = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.keep_alive = keep_alive
+        self.children: Dict[int, float] = {}
+        self.stopping = False
+
+    def worker_config(self) -> uvicorn.Config:
+        limit = None
+        if self.max_requests > 0:
+            # Jitter so workers started together are not all recycled together.
+            limit = self.max_requests + random.randint(0, self.max_requests_jitter)
+        return uvicorn.Config(
+            self.app,
+            loop=event_loop(),
+            http=http_protocol(),
+            lifespan="on",
+            access_log=False,
+            limit_max_requests=limit,
+            timeout_keep_alive=self.keep_alive,
+            timeout_graceful_shutdown=int(self.graceful_timeout),
+        )
+
+    def spawn(self) -> int:
+        config = self.worker_config()
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return pid
+
+        # Worker. uvicorn restores these handlers when it stops and re-raises
+        # the signal it caught, so they must keep the worker alive long enough
+        # to exit normally and run its atexit hooks (log flush, hashing pool).
+        server = uvicorn.Server(config)
+        signal.signal(signal.SIGTERM, server.handle_exit)
+        signal.signal(signal.SIGINT, server.handle_exit)
+        random.seed()
+        code = 0
+        try:
+            server.run(sockets=[self.sock])
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        sys.exit(code)
+
+    def handle_stop(self, signum, frame) -> None:
+        self.stopping = True
+
+    def reap(self) -> bool:
+        """
+        Collects exited workers. Returns False when one failed to boot.
+        """
+        healthy = True
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                break
+            if pid == 0:
+                break
+            started = self.children.pop(pid, None)
+            if started is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            log(f"Worker {pid} exited with code {code}")
+            if code != 0 and time.monotonic() - started < MIN_WORKER_LIFETIME_SECONDS:
+                healthy = False
+        return healthy
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self.handle_stop)
+        signal.signal(signal.SIGINT, self.handle_stop)
+        exit_code = 0
+        while not self.stopping:
+            if not self.reap():
+                log("A worker failed to boot, shutting down")
+                exit_code = 1
+                break
+            while len(self.children) < self.workers and not self.stopping:
+                log(f"Booted worker {self.spawn()}")
+            time.sleep(REAP_INTERVAL_SECONDS)
+        self.stop()
+        return exit_code
+
+    def stop(self) -> None:
+        for pid in self.children:
+            os.kill(pid, signal.SIGTERM)
+        # uvicorn enforces the drain timeout itself; the margin covers the
+        # lifespan shutdown that follows it.
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self.children and time.monotonic() < deadline:
+            self.reap()
+            time.sleep(0.1)
+        for pid in list(self.children):
+            log(f"Killing worker {pid} after the graceful timeout")
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.children.clear()
+
+
+def parse_args(argv=None):
+    env = get_environment_variables()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default=env.API_HOST)
+    parser.add_argument("--port", type=int, default=env.API_PORT)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=env.SERVER_WORKERS or available_cpus(),
+        help="Worker processes, one per available CPU by default.",
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=env.SERVER_MAX_REQUESTS,
+        help="Recycle a worker after this many requests (0 disables it).",
+    )
+    parser.add_argument(
+        "--max-requests-jitter", type=int, default=env.SERVER_MAX_REQUESTS_JITTER
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=float,
+        default=env.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+    )
+    parser.add_argument("--keep-alive", type=int, default=env.SERVER_KEEPALIVE_SECONDS)
+    parser.add_argument("--backlog", type=int, default=env.SERVER_BACKLOG)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    env = get_environment_variables()
+    if env.HASHING_POOL_SIZE is None:
+        # Each worker owns a hashing pool; split the CPUs between them instead
+        # of starting one hashing process per CPU in every worker.
+        env.HASHING_POOL_SIZE = max(1, available_cpus() // args.workers)
+    temporary_metrics_dir = prepare_metrics_dir(env) if env.METRICS_ENABLED else None
+
+    from app.app_module import get_injector
+    from app.infrastructure.cache.invalidation_board import InvalidationBoard
+    from app.presentation.http.app import app
+
+    # Importing the app has no side effects; build the injector here so the
+    # workers inherit it instead of each building its own. The invalidation
+    # board must exist before the fork for the workers to share it.
+    get_injector().get(InvalidationBoard)
+
+    sock = bind_socket(args.host, args.port, args.backlog)
+    # Objects created by the preload are never freed; keeping them out of
+    # the collector stops GC passes from writing to (and copying) the pages
+    # the workers share.
+    gc.collect()
+    gc.freeze()
+
+    log(
+        f"Serving {APP} on {args.host}:{args.port} with {args.workers} workers "
+        f"({event_loop()}, {http_protocol()})"
+    )
+    supervisor = Supervisor(
+        app,
+        sock,
+        workers=args.workers,
+        max_requests=args.max_requests,
+        max_requests_jitter=args.max_requests_jitter,
+        graceful_timeout=args.graceful_timeout,
+        keep_alive=args.keep_alive,
+    )
+    try:
+        return supervisor.run()
+    finally:
+        sock.close()
+        if temporary_metrics_dir is not None:
+            shutil.rmtree(temporary_metrics_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
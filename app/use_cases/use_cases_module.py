@@ -1,16 +1,53 @@
 from injector import Module, inject, singleton
 from app.ports.use_cases.users import (
     CreateUserUseCase,
+    BulkCreateUsersUseCase,
+    ExportUsersUseCase,
     GetUserUseCase,
+    GetUserVersionUseCase,
+    GetUsersByIdsUseCase,
     UpdateUserUseCase,
     DeleteUserUseCase,
     ListUsersUseCase,
+    SearchUsersUseCase,
+    VerifyUserPasswordUseCase,
+    RehashUserPasswordUseCase,
+    AsyncCreateUserUseCase,
+    AsyncGetUserUseCase,
+    AsyncGetUserVersionUseCase,
+    AsyncGetUsersByIdsUseCase,
+    AsyncUpdateUserUseCase,
+    AsyncDeleteUserUseCase,
+    AsyncListUsersUseCase,
+    AsyncSearchUsersUseCase,
 )
 
 from app.use_cases.user.create_user import CreateUser
-from app.use_cases.user.get_user import GetUser, ListUsers
+from app.use_cases.user.bulk_create_users import BulkCreateUsers
+from app.use_cases.user.export_users import ExportUsers
+from app.use_cases.user.get_user import (
+    GetUser,
+    GetUserVersion,
+    GetUsersByIds,
+    ListUsers,
+    SearchUsers,
+)
 from app.use_cases.user.update_user import UpdateUser
 from app.use_cases.user.delete_user import DeleteUser
+from app.use_cases.user.verify_user_password import (
+    RehashUserPassword,
+    VerifyUserPassword,
+)
+from app.use_cases.user.asynchronous.create_user import AsyncCreateUser
+from app.use_cases.user.asynchronous.get_user import (
+    AsyncGetUser,
+    AsyncGetUserVersion,
+    AsyncGetUsersByIds,
+    AsyncListUsers,
+    AsyncSearchUsers,
+)
+from app.use_cases.user.asynchronous.update_user import AsyncUpdateUser
+from app.use_cases.user.asynchronous.delete_user import AsyncDeleteUser
 
 
 class UseCasesModule(Module):
@@ -18,7 +55,23 @@ class UseCasesModule(Module):
         super().configure(binder)
 
         binder.bind(CreateUserUseCase, to=CreateUser)
+        binder.bind(BulkCreateUsersUseCase, to=BulkCreateUsers)
         binder.bind(GetUserUseCase, to=GetUser)
+        binder.bind(GetUserVersionUseCase, to=GetUserVersion)
+        binder.bind(GetUsersByIdsUseCase, to=GetUsersByIds)
         binder.bind(UpdateUserUseCase, to=UpdateUser)
         binder.bind(DeleteUserUseCase, to=DeleteUser)
         binder.bind(ListUsersUseCase, to=ListUsers)
+        binder.bind(SearchUsersUseCase, to=SearchUsers)
+        binder.bind(ExportUsersUseCase, to=ExportUsers)
+        binder.bind(VerifyUserPasswordUseCase, to=VerifyUserPassword)
+        binder.bind(RehashUserPasswordUseCase, to=RehashUserPassword)
+
+        binder.bind(AsyncCreateUserUseCase, to=AsyncCreateUser)
+        binder.bind(AsyncGetUserUseCase, to=AsyncGetUser)
+        binder.bind(AsyncGetUserVersionUseCase, to=AsyncGetUserVersion)
+        binder.bind(AsyncGetUsersByIdsUseCase, to=AsyncGetUsersByIds)
+        binder.bind(AsyncUpdateUserUseCase, to=AsyncUpdateUser)
+        binder.bind(AsyncDeleteUserUseCase, to=AsyncDeleteUser)
+        binder.bind(AsyncListUsersUseCase, to=AsyncListUsers)
+        binder.bind(AsyncSearchUsersUseCase, to=AsyncSearchUsers)
@@ -0,0 +1,55 @@
+from injector import inject
+
+from app.domain.entities.users import UserCreate, UserResponse
+from app.ports.use_cases.users import (
+    AsyncCreateUserUseCase,
+)
+
+from app.ports.repositories import AsyncUserRepository
+
+from app.ports.transactional.transactional_atom import Atom, AsyncAtomClass
+from app.ports.transactional.transaction_manager import AsyncTransactionManagerPort
+from app.ports.services.hasher_service_port import (
+    AsyncHasherServicePort,
+    HashDataSchema,
+)
+
+
+@Atom.on_class
+class AsyncCreateUser(AsyncCreateUserUseCase, AsyncAtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: AsyncUserRepository,
+        transaction_manager: AsyncTransactionManagerPort,
+        hasher_service: AsyncHasherServicePort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+        self.hasher_service = hasher_service
+
+    async def before_transaction(self) -> None:
+        """
+        Hashes outside the transaction so the connection is not held during the KDF.
+        """
+        user_create_data: UserCreate = self.params.user
+
+        self.hashed_password = None
+        if hasattr(user_create_data, "email") and user_create_data.email:
+            self.hasher_service.set_params(
+                HashDataSchema(data_to_hash=user_create_data.email)
+            )
+            self.hashed_password = await self.hasher_service.execute()
+
+    async def execute(self) -> UserResponse:
+        """
+        Executes the logic to create a new user.
+        """
+        user_create_data: UserCreate = self.params.user
+
+        created_user = await self.user_service.add(
+            user_create_data, self.hashed_password
+        )
+
+        return created_user
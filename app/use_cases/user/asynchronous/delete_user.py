@@ -0,0 +1,36 @@
+from injector import inject
+from uuid import UUID
+
+from app.ports.use_cases.users import (
+    AsyncDeleteUserUseCase,
+)
+
+from app.ports.repositories import AsyncUserRepository
+
+from app.ports.cache import UserCachePort
+from app.ports.transactional.transactional_atom import Atom, AsyncAtomClass
+from app.ports.transactional.transaction_manager import AsyncTransactionManagerPort
+
+
+@Atom.on_class
+class AsyncDeleteUser(AsyncDeleteUserUseCase, AsyncAtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: AsyncUserRepository,
+        transaction_manager: AsyncTransactionManagerPort,
+        user_cache: UserCachePort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+        self.user_cache = user_cache
+
+    async def execute(self) -> bool:
+        """
+        Executes the logic to delete a user.
+        """
+        user_id: UUID = self.params.user_id
+        self.after_transaction_execute(lambda: self.user_cache.invalidate(user_id))
+        success = await self.user_service.delete(user_id=user_id)
+        return success
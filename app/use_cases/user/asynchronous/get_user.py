@@ -0,0 +1,150 @@
+from datetime import datetime
+from injector import inject
+from uuid import UUID
+from typing import List, Optional
+
+from app.domain.entities.users import UserBatch, UserPage, UserResponse
+from app.domain.value_objects.cursor import UserCursor, UserSearchCursor
+from app.domain.value_objects.search import search_terms
+from app.ports.use_cases.users import (
+    AsyncGetUserUseCase,
+    AsyncGetUserVersionUseCase,
+    AsyncGetUsersByIdsUseCase,
+    AsyncListUsersUseCase,
+    AsyncSearchUsersUseCase,
+)
+
+from app.ports.repositories import AsyncUserRepository
+from app.ports.transactional.transactional_atom import Atom, AsyncAtomClass
+from app.ports.transactional.transaction_manager import AsyncTransactionManagerPort
+
+
+@Atom.on_class(read_only=True)
+class AsyncGetUser(AsyncGetUserUseCase, AsyncAtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: AsyncUserRepository,
+        transaction_manager: AsyncTransactionManagerPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+
+    async def execute(self) -> Optional[UserResponse]:
+        """
+        Executes the logic to get a user by their ID.
+        """
+        user_id: UUID = self.params.user_id
+        user = await self.user_service.get_by_id(user_id=user_id)
+        return user
+
+
+@Atom.on_class(read_only=True)
+class AsyncGetUserVersion(AsyncGetUserVersionUseCase, AsyncAtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: AsyncUserRepository,
+        transaction_manager: AsyncTransactionManagerPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+
+    async def execute(self) -> Optional[datetime]:
+        """
+        Executes the logic to get when a user last changed, for conditional requests.
+        """
+        return await self.user_service.get_version(user_id=self.params.user_id)
+
+
+@Atom.on_class(read_only=True)
+class AsyncGetUsersByIds(AsyncGetUsersByIdsUseCase, AsyncAtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: AsyncUserRepository,
+        transaction_manager: AsyncTransactionManagerPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+
+    async def execute(self) -> UserBatch:
+        """
+        Executes the logic to get many users by their IDs with one lookup,
+        keeping the requested order and reporting the IDs not found.
+        """
+        user_ids: List[UUID] = self.params.user_ids
+        users = await self.user_service.get_many_by_ids(user_ids=user_ids)
+        found = {user.id for user in users}
+        missing = [
+            user_id for user_id in dict.fromkeys(user_ids) if user_id not in found
+        ]
+        return UserBatch(users=users, missing=missing)
+
+
+@Atom.on_class(read_only=True)
+class AsyncListUsers(AsyncListUsersUseCase, AsyncAtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: AsyncUserRepository,
+        transaction_manager: AsyncTransactionManagerPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+
+    async def execute(self) -> UserPage:
+        """
+        Executes the logic to list users with pagination and filters.
+        A cursor switches from offset to keyset pagination.
+        """
+        cursor = UserCursor.decode(self.params.cursor) if self.params.cursor else None
+        users = await self.user_service.get_all(
+            skip=self.params.skip,
+            limit=self.params.limit,
+            active=self.params.active,
+            cursor=cursor,
+        )
+
+        next_cursor = None
+        if users and len(users) == self.params.limit:
+            last = users[-1]
+            next_cursor = UserCursor(created_at=last.created_at, id=last.id).encode()
+        return UserPage(items=users, next_cursor=next_cursor)
+
+
+@Atom.on_class(read_only=True)
+class AsyncSearchUsers(AsyncSearchUsersUseCase, AsyncAtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: AsyncUserRepository,
+        transaction_manager: AsyncTransactionManagerPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+
+    async def execute(self) -> UserPage:
+        """
+        Executes the logic to search users by partial username, email or name,
+        most relevant first, with keyset pagination over the ranking.
+        """
+        if not search_terms(self.params.query):
+            return UserPage(items=[])
+        cursor = (
+            UserSearchCursor.decode(self.params.cursor) if self.params.cursor else None
+        )
+        hits = await self.user_service.search(
+            self.params.query, limit=self.params.limit, cursor=cursor
+        )
+
+        next_cursor = None
+        if hits and len(hits) == self.params.limit:
+            last, rank = hits[-1]
+            next_cursor = UserSearchCursor(rank=rank, username=last.username).encode()
+        return UserPage(items=[user for user, _ in hits], next_cursor=next_cursor)
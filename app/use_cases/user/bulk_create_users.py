@@ -0,0 +1,46 @@
+from typing import List
+
+from injector import inject
+
+from app.domain.entities.users import BulkCreateUserResult
+from app.ports.use_cases.users import BulkCreateUsersUseCase
+
+from app.ports.repositories import UserRepository
+
+from app.ports.transactional.transactional_atom import Atom, AtomClass
+from app.ports.transactional.transaction_manager import TransactionManagerPort
+from app.ports.services.hasher_service_port import (
+    BulkHasherServicePort,
+    BulkHashDataSchema,
+)
+
+
+@Atom.on_class
+class BulkCreateUsers(BulkCreateUsersUseCase, AtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: UserRepository,
+        transaction_manager: TransactionManagerPort,
+        bulk_hasher_service: BulkHasherServicePort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+        self.bulk_hasher_service = bulk_hasher_service
+
+    def before_transaction(self) -> None:
+        """
+        Hashes the whole batch across the pool before opening the transaction.
+        """
+        self.bulk_hasher_service.set_params(
+            BulkHashDataSchema(data_to_hash=[user.email for user in self.params.users])
+        )
+        self.hashed_passwords = self.bulk_hasher_service.execute()
+
+    def execute(self) -> List[BulkCreateUserResult]:
+        """
+        Inserts the batch in a single statement. Conflicting items are reported
+        per index instead of failing the whole request.
+        """
+        return self.user_service.add_many(self.params.users, self.hashed_passwords)
@@ -26,18 +26,25 @@ class CreateUser(CreateUserUseCase, AtomClass):
         self.transaction_manager = transaction_manager
         self.hasher_service = hasher_service
 
-    def execute(self) -> UserResponse:
+    def before_transaction(self) -> None:
         """
-        Executes the logic to create a new user.
+        Hashes outside the transaction so the connection is not held during the KDF.
         """
         user_create_data: UserCreate = self.params.user
 
+        self.hashed_password = None
         if hasattr(user_create_data, "email") and user_create_data.email:
             self.hasher_service.set_params(
                 HashDataSchema(data_to_hash=user_create_data.email)
             )
-            hashed_password = self.hasher_service.execute()
+            self.hashed_password = self.hasher_service.execute()
+
+    def execute(self) -> UserResponse:
+        """
+        Executes the logic to create a new user.
+        """
+        user_create_data: UserCreate = self.params.user
 
-        created_user = self.user_service.add(user_create_data, hashed_password)
+        created_user = self.user_service.add(user_create_data, self.hashed_password)
 
         return created_user
@@ -7,6 +7,7 @@ from app.ports.use_cases.users import (
 
 from app.ports.repositories import UserRepository
 
+from app.ports.cache import UserCachePort
 from app.ports.transactional.transactional_atom import Atom, AtomClass
 from app.ports.transactional.transaction_manager import TransactionManagerPort
 
@@ -18,15 +19,18 @@ class DeleteUser(DeleteUserUseCase, AtomClass):
         self,
         user_service: UserRepository,
         transaction_manager: TransactionManagerPort,
+        user_cache: UserCachePort,
     ):
         super().__init__()
         self.user_service = user_service
         self.transaction_manager = transaction_manager
+        self.user_cache = user_cache
 
     def execute(self) -> bool:
         """
         Executes the logic to delete a user.
         """
         user_id: UUID = self.params.user_id
+        self.after_transaction_execute(lambda: self.user_cache.invalidate(user_id))
         success = self.user_service.delete(user_id=user_id)
         return success
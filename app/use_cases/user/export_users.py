@@ -0,0 +1,38 @@
+from typing import Any, Dict, Iterator
+
+from injector import inject
+
+from app.config.environment import get_environment_variables
+from app.ports.use_cases.users import ExportUsersUseCase
+
+from app.ports.repositories import UserRepository
+from app.ports.transactional.transactional_atom import Atom, AtomClass
+from app.ports.transactional.transaction_manager import TransactionManagerPort
+
+
+# Not read-only: read-only sessions run in autocommit, and PostgreSQL
+# server-side cursors (yield_per) need an open transaction.
+@Atom.on_class
+class ExportUsers(ExportUsersUseCase, AtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: UserRepository,
+        transaction_manager: TransactionManagerPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+        self.batch_size = get_environment_variables().EXPORT_BATCH_SIZE
+
+    def execute(self) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the filtered users; the transaction stays open while the
+        caller consumes the rows.
+        """
+        yield from self.user_service.stream_all(
+            active=self.params.active,
+            created_from=self.params.created_from,
+            created_to=self.params.created_to,
+            batch_size=self.batch_size,
+        )
@@ -1,11 +1,17 @@
+from datetime import datetime
 from injector import inject
 from uuid import UUID
 from typing import List, Optional
 
-from app.domain.entities.users import UserResponse
+from app.domain.entities.users import UserBatch, UserPage, UserResponse
+from app.domain.value_objects.cursor import UserCursor, UserSearchCursor
+from app.domain.value_objects.search import search_terms
 from app.ports.use_cases.users import (
     GetUserUseCase,
+    GetUserVersionUseCase,
+    GetUsersByIdsUseCase,
     ListUsersUseCase,
+    SearchUsersUseCase,
 )
 
 from app.ports.repositories import UserRepository
@@ -13,7 +19,7 @@ from app.ports.transactional.transactional_atom import Atom, AtomClass
 from app.ports.transactional.transaction_manager import TransactionManagerPort
 
 
-@Atom.on_class
+@Atom.on_class(read_only=True)
 class GetUser(GetUserUseCase, AtomClass):
     @inject
     def __init__(
@@ -34,7 +40,52 @@ class GetUser(GetUserUseCase, AtomClass):
         return user
 
 
-@Atom.on_class
+@Atom.on_class(read_only=True)
+class GetUserVersion(GetUserVersionUseCase, AtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: UserRepository,
+        transaction_manager: TransactionManagerPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+
+    def execute(self) -> Optional[datetime]:
+        """
+        Executes the logic to get when a user last changed, for conditional requests.
+        """
+        return self.user_service.get_version(user_id=self.params.user_id)
+
+
+@Atom.on_class(read_only=True)
+class GetUsersByIds(GetUsersByIdsUseCase, AtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: UserRepository,
+        transaction_manager: TransactionManagerPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+
+    def execute(self) -> UserBatch:
+        """
+        Executes the logic to get many users by their IDs with one lookup,
+        keeping the requested order and reporting the IDs not found.
+        """
+        user_ids: List[UUID] = self.params.user_ids
+        users = self.user_service.get_many_by_ids(user_ids=user_ids)
+        found = {user.id for user in users}
+        missing = [
+            user_id for user_id in dict.fromkeys(user_ids) if user_id not in found
+        ]
+        return UserBatch(users=users, missing=missing)
+
+
+@Atom.on_class(read_only=True)
 class ListUsers(ListUsersUseCase, AtomClass):
     @inject
     def __init__(
@@ -46,11 +97,54 @@ class ListUsers(ListUsersUseCase, AtomClass):
         self.user_service = user_service
         self.transaction_manager = transaction_manager
 
-    def execute(self) -> List[UserResponse]:
+    def execute(self) -> UserPage:
         """
         Executes the logic to list users with pagination and filters.
+        A cursor switches from offset to keyset pagination.
         """
+        cursor = UserCursor.decode(self.params.cursor) if self.params.cursor else None
         users = self.user_service.get_all(
-            skip=self.params.skip, limit=self.params.limit, active=self.params.active
+            skip=self.params.skip,
+            limit=self.params.limit,
+            active=self.params.active,
+            cursor=cursor,
         )
-        return users
+
+        next_cursor = None
+        if users and len(users) == self.params.limit:
+            last = users[-1]
+            next_cursor = UserCursor(created_at=last.created_at, id=last.id).encode()
+        return UserPage(items=users, next_cursor=next_cursor)
+
+
+@Atom.on_class(read_only=True)
+class SearchUsers(SearchUsersUseCase, AtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: UserRepository,
+        transaction_manager: TransactionManagerPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+
+    def execute(self) -> UserPage:
+        """
+        Executes the logic to search users by partial username, email or name,
+        most relevant first, with keyset pagination over the ranking.
+        """
+        if not search_terms(self.params.query):
+            return UserPage(items=[])
+        cursor = (
+            UserSearchCursor.decode(self.params.cursor) if self.params.cursor else None
+        )
+        hits = self.user_service.search(
+            self.params.query, limit=self.params.limit, cursor=cursor
+        )
+
+        next_cursor = None
+        if hits and len(hits) == self.params.limit:
+            last, rank = hits[-1]
+            next_cursor = UserSearchCursor(rank=rank, username=last.username).encode()
+        return UserPage(items=[user for user, _ in hits], next_cursor=next_cursor)
@@ -3,12 +3,14 @@ from uuid import UUID
 from typing import Optional
 
 from app.domain.entities.users import UserUpdate, UserResponse
+from app.domain.exceptions import StaleUserVersionError
 from app.ports.use_cases.users import (
     UpdateUserUseCase,
 )
 
 from app.ports.repositories import UserRepository
 
+from app.ports.cache import UserCachePort
 from app.ports.transactional.transactional_atom import Atom, AtomClass
 from app.ports.transactional.transaction_manager import TransactionManagerPort
 from app.ports.services.hasher_service_port import HasherServicePort, HashDataSchema
@@ -22,26 +24,45 @@ class UpdateUser(UpdateUserUseCase, AtomClass):
         user_service: UserRepository,
         transaction_manager: TransactionManagerPort,
         hasher_service: HasherServicePort,
+        user_cache: UserCachePort,
     ):
         super().__init__()
         self.user_service = user_service
         self.hasher_service = hasher_service
         self.transaction_manager = transaction_manager
+        self.user_cache = user_cache
 
-    def execute(self) -> Optional[UserResponse]:
+    def before_transaction(self) -> None:
         """
-        Executes the logic to update an existing user.
+        Hashes outside the transaction so the connection is not held during the KDF.
         """
-        user_id: UUID = self.params.user_id
         user_update_data: UserUpdate = self.params.user
 
+        self.hashed_password = None
         if hasattr(user_update_data, "email") and user_update_data.email:
             self.hasher_service.set_params(
                 HashDataSchema(data_to_hash=user_update_data.email)
             )
-            user_update_data.hashed_password = self.hasher_service.execute()
+            self.hashed_password = self.hasher_service.execute()
+
+    def execute(self) -> Optional[UserResponse]:
+        """
+        Executes the logic to update an existing user, optionally only while
+        it is still at one of `expected_versions` (If-Match).
+        """
+        user_id: UUID = self.params.user_id
+        user_update_data: UserUpdate = self.params.user
 
+        self.after_transaction_execute(lambda: self.user_cache.invalidate(user_id))
         updated_user = self.user_service.update(
-            user_id=user_id, user_data=user_update_data
+            user_id=user_id,
+            user_data=user_update_data,
+            hashed_password=self.hashed_password,
+            expected_versions=self.params.expected_versions,
         )
+        if updated_user is None and self.params.expected_versions is not None:
+            # The guarded UPDATE matched nothing: tell a stale version apart
+            # from a missing user. A cached version could outlive a delete.
+            if self.user_service.get_stored_version(user_id) is not None:
+                raise StaleUserVersionError("User was modified since it was read")
         return updated_user
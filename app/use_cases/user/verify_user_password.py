@@ -0,0 +1,89 @@
+from injector import inject
+from typing import Optional
+
+from app.ports.use_cases.users import (
+    RehashUserPasswordUseCase,
+    VerifyUserPasswordUseCase,
+)
+
+from app.ports.repositories import UserRepository
+
+from app.ports.cache import UserCachePort
+from app.ports.transactional.transactional_atom import Atom, AtomClass
+from app.ports.transactional.transaction_manager import TransactionManagerPort
+from app.ports.services.hasher_service_port import (
+    PasswordRehashPort,
+    VerifyDataSchema,
+    VerifyDataServicePort,
+)
+
+
+@Atom.on_class(read_only=True)
+class VerifyUserPassword(VerifyUserPasswordUseCase, AtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: UserRepository,
+        transaction_manager: TransactionManagerPort,
+        verifier_service: VerifyDataServicePort,
+        password_rehasher: PasswordRehashPort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+        self.verifier_service = verifier_service
+        self.password_rehasher = password_rehasher
+
+    def execute(self) -> Optional[str]:
+        """
+        Reads the user's stored hash; `after_transaction` checks the password
+        against it once the session is closed, so the connection is not held
+        during the KDF.
+        """
+        return self.user_service.get_password_hash(self.params.user_id)
+
+    def after_transaction(self, hashed_password: Optional[str]) -> Optional[bool]:
+        """
+        Checks the password against the stored hash. A valid password whose
+        hash uses outdated parameters is rehashed in the background, so a new
+        cost rolls out as users authenticate. Returns None when the user does
+        not exist.
+        """
+        if hashed_password is None:
+            return None
+
+        user_id = self.params.user_id
+        password = self.params.password
+        self.verifier_service.set_params(
+            VerifyDataSchema(plain_data=password, hashed_data=hashed_password)
+        )
+        result = self.verifier_service.execute()
+        if result.is_valid and result.needs_update:
+            self.password_rehasher.schedule(user_id, password, hashed_password)
+        return result.is_valid
+
+
+@Atom.on_class
+class RehashUserPassword(RehashUserPasswordUseCase, AtomClass):
+    @inject
+    def __init__(
+        self,
+        user_service: UserRepository,
+        transaction_manager: TransactionManagerPort,
+        user_cache: UserCachePort,
+    ):
+        super().__init__()
+        self.user_service = user_service
+        self.transaction_manager = transaction_manager
+        self.user_cache = user_cache
+
+    def execute(self) -> bool:
+        """
+        Stores a new hash for the user unless the stored one changed since it
+        was verified.
+        """
+        user_id = self.params.user_id
+        self.after_transaction_execute(lambda: self.user_cache.invalidate(user_id))
+        return self.user_service.replace_password_hash(
+            user_id, self.params.current_hash, self.params.new_hash
+        )
@@ -0,0 +1,104 @@
+"""
+Per-execution overhead of handing the transaction's session to a use case's
+repositories: the reflective attribute walk Atom used to do versus binding the
+session in the transaction context.
+
+    python -m benchmarks.atom_propagation
+"""
+
+import inspect
+import timeit
+from contextlib import contextmanager
+
+from app.ports.transactional.transaction_context import bind_session, reset_session
+from app.ports.transactional.transaction_executor import TransactionExecutor
+from app.ports.transactional.transaction_manager import TransactionManagerPort
+from app.ports.transactional.transactional_atom import Atom, AtomClass
+from app.ports.transactional.transactionable import Transactionable
+
+ITERATIONS = 20000
+
+
+class NullTransactionManager(TransactionManagerPort[object]):
+    @contextmanager
+    def get_transaction_context(self, read_only=False):
+        yield object()
+
+
+class Repository(Transactionable):
+    def __init__(self):
+        self.db_handler = TransactionExecutor(logger=None)
+
+
+class CachedRepository(Transactionable):
+    def __init__(self):
+        self.repository = Repository()
+
+
+@Atom.on_class
+class UseCase(AtomClass):
+    def __init__(self):
+        self.user_service = CachedRepository()
+        self.transaction_manager = NullTransactionManager()
+
+    def execute(self):
+        pass
+
+
+def legacy_walk(instance, session):
+    """The inspect.getmembers walk Atom ran before and after every execution."""
+    for attr_name, attr_value in inspect.getmembers(instance):
+        if (
+            not attr_name.startswith("__")
+            and not inspect.ismethod(attr_value)
+            and isinstance(attr_value, Transactionable)
+        ):
+            legacy_set_transaction_context(attr_value, session)
+
+
+def legacy_set_transaction_context(transactionable, session):
+    transactionable.session = session
+    for attr_name, attr_value in inspect.getmembers(transactionable):
+        if not attr_name.startswith("__") and not inspect.ismethod(attr_value):
+            if isinstance(attr_value, Transactionable):
+                legacy_set_transaction_context(attr_value, session)
+            elif isinstance(attr_value, TransactionExecutor):
+                attr_value.set_transaction_context(session)
+
+
+def reflective_propagation(use_case, session):
+    legacy_walk(use_case, session)
+    legacy_walk(use_case, None)
+
+
+def context_propagation(use_case, session):
+    reset_session(bind_session(session))
+
+
+def report(name, seconds):
+    print(f"{name:<28} {seconds / ITERATIONS * 1e6:8.2f} us/call")
+
+
+def main():
+    use_case = UseCase()
+    session = object()
+    report(
+        "getmembers walk (before)",
+        timeit.timeit(
+            lambda: reflective_propagation(use_case, session), number=ITERATIONS
+        ),
+    )
+    report(
+        "contextvar binding (after)",
+        timeit.timeit(
+            lambda: context_propagation(use_case, session), number=ITERATIONS
+        ),
+    )
+    report(
+        "Atom execute, end to end",
+        timeit.timeit(use_case.execute, number=ITERATIONS),
+    )
+
+
+if __name__ == "__main__":
+    main()
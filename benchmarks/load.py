@@ -0,0 +1,329 @@
+"""
+HTTP load scenario for the users API. Starts the app under uvicorn with the
+current environment (point DATABASE_URL or DB_* at a local PostgreSQL, or at
+a SQLite file as a stand-in), seeds users, then drives each endpoint with a
+fixed number of concurrent clients and reports RPS and p50/p95/p99 latency.
+
+    python -m benchmarks.load --output .benchmarks/load-$(git rev-parse --short HEAD).json
+    python -m benchmarks.load --compare .benchmarks/load-abc1234.json
+
+`--base-url` targets an already running server instead of starting one.
+`--server serve --workers N` starts the production launcher (`app.serve`)
+instead of a single uvicorn process, to compare the two.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import signal
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+API_PREFIX = "/api/v1"
+SEED_BATCH_SIZE = 500
+BATCH_GET_SIZE = 25
+# Generous, so slow hashing under load shows up as latency rather than errors.
+REQUEST_TIMEOUT_SECONDS = 60.0
+
+Request = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+@dataclass
+class ScenarioResult:
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(fraction * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> ScenarioResult:
+    latencies = sorted(latencies)
+    return ScenarioResult(
+        requests=len(latencies),
+        errors=errors,
+        rps=round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        p50_ms=round(percentile(latencies, 0.50) * 1e3, 2),
+        p95_ms=round(percentile(latencies, 0.95) * 1e3, 2),
+        p99_ms=round(percentile(latencies, 0.99) * 1e3, 2),
+    )
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, request: Request, duration: float, concurrency: int
+) -> ScenarioResult:
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await request(client)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def user_payload(tag: str) -> dict:
+    return {
+        "username": f"load{tag}",
+        "email": f"load{tag}@example.com",
+        "first_name": "Load",
+        "last_name": "Test",
+    }
+
+
+async def seed_users(client: httpx.AsyncClient, count: int) -> List[str]:
+    run_id = uuid.uuid4().hex[:8]
+    ids = []
+    for start in range(0, count, SEED_BATCH_SIZE):
+        batch = [
+            user_payload(f"{run_id}{index}")
+            for index in range(start, min(start + SEED_BATCH_SIZE, count))
+        ]
+        response = await client.post(
+            f"{API_PREFIX}/users/bulk", json={"users": batch}, timeout=None
+        )
+        response.raise_for_status()
+        ids += [result["user"]["id"] for result in response.json() if result["user"]]
+    return ids
+
+
+def scenarios(user_ids: List[str]) -> Dict[str, Request]:
+    def get_user(client):
+        return client.get(f"{API_PREFIX}/users/{random.choice(user_ids)}")
+
+    def list_users(client):
+        return client.get(f"{API_PREFIX}/users/", params={"limit": 50})
+
+    def batch_get_users(client):
+        ids = random.sample(user_ids, min(BATCH_GET_SIZE, len(user_ids)))
+        return client.post(f"{API_PREFIX}/users/batch-get", json={"ids": ids})
+
+    def update_user(client):
+        return client.put(
+            f"{API_PREFIX}/users/{random.choice(user_ids)}",
+            json={"first_name": random.choice(["Ada", "Grace", "Alan"])},
+        )
+
+    def create_user(client):
+        return client.post(f"{API_PREFIX}/users/", json=user_payload(uuid.uuid4().hex))
+
+    return {
+        "get_user": get_user,
+        "list_users": list_users,
+        "batch_get_users": batch_get_users,
+        "update_user": update_user,
+        "create_user": create_user,
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_command(server: str, port: int, workers: Optional[int]) -> List[str]:
+    if server == "serve":
+        command = [sys.executable, "-m", "app.serve", "--port", str(port)]
+        if workers:
+            command += ["--workers", str(workers)]
+    else:
+        command = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.presentation.http.app:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ]
+    return command + ["--host", "127.0.0.1"]
+
+
+def start_server(
+    port: int, server: str = "uvicorn", workers: Optional[int] = None
+) -> subprocess.Popen:
+    return subprocess.Popen(
+        server_command(server, port, workers),
+        env=os.environ.copy(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        # Own process group, so stopping it also stops the hashing pool workers.
+        start_new_session=True,
+    )
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.terminate()
+    server.wait()
+    # Hashing pool workers inherit uvicorn's SIGTERM handler and outlive it.
+    try:
+        os.killpg(server.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            await client.get(f"{API_PREFIX}/diagnostics/cache")
+            return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        port = free_port()
+        server = start_server(port, args.server, args.workers)
+        base_url = f"http://127.0.0.1:{port}"
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(
+            base_url=base_url, limits=limits, timeout=REQUEST_TIMEOUT_SECONDS
+        ) as client:
+            await wait_until_ready(client)
+            user_ids = await seed_users(client, args.users)
+            available = scenarios(user_ids)
+            selected = args.scenario or list(available)
+            results = {}
+            for name in selected:
+                results[name] = await run_scenario(
+                    client, available[name], args.duration, args.concurrency
+                )
+                print(format_row(name, results[name]), flush=True)
+    finally:
+        if server is not None:
+            stop_server(server)
+
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "database": os.environ.get("DATABASE_URL", "").partition(":")[0]
+        or os.environ.get("DB_DIALECT"),
+        "settings": {
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "users": args.users,
+            "server": args.server if args.base_url is None else args.base_url,
+            "workers": args.workers,
+        },
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+
+
+HEADER = f"{'scenario':<18}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+
+
+def format_row(name: str, result: ScenarioResult) -> str:
+    return (
+        f"{name:<18}{result.requests:>10}{result.errors:>8}{result.rps:>10}"
+        f"{result.p50_ms:>10}{result.p95_ms:>10}{result.p99_ms:>10}"
+    )
+
+
+def compare(baseline: dict, current: dict) -> None:
+    """Prints the relative change of every metric against a previous run."""
+    print(f"baseline {baseline.get('commit')} -> current {current.get('commit')}")
+    print(f"{'scenario':<18}{'metric':<8}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        for metric in ("rps", "p50_ms", "p95_ms", "p99_ms"):
+            before, after = previous[metric], result[metric]
+            change = f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+            print(f"{name:<18}{metric:<8}{before:>12}{after:>12}{change:>10}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", help="Target a running server.")
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="Seconds per scenario."
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--users", type=int, default=1000, help="Users seeded first.")
+    parser.add_argument(
+        "--scenario", action="append", help="Run only this scenario (repeatable)."
+    )
+    parser.add_argument(
+        "--server",
+        choices=("uvicorn", "serve"),
+        default="uvicorn",
+        help="Start a single uvicorn process or the app.serve launcher.",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes for --server serve."
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument(
+        "--compare", help="Results JSON of a previous run to diff against."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(HEADER)
+    report = asyncio.run(run(args))
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(json.load(baseline), report)
+
+
+if __name__ == "__main__":
+    main()
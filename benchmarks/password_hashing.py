@@ -0,0 +1,126 @@
+"""
+Throughput and memory per hash of each supported password hashing scheme with
+the parameters configured in the environment (PASSWORD_HASH_PROFILE, BCRYPT_*,
+ARGON2_*, SCRYPT_*).
+
+    python -m benchmarks.password_hashing
+    python -m benchmarks.password_hashing --hashes 20 --workers 4
+
+Each scheme runs in fresh processes, so the peak resident memory they report
+is the KDF's own; it is read from /proc and reported as 0 off Linux.
+Throughput is measured on one core and across `--workers` processes hashing
+at once, as the HashingExecutor pool does; memory-hard schemes stop scaling
+once their combined memory no longer fits in cache.
+"""
+
+import argparse
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from time import perf_counter
+from typing import Any, Dict, NamedTuple
+
+from passlib.context import CryptContext
+from passlib.exc import MissingBackendError
+
+from app.config.settings import PASSWORD_HASH_SCHEMES, get_settings
+
+PASSWORD = "correct horse battery staple"
+
+
+class SchemeResult(NamedTuple):
+    scheme: str
+    ms_per_hash: float
+    hashes_per_second: float
+    parallel_hashes_per_second: float
+    peak_memory_kib: int
+
+
+def scheme_settings(scheme: str) -> Dict[str, Any]:
+    return {**get_settings().crypt_context_settings, "default": scheme}
+
+
+def peak_memory_kib() -> int:
+    """
+    Peak resident memory of this process. Read from VmHWM rather than
+    ru_maxrss, which keeps the parent's peak across the exec of a spawned
+    worker.
+    """
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    return 0
+
+
+def hash_timings(settings: Dict[str, Any], hashes: int):
+    """
+    Runs in a fresh process: hashes `hashes` times and returns the time of
+    each hash and the growth of the process's peak resident memory in KiB.
+    """
+    context = CryptContext(**settings)
+    baseline = peak_memory_kib()
+    timings = []
+    for _ in range(hashes):
+        started = perf_counter()
+        context.hash(PASSWORD)
+        timings.append(perf_counter() - started)
+    return timings, peak_memory_kib() - baseline
+
+
+def measure(scheme: str, hashes: int, workers: int) -> SchemeResult:
+    settings = scheme_settings(scheme)
+    spawn = get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+        timings, peak_kib = pool.submit(hash_timings, settings, hashes).result()
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as pool:
+        # Warm the workers up so process start-up is not counted.
+        list(pool.map(hash_timings, [settings] * workers, [1] * workers))
+        started = perf_counter()
+        list(pool.map(hash_timings, [settings] * workers, [hashes] * workers))
+        elapsed = perf_counter() - started
+
+    median = statistics.median(timings)
+    return SchemeResult(
+        scheme,
+        median * 1000,
+        1 / median,
+        workers * hashes / elapsed,
+        peak_kib,
+    )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.password_hashing")
+    parser.add_argument("--hashes", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'scheme':<8}{'ms/hash':>10}{'hash/s':>10}"
+        f"{f'hash/s x{args.workers}':>14}{'peak KiB':>12}  parameters"
+    )
+    for scheme in PASSWORD_HASH_SCHEMES:
+        try:
+            CryptContext(**scheme_settings(scheme)).handler(scheme).get_backend()
+        except MissingBackendError as e:
+            print(f"{scheme:<8}skipped: {e}", file=sys.stderr)
+            continue
+        result = measure(scheme, args.hashes, args.workers)
+        parameters = ", ".join(
+            f"{key.split('__', 1)[1]}={value}"
+            for key, value in scheme_settings(scheme).items()
+            if key.startswith(f"{scheme}__")
+        )
+        print(
+            f"{result.scheme:<8}{result.ms_per_hash:>10.1f}"
+            f"{result.hashes_per_second:>10.1f}"
+            f"{result.parallel_hashes_per_second:>14.1f}"
+            f"{result.peak_memory_kib:>12}  {parameters}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Cost of turning a 1,000-user page into the JSON body of GET /users: the
+previous path (ORM object -> model_validate -> .dict() -> UserResponseApiSchema
+-> FastAPI response_model validation and serialization -> json.dumps) versus
+building the domain users from rows without validation and encoding them once.
+
+    python -m benchmarks.response_serialization
+"""
+
+import json
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.domain.entities.users import UserInDBBase, UserRole
+from app.infrastructure.database.models import USER_COLUMNS, UserModel, row_to_user
+from app.presentation.http.responses import users_response
+from app.presentation.http.schemas.users import UserResponseApiSchema
+
+PAGE_SIZE = 1000
+ITERATIONS = 50
+
+response_model = TypeAdapter(List[UserResponseApiSchema])
+
+
+def make_rows():
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "username": f"user{i}",
+            "email": f"user{i}@example.com",
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "role": UserRole.USER,
+            "hashed_password": "$2b$12$" + "x" * 53,
+            "created_at": created_at + timedelta(seconds=i),
+            "updated_at": created_at + timedelta(seconds=i),
+            "deleted_at": None,
+            "active": True,
+        }
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def validated_path(models):
+    users = [UserInDBBase.model_validate(model) for model in models]
+    content = [UserResponseApiSchema(**user.dict()) for user in users]
+    value = response_model.validate_python(content, from_attributes=True)
+    return json.dumps(
+        response_model.dump_python(value, mode="json"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def pre_serialized_path(rows):
+    return users_response([row_to_user(row) for row in rows]).body
+
+
+def report(name, seconds):
+    print(f"{name:<34} {seconds / ITERATIONS * 1e3:8.2f} ms/page")
+
+
+def main():
+    rows = make_rows()
+    models = [UserModel(**row) for row in rows]
+    assert {column.key for column in USER_COLUMNS} == set(rows[0])
+    assert json.loads(validated_path(models)) == json.loads(pre_serialized_path(rows))
+
+    print(f"{PAGE_SIZE} users per page")
+    report(
+        "validate + response_model (before)",
+        timeit.timeit(lambda: validated_path(models), number=ITERATIONS),
+    )
+    report(
+        "construct + dump_json (after)",
+        timeit.timeit(lambda: pre_serialized_path(rows), number=ITERATIONS),
+    )
+
+
+if __name__ == "__main__":
+    main()
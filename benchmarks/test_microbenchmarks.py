@@ -0,0 +1,67 @@
+"""
+pytest-benchmark microbenchmarks for the per-request hot paths. They are kept
+out of the default test run; run and compare them with:
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.app_module import get_injector
+from app.infrastructure.database.models import UserModel, row_to_user
+from app.infrastructure.security.crypt_constext import get_crypt_context
+from app.ports.use_cases.users import GetUserUseCase, ListUsersUseCase
+from app.presentation.http.responses import users_response
+from benchmarks.atom_propagation import UseCase
+from benchmarks.response_serialization import make_rows
+
+PASSWORD = "correct horse battery staple"
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return make_rows()
+
+
+class TestHashing:
+
+    def test_hash(self, benchmark):
+        crypt_context = get_crypt_context()
+        benchmark.pedantic(crypt_context.hash, args=(PASSWORD,), rounds=5)
+
+    def test_verify(self, benchmark):
+        crypt_context = get_crypt_context()
+        hashed = crypt_context.hash(PASSWORD)
+        benchmark.pedantic(crypt_context.verify, args=(PASSWORD, hashed), rounds=5)
+
+
+class TestDependencyInjection:
+
+    def test_resolve_get_user(self, benchmark):
+        benchmark(get_injector().get, GetUserUseCase)
+
+    def test_resolve_list_users(self, benchmark):
+        benchmark(get_injector().get, ListUsersUseCase)
+
+
+class TestRowMapping:
+
+    def test_to_pydantic(self, benchmark, rows):
+        model = UserModel(**rows[0])
+        benchmark(model.to_pydantic)
+
+    def test_row_to_user(self, benchmark, rows):
+        benchmark(row_to_user, rows[0])
+
+    def test_users_response_page(self, benchmark, rows):
+        users = [row_to_user(row) for row in rows]
+        benchmark(users_response, users)
+
+
+class TestAtom:
+
+    def test_execute_overhead(self, benchmark):
+        benchmark(UseCase().execute)
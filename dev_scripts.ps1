@@ -43,6 +43,11 @@ function RunProd {
     & $Uvicorn $MainApp --host $ProjectHost --port $Port
 }
 
+# Create the database, tables and indexes
+function BootstrapDatabase {
+    & $Python -m app.presentation.cli.db bootstrap
+}
+
 # Run tests
 function RunTests {
     & $Pytest
@@ -118,6 +123,7 @@ while ($true) {
     Write-Host "14. Terraform Plan"
     Write-Host "15. Terraform Apply"
     Write-Host "16. Terraform Destroy"
+    Write-Host "17. Bootstrap database"
     Write-Host "q. Quit"
 
     $selection = $(Read-Host "Enter the action number").Trim().ToLower()
@@ -139,6 +145,7 @@ while ($true) {
         "14" { TerraformPlan }
         "15" { TerraformApply }
         "16" { TerraformDestroy }
+        "17" { BootstrapDatabase }
         "q" { Write-Host "Exiting..." -ForegroundColor Green; exit }
         default { Write-Host "Invalid option." -ForegroundColor Red }
     }
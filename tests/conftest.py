@@ -1,3 +1,12 @@
+import os
+
+# Cheapest KDF parameters for the whole suite: integration tests hash on
+# every create and update. Must be set before the app reads its settings.
+os.environ.setdefault("PASSWORD_HASH_PROFILE", "test")
+# Deliver outbox events to an in-process queue the tests can read.
+os.environ.setdefault("OUTBOX_SINK", "memory")
+os.environ.setdefault("OUTBOX_POLL_INTERVAL_SECONDS", "0.1")
+
 import pytest
 from fastapi.testclient import TestClient
 from app.presentation.http.app import app as fastapi_app
@@ -12,6 +21,9 @@ from app.infrastructure.infrastructure_module import InfrastructureModule
 from app.ports.transactional.transaction_manager import TransactionManagerPort
 from contextlib import contextmanager
 from typing import Iterable
+from app.config.config_module import get_engine
+from app.infrastructure.database.bootstrap import bootstrap_database
+from app.infrastructure.logging import ConsoleLoggerService
 
 
 def in_memory_user_repo():
@@ -22,7 +34,7 @@ def in_memory_user_repo():
 
 class TransactionManager(TransactionManagerPort[bool]):
     @contextmanager
-    def get_transaction_context(self) -> Iterable[bool]:
+    def get_transaction_context(self, read_only: bool = False) -> Iterable[bool]:
         try:
             yield True
         except Exception as e:
@@ -31,8 +43,16 @@ class TransactionManager(TransactionManagerPort[bool]):
             pass
 
 
+@pytest.fixture(scope="session")
+def database_schema():
+    engine = get_engine()
+    bootstrap_database(engine, ConsoleLoggerService())
+    yield
+    engine.dispose()
+
+
 @pytest.fixture(scope="function")
-def client():
+def client(database_schema):
     class TestSpecificInfrastructureModule(Module):
         def configure(self, binder):
 
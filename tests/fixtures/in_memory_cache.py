@@ -0,0 +1,34 @@
+from typing import Any, Dict, Optional
+
+from app.ports.cache import CacheServicePort, CacheStats
+
+
+class InMemorySharedCache(CacheServicePort):
+    """
+    Local stand-in for a cache backend shared between workers.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, Any] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        if key in self._values:
+            self._hits += 1
+            return self._values[key]
+        self._misses += 1
+        return None
+
+    def set(self, key: str, value: Any, stamp: Optional[int] = None) -> None:
+        self._values[key] = value
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, size=len(self._values))
+
+    def clear(self):
+        self._values = {}
@@ -1,12 +1,14 @@
 import uuid
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from app.domain.entities.users import (
     UserCreate,
     UserUpdate,
     UserInDBBase,
 )
+from app.domain.value_objects.cursor import UserSearchCursor
+from app.domain.value_objects.search import relevance, search_terms
 from app.ports.repositories import UserRepository
 
 
@@ -17,6 +19,17 @@ class InMemoryUserRepository(UserRepository):
     def get_by_id(self, user_id: UUID) -> Optional[UserInDBBase]:
         return self._users.get(user_id)
 
+    def get_version(self, user_id: UUID) -> Optional[datetime]:
+        user = self._users.get(user_id)
+        return user.updated_at if user else None
+
+    def get_stored_version(self, user_id: UUID) -> Optional[datetime]:
+        return self.get_version(user_id)
+
+    def get_password_hash(self, user_id: UUID) -> Optional[str]:
+        user = self._users.get(user_id)
+        return user.hashed_password if user else None
+
     def get_by_username(self, username: str) -> Optional[UserInDBBase]:
         for user in self._users.values():
             if user.username == username:
@@ -33,6 +46,27 @@ class InMemoryUserRepository(UserRepository):
         all_users = list(self._users.values())
         return all_users[skip : skip + limit]
 
+    def search(
+        self, query: str, limit: int = 20, cursor: Optional[UserSearchCursor] = None
+    ) -> List[Tuple[UserInDBBase, int]]:
+        terms = search_terms(query)
+        hits = []
+        for user in self._users.values():
+            rank = relevance(
+                terms,
+                username=user.username,
+                email=user.email,
+                first_name=user.first_name,
+                last_name=user.last_name,
+            )
+            if rank:
+                hits.append((user, rank))
+        hits.sort(key=lambda hit: (-hit[1], hit[0].username))
+        if cursor is not None:
+            after = (-cursor.rank, cursor.username)
+            hits = [hit for hit in hits if (-hit[1], hit[0].username) > after]
+        return hits[:limit]
+
     def add(self, user_entity: UserCreate) -> UserInDBBase:
         if self.get_by_username(user_entity.username):
             raise ValueError(
@@ -73,6 +107,15 @@ class InMemoryUserRepository(UserRepository):
         self._users[user_id] = updated_user
         return updated_user
 
+    def replace_password_hash(
+        self, user_id: UUID, current_hash: str, new_hash: str
+    ) -> bool:
+        user = self._users.get(user_id)
+        if user is None or user.hashed_password != current_hash:
+            return False
+        self._users[user_id] = user.model_copy(update={"hashed_password": new_hash})
+        return True
+
     def delete(self, user_id: UUID) -> bool:
         if user_id in self._users:
             del self._users[user_id]
@@ -1,7 +1,17 @@
+import csv
+import io
+import json
+import queue
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from faker import Faker
+from app.app_module import get_injector
 from app.config.settings import get_settings
+from app.domain.entities.events import UserEventType
+from app.infrastructure.tracing import InMemorySpanExporter
+from app.ports.events import EventSinkPort
+from app.ports.tracing import NoopSpanExporter, set_span_exporter
 
 settings = get_settings()
 
@@ -160,6 +170,51 @@ class TestUserCRUD:
         assert "detail" in error_data
         assert any(err["loc"] == ["body", "role"] for err in error_data["detail"])
 
+    def test_bulk_create_users_reports_conflicts_per_item(self, client, created_user):
+        # GIVEN: A batch mixing new users, an existing email and an in-batch duplicate
+        def payload(suffix):
+            return {
+                "username": f"bulk{suffix}",
+                "email": f"bulk{suffix}@example.com",
+                "first_name": "Bulk",
+                "last_name": "User",
+            }
+
+        first, second = uuid.uuid4().hex[:12], uuid.uuid4().hex[:12]
+        existing = {**payload(uuid.uuid4().hex[:12]), "email": created_user["email"]}
+        batch = [payload(first), existing, payload(second), payload(first)]
+
+        # WHEN: A POST request is made to /users/bulk
+        response = client.post(
+            f"{settings.API_V1_STR}/users/bulk", json={"users": batch}
+        )
+
+        # THEN: Every item gets a result, in request order
+        assert response.status_code == 200
+        results = response.json()
+        assert [result["index"] for result in results] == [0, 1, 2, 3]
+        assert [result["status"] for result in results] == [
+            "created",
+            "conflict",
+            "created",
+            "conflict",
+        ]
+
+        # AND: Created users are persisted and conflicts explain themselves
+        assert results[1]["detail"] == "Email already exists"
+        created_id = results[2]["user"]["id"]
+        response = client.get(f"{settings.API_V1_STR}/users/{created_id}")
+        assert response.status_code == 200
+        assert response.json()["username"] == f"bulk{second}"
+
+    def test_bulk_create_users_rejects_empty_batch(self, client):
+        # GIVEN: An empty batch
+        # WHEN: A POST request is made to /users/bulk
+        response = client.post(f"{settings.API_V1_STR}/users/bulk", json={"users": []})
+
+        # THEN: The request is rejected by validation
+        assert response.status_code == 422
+
     def test_get_user_by_id_successfully(self, client, created_user):
         # GIVEN: A user exists in the system (using the created_user fixture)
         user_id = created_user["id"]
@@ -199,6 +254,140 @@ class TestUserCRUD:
             response.status_code == 422
         )  # FastAPI handles this for typed path parameters
 
+    def test_batch_get_users_keeps_order_and_reports_missing(
+        self, client, unique_user_payload
+    ):
+        # GIVEN: Two existing users and an ID that does not exist
+        user_ids = []
+        for suffix in ("a", "b"):
+            payload = {
+                **unique_user_payload,
+                "username": unique_user_payload["username"] + suffix,
+                "email": suffix + unique_user_payload["email"],
+            }
+            response = client.post(f"{settings.API_V1_STR}/users/", json=payload)
+            assert response.status_code == 201
+            user_ids.append(response.json()["id"])
+        missing_id = str(uuid.uuid4())
+
+        # WHEN: They are requested in one batch, with a repeated ID
+        response = client.post(
+            f"{settings.API_V1_STR}/users/batch-get",
+            json={"ids": [user_ids[1], missing_id, user_ids[0], user_ids[1]]},
+        )
+
+        # THEN: Found users come back once each, in request order
+        assert response.status_code == 200
+        data = response.json()
+        assert [user["id"] for user in data["users"]] == [user_ids[1], user_ids[0]]
+        assert "hashed_password" not in data["users"][0]
+
+        # AND: The unknown ID is reported as missing
+        assert data["missing"] == [missing_id]
+
+    def test_search_users_ranks_matches_and_paginates(self, client):
+        # GIVEN: Users sharing a unique tag, matching "ada" in different fields
+        tag = uuid.uuid4().hex[:10]
+        users = [
+            ("bob", "Bob", "Adams"),
+            ("ada", "Ada", "Lovelace"),
+            ("grace", "Grace", "Hopper"),
+        ]
+        response = client.post(
+            f"{settings.API_V1_STR}/users/bulk",
+            json={
+                "users": [
+                    {
+                        "username": f"{name}{tag}",
+                        "email": f"{name}{tag}@example.com",
+                        "first_name": first_name,
+                        "last_name": last_name,
+                    }
+                    for name, first_name, last_name in users
+                ]
+            },
+        )
+        assert response.status_code == 200
+
+        # WHEN: They are searched by "ada" and the tag, one per page
+        url = f"{settings.API_V1_STR}/users/search"
+        first = client.get(url, params={"q": f"ADA {tag}", "limit": 1})
+        second = client.get(
+            url,
+            params={
+                "q": f"ada {tag}",
+                "limit": 1,
+                "cursor": first.headers["X-Next-Cursor"],
+            },
+        )
+
+        # THEN: The username prefix match ranks above the last name prefix match
+        assert first.status_code == 200
+        assert [user["username"] for user in first.json()] == [f"ada{tag}"]
+        assert [user["username"] for user in second.json()] == [f"bob{tag}"]
+
+        # AND: Users not matching every term are left out
+        everyone = client.get(url, params={"q": f"ada {tag}", "limit": 3})
+        assert len(everyone.json()) == 2
+        assert "X-Next-Cursor" not in everyone.headers
+
+    def test_search_users_validates_query(self, client):
+        # GIVEN/WHEN: A one-character query and a tampered cursor
+        url = f"{settings.API_V1_STR}/users/search"
+        too_short = client.get(url, params={"q": "a"})
+        bad_cursor = client.get(url, params={"q": "ada", "cursor": "not-a-cursor"})
+
+        # THEN: Both are rejected
+        assert too_short.status_code == 422
+        assert bad_cursor.status_code == 422
+
+    def test_conditional_get_returns_not_modified(self, client, created_user):
+        # GIVEN: A user fetched once, with its validators
+        url = f"{settings.API_V1_STR}/users/{created_user['id']}"
+        response = client.get(url)
+        etag = response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+
+        # WHEN: It is fetched again with If-None-Match
+        revalidated = client.get(url, headers={"If-None-Match": etag})
+
+        # THEN: The answer is 304 with no body and the same ETag
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["ETag"] == etag
+
+        # AND: After an update the old tag no longer matches
+        updated = client.put(url, json={"first_name": "Changed"})
+        stale = client.get(url, headers={"If-None-Match": etag})
+        assert stale.status_code == 200
+        assert stale.headers["ETag"] == updated.headers["ETag"] != etag
+
+    def test_update_with_stale_if_match_is_rejected(self, client, created_user):
+        # GIVEN: Two clients that read the same version of a user
+        url = f"{settings.API_V1_STR}/users/{created_user['id']}"
+        etag = client.get(url).headers["ETag"]
+
+        # WHEN: Both update it with If-Match set to that version
+        first = client.put(
+            url, json={"first_name": "First"}, headers={"If-Match": etag}
+        )
+        second = client.put(
+            url, json={"first_name": "Second"}, headers={"If-Match": etag}
+        )
+
+        # THEN: The first wins and the second gets 412 instead of overwriting it
+        assert first.status_code == 200
+        assert second.status_code == 412
+        assert client.get(url).json()["first_name"] == "First"
+
+        # AND: An If-Match on a user that does not exist is still a 404
+        missing = client.put(
+            f"{settings.API_V1_STR}/users/{uuid.uuid4()}",
+            json={"first_name": "Nobody"},
+            headers={"If-Match": etag},
+        )
+        assert missing.status_code == 404
+
     def test_get_all_users(self, client, created_user):
         # GIVEN: At least one user exists in the system
         # (the created_user fixture has already created one)
@@ -219,6 +408,46 @@ class TestUserCRUD:
         assert len(data) >= 1
         assert any(user["id"] == created_user["id"] for user in data)
 
+    def test_get_all_users_with_cursor(self, client, unique_user_payload):
+        # GIVEN: At least three users exist in the system
+        for i in range(3):
+            payload = dict(unique_user_payload)
+            payload["username"] = f"{payload['username']}{i}"
+            payload["email"] = f"{i}{payload['email']}"
+            response = client.post(f"{settings.API_V1_STR}/users/", json=payload)
+            assert response.status_code == 201
+
+        # WHEN: The first page is requested
+        first = client.get(f"{settings.API_V1_STR}/users/", params={"limit": 2})
+
+        # THEN: It is full and points to the next page
+        assert first.status_code == 200
+        assert len(first.json()) == 2
+        next_cursor = first.headers["X-Next-Cursor"]
+
+        # WHEN: The next page is requested with the cursor
+        second = client.get(
+            f"{settings.API_V1_STR}/users/",
+            params={"limit": 2, "cursor": next_cursor},
+        )
+
+        # THEN: It continues after the first page without overlapping it
+        assert second.status_code == 200
+        first_ids = {user["id"] for user in first.json()}
+        assert second.json()
+        assert not first_ids & {user["id"] for user in second.json()}
+        assert second.json()[0]["created_at"] <= first.json()[-1]["created_at"]
+
+    def test_get_all_users_invalid_cursor(self, client):
+        # GIVEN: A malformed cursor
+        # WHEN: A GET request is made to /users/ with it
+        response = client.get(
+            f"{settings.API_V1_STR}/users/", params={"cursor": "not-a-cursor"}
+        )
+
+        # THEN: The status code should be 422 (Unprocessable Entity)
+        assert response.status_code == 422
+
     def test_update_user_successfully(self, client, created_user):
         # GIVEN: An existing user
         user_id = created_user["id"]
@@ -274,6 +503,25 @@ class TestUserCRUD:
         assert data["first_name"] == update_payload["first_name"]
         assert data["last_name"] == created_user["last_name"]
 
+    def test_get_user_after_update_is_not_stale(self, client, created_user):
+        # GIVEN: A user that has been read once (and is therefore cached)
+        user_id = created_user["id"]
+        assert client.get(f"{settings.API_V1_STR}/users/{user_id}").status_code == 200
+
+        # WHEN: The user is updated
+        response = client.put(
+            f"{settings.API_V1_STR}/users/{user_id}", json={"first_name": "Fresh"}
+        )
+        assert response.status_code == 200
+
+        # THEN: The next read reflects the committed update
+        response = client.get(f"{settings.API_V1_STR}/users/{user_id}")
+        assert response.json()["first_name"] == "Fresh"
+
+        # AND: The cache counters are exposed
+        stats = client.get(f"{settings.API_V1_STR}/diagnostics/cache").json()
+        assert {"hits", "misses", "evictions", "size"} <= stats.keys()
+
     def test_update_user_not_found(self, client):
         # GIVEN: A user ID that does not exist
         non_existent_uuid = str(uuid.uuid4())
@@ -367,3 +615,165 @@ class TestUserCRUD:
 
         # THEN: The status code should be 404 (Not Found)
         assert response.status_code == 404
+
+    def test_soft_deleted_user_cannot_be_updated_or_deleted_again(
+        self, client, unique_user_payload
+    ):
+        # GIVEN: A user that has been soft-deleted
+        create_response = client.post(
+            f"{settings.API_V1_STR}/users/", json=unique_user_payload
+        )
+        assert create_response.status_code == 201
+        user_id = create_response.json()["id"]
+        assert client.delete(f"{settings.API_V1_STR}/users/{user_id}").status_code in [
+            200,
+            204,
+        ]
+
+        # WHEN: The user is updated and deleted again
+        update_response = client.put(
+            f"{settings.API_V1_STR}/users/{user_id}", json={"first_name": "Ghost"}
+        )
+        delete_response = client.delete(f"{settings.API_V1_STR}/users/{user_id}")
+
+        # THEN: Both report the user as not found
+        assert update_response.status_code == 404
+        assert delete_response.status_code == 404
+
+    def test_verify_password(self, client, created_user):
+        # GIVEN: An existing user, whose stored hash is derived from the email
+        url = f"{settings.API_V1_STR}/users/{created_user['id']}/verify-password"
+
+        # WHEN: The right and a wrong password are verified
+        valid = client.post(url, json={"password": created_user["email"]})
+        invalid = client.post(url, json={"password": "not-the-password"})
+
+        # THEN: Only the right one is accepted
+        assert valid.status_code == 200
+        assert valid.json() == {"valid": True}
+        assert invalid.status_code == 200
+        assert invalid.json() == {"valid": False}
+
+    def test_verify_password_user_not_found(self, client):
+        # GIVEN: A user ID that does not exist
+        url = f"{settings.API_V1_STR}/users/{uuid.uuid4()}/verify-password"
+
+        # WHEN: A password is verified for it
+        response = client.post(url, json={"password": "secret"})
+
+        # THEN: The status code should be 404 (Not Found)
+        assert response.status_code == 404
+
+
+class TestUserExport:
+
+    def test_export_users_as_ndjson(self, client, created_user):
+        # GIVEN: A user exists in the system
+        # WHEN: The users are exported as NDJSON
+        response = client.get(f"{settings.API_V1_STR}/users/export")
+
+        # THEN: Every line is a user without credentials
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        exported = next(row for row in rows if row["id"] == created_user["id"])
+        assert exported["email"] == created_user["email"]
+        assert "hashed_password" not in exported
+
+    def test_export_users_as_csv_with_created_range(self, client, created_user):
+        # GIVEN: A range that starts after every existing user
+        created_from = datetime.now(timezone.utc) + timedelta(days=1)
+
+        # WHEN: The users are exported as CSV for that range
+        response = client.get(
+            f"{settings.API_V1_STR}/users/export",
+            params={"format": "csv", "created_from": created_from.isoformat()},
+        )
+
+        # THEN: Only the header line is returned
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows == [
+            [
+                "id",
+                "username",
+                "email",
+                "first_name",
+                "last_name",
+                "role",
+                "active",
+                "created_at",
+                "updated_at",
+            ]
+        ]
+
+
+class TestUserEvents:
+
+    def test_lifecycle_changes_are_delivered_in_order(
+        self, client, unique_user_payload
+    ):
+        # GIVEN: The in-memory sink the outbox dispatcher delivers to
+        sink = get_injector().get(EventSinkPort)
+
+        # WHEN: A user is created, updated and deleted
+        user_id = client.post(
+            f"{settings.API_V1_STR}/users/", json=unique_user_payload
+        ).json()["id"]
+        client.put(f"{settings.API_V1_STR}/users/{user_id}", json={"first_name": "Jo"})
+        client.delete(f"{settings.API_V1_STR}/users/{user_id}")
+
+        # THEN: One event per change arrives, after the responses and in order
+        events = []
+        deadline = time.monotonic() + 5
+        while len(events) < 3 and time.monotonic() < deadline:
+            try:
+                event = sink.events.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if str(event.user_id) == user_id:
+                events.append(event)
+        assert [event.type for event in events] == [
+            UserEventType.CREATED,
+            UserEventType.UPDATED,
+            UserEventType.DELETED,
+        ]
+        assert events[0].id < events[1].id < events[2].id
+        assert events[1].data["first_name"] == "Jo"
+        assert "hashed_password" not in events[0].data
+
+
+class TestUserTracing:
+
+    def test_request_spans_nest_under_the_callers_trace(self, client):
+        # GIVEN: Spans exported to memory and a caller that sends a traceparent
+        exporter = InMemorySpanExporter()
+        set_span_exporter(exporter)
+        trace_id = uuid.uuid4().hex
+        headers = {"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+
+        # WHEN: Users are fetched in a batch
+        try:
+            response = client.post(
+                f"{settings.API_V1_STR}/users/batch-get",
+                json={"ids": [str(uuid.uuid4())]},
+                headers=headers,
+            )
+        finally:
+            set_span_exporter(NoopSpanExporter())
+
+        # THEN: The trace id is returned to the caller
+        assert response.status_code == 200
+        assert response.headers["X-Trace-Id"] == trace_id
+
+        # AND: Router, use case, transaction and repository spans form one chain
+        spans = {span.name: span for span in exporter.spans}
+        request = spans["HTTP POST /users/batch-get"]
+        (use_case,) = [span for span in exporter.spans if "use_case" in span.attributes]
+        transaction = spans["db.transaction"]
+        assert request.parent_id == "00f067aa0ba902b7"
+        assert request.attributes["http.status_code"] == 200
+        assert use_case.parent_id == request.span_id
+        assert transaction.parent_id == use_case.span_id
+        assert all(span.trace_id == trace_id for span in exporter.spans)
@@ -0,0 +1,116 @@
+from sqlalchemy.engine.url import URL
+
+from app.config import config_module
+from app.config.config_module import (
+    get_database_url,
+    get_engine,
+    get_engine_options,
+    get_read_only_options,
+    get_replica_urls,
+)
+
+
+class TestEngineFactory:
+
+    def test_engine_uses_configured_pool(self, monkeypatch):
+        # GIVEN: Custom pool settings
+        monkeypatch.setattr(config_module.env, "DB_POOL_SIZE", 3)
+        monkeypatch.setattr(config_module.env, "DB_MAX_OVERFLOW", 7)
+
+        # WHEN: The engine is built
+        engine = get_engine()
+
+        # THEN: The pool honors them
+        assert engine.pool.size() == 3
+        assert engine.pool._max_overflow == 7
+        engine.dispose()
+
+    def test_statement_timeout_only_for_postgresql(self, monkeypatch):
+        # GIVEN: A statement timeout
+        monkeypatch.setattr(config_module.env, "DB_STATEMENT_TIMEOUT_MS", 1500)
+
+        # WHEN: Options are built for each driver
+        psycopg = get_engine_options(URL.create("postgresql+psycopg2"))
+        asyncpg = get_engine_options(URL.create("postgresql+asyncpg"))
+        sqlite = get_engine_options(URL.create("sqlite"))
+
+        # THEN: The timeout is passed the way each PostgreSQL driver expects
+        assert psycopg["connect_args"] == {"options": "-c statement_timeout=1500"}
+        assert asyncpg["connect_args"] == {
+            "server_settings": {"statement_timeout": "1500"}
+        }
+        assert "connect_args" not in sqlite
+
+
+class TestDatabaseUrl:
+
+    def test_full_url_takes_precedence(self, monkeypatch):
+        # GIVEN: A full DATABASE_URL next to the DB_* parts
+        monkeypatch.setattr(
+            config_module.env, "DATABASE_URL", "postgresql://app:secret@db:6543/users"
+        )
+
+        # WHEN: The database URL is built
+        url = get_database_url()
+
+        # THEN: It is the one given
+        assert (url.host, url.port, url.database) == ("db", 6543, "users")
+
+    def test_sqlite_url_omits_host_and_credentials(self, monkeypatch):
+        # GIVEN: A SQLite primary and replica, with host and credentials also set
+        monkeypatch.setattr(config_module.env, "DATABASE_URL", None)
+        monkeypatch.setattr(config_module.env, "DB_DIALECT", "sqlite")
+        monkeypatch.setattr(config_module.env, "DB_DATABASE_NAME", "primary.db")
+        monkeypatch.setattr(config_module.env, "DB_HOST", "localhost")
+        monkeypatch.setattr(config_module.env, "DB_PORT", 5432)
+        monkeypatch.setattr(config_module.env, "DB_USER", "app")
+        monkeypatch.setattr(config_module.env, "DB_REPLICA_HOSTS", "replica.db")
+
+        # WHEN: The primary and replica URLs are built
+        url = get_database_url()
+        replicas = get_replica_urls(url)
+
+        # THEN: Only the database files are kept
+        assert url.render_as_string() == "sqlite:///primary.db"
+        assert [replica.render_as_string() for replica in replicas] == [
+            "sqlite:///replica.db"
+        ]
+
+
+class TestReadEngine:
+
+    def test_replica_urls_reuse_primary_credentials(self, monkeypatch):
+        # GIVEN: Two replicas, one of them on a custom port
+        monkeypatch.setattr(
+            config_module.env, "DB_REPLICA_HOSTS", "replica-a, replica-b:6432"
+        )
+        primary = URL.create(
+            "postgresql+psycopg2",
+            username="app",
+            password="secret",
+            host="primary",
+            port=5432,
+            database="users",
+        )
+
+        # WHEN: The replica URLs are built
+        urls = get_replica_urls(primary)
+
+        # THEN: Only host and port change
+        assert [(url.host, url.port) for url in urls] == [
+            ("replica-a", 5432),
+            ("replica-b", 6432),
+        ]
+        assert all(url.username == "app" and url.database == "users" for url in urls)
+
+    def test_read_only_options_per_backend(self):
+        # GIVEN/WHEN: Read-only options are built for PostgreSQL and SQLite
+        postgresql = get_read_only_options(URL.create("postgresql+psycopg2"))
+        sqlite = get_read_only_options(URL.create("sqlite"))
+
+        # THEN: Both skip explicit transactions; PostgreSQL also rejects writes
+        assert postgresql == {
+            "isolation_level": "AUTOCOMMIT",
+            "postgresql_readonly": True,
+        }
+        assert sqlite == {"isolation_level": "AUTOCOMMIT"}
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config.replica_router import AsyncReplicaRouter, ReplicaRouter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def sqlite_engine(tmp_path, name):
+    return create_engine(f"sqlite:///{tmp_path / name}")
+
+
+def unreachable_engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+
+
+class TestReplicaRouter:
+
+    def test_round_robin_between_healthy_replicas(self, tmp_path):
+        # GIVEN: Two local SQLite stand-ins for the replicas
+        primary = sqlite_engine(tmp_path, "primary.db")
+        replica_a = sqlite_engine(tmp_path, "replica_a.db")
+        replica_b = sqlite_engine(tmp_path, "replica_b.db")
+        router = ReplicaRouter(primary, [replica_a, replica_b])
+
+        # WHEN: Several reads are routed
+        picks = [router.pick() for _ in range(4)]
+
+        # THEN: They alternate between the replicas and never hit the primary
+        assert picks == [replica_a, replica_b, replica_a, replica_b]
+
+    def test_unreachable_replica_is_skipped_until_it_recovers(self, tmp_path):
+        # GIVEN: A replica whose database cannot be opened
+        clock = FakeClock()
+        primary = sqlite_engine(tmp_path, "primary.db")
+        broken = unreachable_engine(tmp_path)
+        healthy = sqlite_engine(tmp_path, "replica.db")
+        router = ReplicaRouter(
+            primary, [broken, healthy], check_interval=5, clock=clock
+        )
+
+        # WHEN: Reads are routed before the next health check is due
+        picks = [router.pick() for _ in range(3)]
+
+        # THEN: Every read goes to the healthy replica
+        assert picks == [healthy, healthy, healthy]
+
+        # AND: The broken replica is probed again once the interval elapses
+        (tmp_path / "missing").mkdir()
+        clock.now = 5
+        assert [router.pick() for _ in range(2)] == [healthy, broken]
+
+    def test_falls_back_to_primary_when_replicas_lag(self, tmp_path):
+        # GIVEN: Replicas reporting 30 seconds of lag with a 10 second budget
+        primary = sqlite_engine(tmp_path, "primary.db")
+        replicas = [sqlite_engine(tmp_path, f"replica_{i}.db") for i in range(2)]
+        router = ReplicaRouter(
+            primary, replicas, max_lag_seconds=10, lag_query="SELECT 30"
+        )
+
+        # WHEN/THEN: Reads are served by the primary
+        assert router.pick() is primary
+
+    def test_without_replicas_reads_go_to_primary(self, tmp_path):
+        # GIVEN: No replicas configured
+        primary = sqlite_engine(tmp_path, "primary.db")
+        router = ReplicaRouter(primary, [])
+
+        # WHEN/THEN: The primary serves reads
+        assert router.pick() is primary
+
+
+class TestAsyncReplicaRouter:
+
+    def test_async_router_skips_unreachable_replica(self, tmp_path):
+        # GIVEN: An async router with one broken and one healthy replica
+        pytest.importorskip("aiosqlite")
+        primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'p.db'}")
+        broken = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'r.db'}"
+        )
+        healthy = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'r.db'}")
+        router = AsyncReplicaRouter(primary, [broken, healthy])
+
+        async def route():
+            picks = [await router.pick() for _ in range(2)]
+            for engine in (primary, broken, healthy):
+                await engine.dispose()
+            return picks
+
+        # WHEN/THEN: Reads go to the healthy replica
+        assert asyncio.run(route()) == [healthy, healthy]
@@ -0,0 +1,48 @@
+import pytest
+from passlib.context import CryptContext
+
+from app.config.environment import get_environment_variables
+from app.config.settings import Settings
+
+
+class TestPasswordHashSettings:
+
+    @pytest.mark.parametrize("scheme", ["argon2", "scrypt", "bcrypt"])
+    def test_selected_scheme_hashes_and_others_still_verify(self, monkeypatch, scheme):
+        # GIVEN: A bcrypt hash from before the scheme was switched
+        env = get_environment_variables()
+        monkeypatch.setattr(env, "PASSWORD_HASH_PROFILE", "test")
+        old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret")
+
+        # WHEN: The crypt context is built for the selected scheme
+        monkeypatch.setattr(env, "PASSWORD_HASH_SCHEME", scheme)
+        context = CryptContext(**Settings().crypt_context_settings)
+
+        # THEN: New hashes use it, and the old hash verifies but is due a rehash
+        new_hash = context.hash("secret")
+        assert context.identify(new_hash) == scheme
+        assert context.verify("secret", old_hash)
+        assert context.needs_update(old_hash) == (scheme != "bcrypt")
+
+    def test_production_profile_uses_the_environment(self, monkeypatch):
+        # GIVEN: Argon2id tuning in the environment
+        env = get_environment_variables()
+        monkeypatch.setattr(env, "PASSWORD_HASH_PROFILE", "production")
+        monkeypatch.setattr(env, "ARGON2_MEMORY_COST_KIB", 19456)
+        monkeypatch.setattr(env, "ARGON2_PARALLELISM", 2)
+
+        # WHEN: The settings are built
+        settings = Settings().crypt_context_settings
+
+        # THEN: They are passed to the scheme
+        assert settings["argon2__type"] == "ID"
+        assert settings["argon2__memory_cost"] == 19456
+        assert settings["argon2__parallelism"] == 2
+
+    def test_unknown_scheme_is_rejected(self, monkeypatch):
+        # GIVEN: A scheme that is not supported
+        monkeypatch.setattr(get_environment_variables(), "PASSWORD_HASH_SCHEME", "md5")
+
+        # WHEN/THEN: Building the settings fails instead of hashing with it
+        with pytest.raises(ValueError):
+            Settings()
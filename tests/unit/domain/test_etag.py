@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.domain.value_objects.etag import etag_matches, expected_versions, user_etag
+
+
+class TestUserETag:
+
+    def test_tag_round_trips_to_the_version(self):
+        # GIVEN: A user version with microsecond precision
+        user_id = uuid4()
+        updated_at = datetime(2025, 5, 15, 2, 5, 0, 123456, tzinfo=timezone.utc)
+
+        # WHEN: Its ETag is sent back as If-Match
+        versions = expected_versions(user_etag(user_id, updated_at), user_id)
+
+        # THEN: The exact updated_at is recovered
+        assert versions == [updated_at]
+
+    def test_if_none_match_uses_weak_comparison(self):
+        # GIVEN: The current tag of a user
+        etag = user_etag(uuid4(), datetime.now(timezone.utc))
+
+        # WHEN/THEN: It matches alone, weak, in a list or through a wildcard
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+
+    def test_if_match_ignores_weak_and_foreign_tags(self):
+        # GIVEN: Tags of another user and a weak tag of this one
+        user_id = uuid4()
+        now = datetime.now(timezone.utc)
+        header = f"{user_etag(uuid4(), now)}, W/{user_etag(user_id, now)}"
+
+        # WHEN/THEN: None of them is an acceptable version
+        assert expected_versions(header, user_id) == []
+        assert expected_versions("*", user_id) is None
@@ -0,0 +1,66 @@
+import pytest
+
+from app.domain.value_objects.cursor import UserSearchCursor
+from app.domain.value_objects.search import (
+    EXACT_MATCH,
+    IDENTIFIER_PREFIX,
+    MAX_SEARCH_TERMS,
+    NAME_PREFIX,
+    SUBSTRING,
+    relevance,
+    search_terms,
+)
+
+ADA = {
+    "username": "ada",
+    "email": "countess@example.com",
+    "first_name": "Augusta",
+    "last_name": "Lovelace",
+}
+
+
+class TestRelevance:
+
+    @pytest.mark.parametrize(
+        "term, expected",
+        [
+            ("ada", EXACT_MATCH),
+            ("count", IDENTIFIER_PREFIX),
+            ("love", NAME_PREFIX),
+            ("lace", SUBSTRING),
+            ("babbage", 0),
+        ],
+    )
+    def test_term_tiers(self, term, expected):
+        # GIVEN/WHEN/THEN: Each kind of match lands in its own tier
+        assert relevance([term], **ADA) == expected
+
+    def test_every_term_must_match(self):
+        # GIVEN: One matching and one unknown term
+        terms = search_terms("Ada Babbage")
+
+        # WHEN/THEN: The user is not a result
+        assert relevance(terms, **ADA) == 0
+        assert relevance(search_terms("Ada LOVE"), **ADA) == EXACT_MATCH + NAME_PREFIX
+
+    def test_terms_are_capped(self):
+        # GIVEN/WHEN: A query with too many terms
+        terms = search_terms(" ".join(["a"] * (MAX_SEARCH_TERMS + 3)))
+
+        # THEN: Only the first ones are kept
+        assert len(terms) == MAX_SEARCH_TERMS
+
+
+class TestUserSearchCursor:
+
+    def test_encode_decode_round_trip(self):
+        # GIVEN: A cursor pointing at a search hit
+        cursor = UserSearchCursor(rank=7, username="ada")
+
+        # WHEN/THEN: It survives encoding
+        assert UserSearchCursor.decode(cursor.encode()) == cursor
+
+    def test_decode_rejects_garbage(self):
+        # GIVEN/WHEN/THEN: A tampered token is rejected as a ValueError
+        with pytest.raises(ValueError):
+            UserSearchCursor.decode("not-a-cursor")
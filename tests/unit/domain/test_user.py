@@ -1 +1,24 @@
+from datetime import datetime, timezone
+from uuid import uuid4
 
+import pytest
+
+from app.domain.value_objects.cursor import UserCursor
+
+
+class TestUserCursor:
+
+    def test_encode_decode_round_trip(self):
+        # GIVEN: A cursor pointing at a user
+        cursor = UserCursor(created_at=datetime.now(timezone.utc), id=uuid4())
+
+        # WHEN: It is encoded and decoded back
+        decoded = UserCursor.decode(cursor.encode())
+
+        # THEN: The position is preserved
+        assert decoded == cursor
+
+    def test_decode_rejects_garbage(self):
+        # GIVEN/WHEN/THEN: A tampered token is rejected as a ValueError
+        with pytest.raises(ValueError):
+            UserCursor.decode("not-a-cursor")
@@ -0,0 +1,32 @@
+from app.infrastructure.security.calibration import calibrate_bcrypt_rounds
+
+
+class TestCalibrateBcryptRounds:
+
+    def test_picks_the_most_rounds_within_the_target(self):
+        # GIVEN: A host where each round doubles a 10 ms hash at 10 rounds
+        measured = []
+
+        def measure(rounds):
+            measured.append(rounds)
+            return 10 * 2 ** (rounds - 10)
+
+        # WHEN: Rounds are calibrated for a 100 ms target
+        result = calibrate_bcrypt_rounds(100, measure=measure)
+
+        # THEN: 13 rounds (80 ms) are chosen and measuring stops at 14 (160 ms)
+        assert result.rounds == 13
+        assert result.meets_target
+        assert measured == [10, 11, 12, 13, 14]
+
+    def test_never_goes_below_the_minimum(self):
+        # GIVEN: A host too slow to meet the target even at the minimum
+        def measure(rounds):
+            return 500.0
+
+        # WHEN: Rounds are calibrated
+        result = calibrate_bcrypt_rounds(100, min_rounds=10, measure=measure)
+
+        # THEN: The minimum is kept and reported as over the target
+        assert result.rounds == 10
+        assert not result.meets_target
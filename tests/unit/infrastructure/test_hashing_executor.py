@@ -0,0 +1,113 @@
+import pytest
+from passlib.context import CryptContext
+
+from app.domain.exceptions import ServiceOverloadedError
+from app.infrastructure.security.hashing_executor import HashingExecutor
+from app.infrastructure.tracing import InMemorySpanExporter
+from app.ports.tracing import NoopSpanExporter, set_span_exporter, span
+
+
+def crypt_settings(rounds):
+    return {
+        "schemes": ["bcrypt"],
+        "default": "bcrypt",
+        "deprecated": "auto",
+        "bcrypt__rounds": rounds,
+    }
+
+
+class TestHashingExecutor:
+
+    def test_hash_returns_verifiable_hash(self):
+        # GIVEN: An executor with a cheap bcrypt configuration
+        executor = HashingExecutor(max_workers=1, crypt_settings=crypt_settings(4))
+
+        # WHEN: Data is hashed through the process pool
+        hashed = executor.hash("secret")
+        executor.shutdown()
+
+        # THEN: The hash verifies against the original data
+        assert CryptContext(**crypt_settings(4)).verify("secret", hashed)
+
+    def test_submit_rejects_when_queue_is_full(self):
+        # GIVEN: An executor that accepts a single in-flight job
+        executor = HashingExecutor(
+            max_workers=1, max_queue_depth=1, crypt_settings=crypt_settings(12)
+        )
+        pending = executor.submit("first")
+
+        # WHEN/THEN: A second job is rejected instead of queued
+        with pytest.raises(ServiceOverloadedError):
+            executor.submit("second")
+
+        # AND: Capacity is released once the first job completes
+        pending.result()
+        executor.hash("third")
+        executor.shutdown()
+
+    def test_verify_flags_hashes_made_with_other_rounds(self):
+        # GIVEN: An executor configured with more rounds than an existing hash
+        executor = HashingExecutor(max_workers=1, crypt_settings=crypt_settings(5))
+        old_hash = CryptContext(**crypt_settings(4)).hash("secret")
+
+        # WHEN: The right and a wrong password are verified against it
+        right = executor.verify("secret", old_hash)
+        wrong = executor.verify("other", old_hash)
+        malformed = executor.verify("secret", "not-a-hash")
+        executor.shutdown()
+
+        # THEN: Only the right one is valid, and only it asks for a rehash
+        assert right == (True, True)
+        assert wrong == (False, False)
+        assert malformed == (False, False)
+
+    def test_hash_many_preserves_order_across_workers(self):
+        # GIVEN: An executor with two workers and a batch larger than the pool
+        executor = HashingExecutor(max_workers=2, crypt_settings=crypt_settings(4))
+        batch = [f"secret-{i}" for i in range(5)]
+
+        # WHEN: The batch is hashed in chunks
+        hashed = executor.hash_many(batch)
+        executor.shutdown()
+
+        # THEN: Every hash matches the item at the same position
+        context = CryptContext(**crypt_settings(4))
+        assert len(hashed) == len(batch)
+        assert all(context.verify(data, h) for data, h in zip(batch, hashed))
+
+    def test_hash_many_fits_a_queue_shallower_than_the_pool(self):
+        # GIVEN: An executor whose queue admits fewer jobs than it has workers
+        executor = HashingExecutor(
+            max_workers=4, max_queue_depth=2, crypt_settings=crypt_settings(4)
+        )
+        batch = [f"secret-{i}" for i in range(5)]
+
+        # WHEN: A batch larger than the queue is hashed
+        hashed = executor.hash_many(batch)
+        executor.shutdown()
+
+        # THEN: It is split into as many chunks as the queue admits, not rejected
+        context = CryptContext(**crypt_settings(4))
+        assert len(hashed) == len(batch)
+        assert all(context.verify(data, h) for data, h in zip(batch, hashed))
+
+    def test_worker_span_joins_the_submitting_trace(self):
+        # GIVEN: Tracing into memory and an open span in the caller
+        exporter = InMemorySpanExporter()
+        set_span_exporter(exporter)
+        executor = HashingExecutor(max_workers=1, crypt_settings=crypt_settings(4))
+
+        # WHEN: Data is hashed inside that span
+        try:
+            with span("hash password") as parent:
+                hashed = executor.hash("secret")
+        finally:
+            executor.shutdown()
+            set_span_exporter(NoopSpanExporter())
+
+        # THEN: The worker's span is exported as a child of the caller's span
+        worker_span, _ = exporter.spans
+        assert worker_span.name == "hashing.hash"
+        assert worker_span.trace_id == parent.trace_id
+        assert worker_span.parent_id == parent.span_id
+        assert CryptContext(**crypt_settings(4)).verify("secret", hashed)
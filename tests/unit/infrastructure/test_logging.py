@@ -0,0 +1,127 @@
+import io
+import os
+import json
+
+from app.infrastructure.logging import QueueLoggerService
+from app.infrastructure.tracing import LoggingSpanExporter
+from app.ports.tracing import Span
+
+
+class Unformattable:
+    def __str__(self):
+        raise AssertionError("message was formatted although it was filtered out")
+
+
+def read_lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestQueueLoggerService:
+
+    def test_writes_json_lines_from_the_background_writer(self):
+        # GIVEN: A logger writing to an in-memory stream
+        stream = io.StringIO()
+        logger = QueueLoggerService(name="test.json", stream=stream)
+
+        # WHEN: A message with lazy arguments is logged and the queue is drained
+        logger.info("User found with ID: %s", 42)
+        logger.shutdown()
+
+        # THEN: The record is written as a JSON object with the formatted message
+        [line] = read_lines(stream)
+        assert line["level"] == "INFO"
+        assert line["logger"] == "test.json"
+        assert line["message"] == "User found with ID: 42"
+        assert "timestamp" in line
+
+    def test_filtered_records_are_never_formatted(self):
+        # GIVEN: A logger configured at WARNING
+        stream = io.StringIO()
+        logger = QueueLoggerService(name="test.level", level="WARNING", stream=stream)
+
+        # WHEN: Lower level messages are logged with arguments that cannot be formatted
+        logger.debug("debug %s", Unformattable())
+        logger.info("info %s", Unformattable())
+        logger.warning("kept %s", "warning")
+        logger.shutdown()
+
+        # THEN: Only the warning is written
+        assert [line["message"] for line in read_lines(stream)] == ["kept warning"]
+
+    def test_info_sampling_keeps_warnings_and_errors(self):
+        # GIVEN: A logger that samples out every INFO record
+        stream = io.StringIO()
+        logger = QueueLoggerService(
+            name="test.sampling", info_sample_rate=0.0, stream=stream
+        )
+
+        # WHEN: INFO, WARNING and ERROR records are logged
+        for _ in range(10):
+            logger.info("noise")
+        logger.warning("careful")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.error("failed: %s", "boom", exc_info=True)
+        logger.shutdown()
+
+        # THEN: Only the warning and the error (with its traceback) are written
+        lines = read_lines(stream)
+        assert [line["level"] for line in lines] == ["WARNING", "ERROR"]
+        assert "ValueError: boom" in lines[1]["exc_info"]
+
+    def test_forked_child_gets_its_own_writer(self):
+        # GIVEN: A logger writing to a pipe shared with a forked child
+        read_end, write_end = os.pipe()
+        stream = os.fdopen(write_end, "w")
+        logger = QueueLoggerService(name="test.fork", stream=stream)
+
+        # WHEN: The child logs and flushes its logger before exiting
+        pid = os.fork()
+        if pid == 0:
+            logger.info("from child")
+            logger.shutdown()
+            os._exit(0)
+        os.waitpid(pid, 0)
+        logger.shutdown()
+        stream.close()
+
+        # THEN: The record reached the stream through the child's writer thread
+        with os.fdopen(read_end) as pipe:
+            lines = [json.loads(line) for line in pipe.read().splitlines()]
+        assert [line["message"] for line in lines] == ["from child"]
+
+    def test_unsampled_info_survives_sampling(self):
+        # GIVEN: A logger that samples out every INFO record
+        stream = io.StringIO()
+        logger = QueueLoggerService(
+            name="test.unsampled", info_sample_rate=0.0, stream=stream
+        )
+
+        # WHEN: Spans are exported through it next to regular INFO records
+        exporter = LoggingSpanExporter(logger)
+        for name in ("first", "second"):
+            logger.info("noise")
+            exporter.export(Span(name))
+        logger.shutdown()
+
+        # THEN: Every span is written and every regular INFO record is dropped
+        messages = [line["message"] for line in read_lines(stream)]
+        assert len(messages) == 2
+        assert all(message.startswith("span ") for message in messages)
+
+    def test_new_service_stops_the_one_it_replaces(self):
+        # GIVEN: A logger service with a record still queued
+        first_stream, second_stream = io.StringIO(), io.StringIO()
+        first = QueueLoggerService(name="test.replace", stream=first_stream)
+        first.info("before")
+
+        # WHEN: Another service takes over the same logger name
+        second = QueueLoggerService(name="test.replace", stream=second_stream)
+        second.info("after")
+        second.shutdown()
+
+        # THEN: The first writer flushed and stopped, the second one took over
+        assert [line["message"] for line in read_lines(first_stream)] == ["before"]
+        assert [line["message"] for line in read_lines(second_stream)] == ["after"]
+        assert not first._running
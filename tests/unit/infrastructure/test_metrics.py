@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+
+from app.infrastructure.metrics import (
+    MultiprocessMetricsService,
+    PrometheusMetricsService,
+)
+from app.ports.metrics import USE_CASE_SECONDS
+
+
+class TestPrometheusMetricsService:
+
+    def test_histogram_buckets_are_cumulative(self):
+        # GIVEN: A service with three buckets
+        metrics = PrometheusMetricsService(buckets=(0.1, 1.0, 10.0))
+
+        # WHEN: Observations land in different buckets, one on a bound
+        for seconds in (0.05, 0.1, 0.5, 20.0):
+            metrics.observe(USE_CASE_SECONDS, seconds, {"use_case": "GetUser"})
+
+        # THEN: Each bucket counts every observation up to its bound
+        lines = metrics.render().splitlines()
+        prefix = 'use_case_duration_seconds_bucket{use_case="GetUser",le='
+        assert f'{prefix}"0.1"}} 2' in lines
+        assert f'{prefix}"1.0"}} 3' in lines
+        assert f'{prefix}"10.0"}} 3' in lines
+        assert f'{prefix}"+Inf"}} 4' in lines
+        assert 'use_case_duration_seconds_count{use_case="GetUser"} 4' in lines
+        assert "# TYPE use_case_duration_seconds histogram" in lines
+
+    def test_gauges_are_read_at_render_time(self):
+        # GIVEN: A gauge backed by a changing value
+        metrics = PrometheusMetricsService()
+        state = {"checked_out": 1}
+        metrics.add_gauge(
+            "db_pool_connections",
+            "Connections of the pool by state.",
+            lambda: [({"state": "checked_out"}, state["checked_out"])],
+        )
+
+        # WHEN: The value changes before rendering
+        state["checked_out"] = 3
+
+        # THEN: The rendered sample reflects the current value
+        assert 'db_pool_connections{state="checked_out"} 3.0' in metrics.render()
+
+    def test_label_values_are_escaped(self):
+        # GIVEN/WHEN: A label value with quotes and a newline
+        metrics = PrometheusMetricsService(buckets=(1.0,))
+        metrics.observe(USE_CASE_SECONDS, 0.5, {"use_case": 'a"b\nc'})
+
+        # THEN: It is escaped per the exposition format
+        assert 'use_case="a\\"b\\nc"' in metrics.render()
+
+
+class TestMultiprocessMetricsService:
+
+    def test_any_worker_reports_the_totals_of_all_workers(self, tmp_path):
+        # GIVEN: A service created before two workers are forked
+        metrics = MultiprocessMetricsService(str(tmp_path), buckets=(1.0,))
+        metrics.add_gauge(
+            "db_pool_connections",
+            "Connections of the pool by state.",
+            lambda: [({"state": "checked_out"}, 2)],
+        )
+
+        def work(observations):
+            for _ in range(observations):
+                metrics.observe(USE_CASE_SECONDS, 0.5, {"use_case": "GetUser"})
+            # What the atexit hook does when a server worker exits.
+            metrics.flush()
+
+        # WHEN: Each worker records observations and exits
+        fork = multiprocessing.get_context("fork")
+        for observations in (2, 3):
+            worker = fork.Process(target=work, args=(observations,))
+            worker.start()
+            worker.join()
+
+        # AND: The remaining worker serves the scrape
+        metrics.observe(USE_CASE_SECONDS, 0.5, {"use_case": "GetUser"})
+        lines = metrics.render().splitlines()
+
+        # THEN: The histogram sums every worker, exited ones included
+        assert 'use_case_duration_seconds_count{use_case="GetUser"} 6' in lines
+
+        # AND: Gauges come only from running workers, labelled by worker
+        gauges = [line for line in lines if line.startswith("db_pool_connections{")]
+        assert gauges == [
+            f'db_pool_connections{{state="checked_out",worker="{os.getpid()}"}} 2.0'
+        ]
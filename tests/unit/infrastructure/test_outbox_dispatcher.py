@@ -0,0 +1,109 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select
+
+from app.config.config_module import Base
+from app.config.environment import get_environment_variables
+from app.domain.entities.events import UserEvent, UserEventType
+from app.infrastructure.database.models import UserEventModel, event_to_row
+from app.infrastructure.events.outbox_dispatcher import OutboxDispatcher
+from app.infrastructure.events.sinks import InMemoryEventSink
+from app.infrastructure.infrastructure_module import get_event_sink
+from app.infrastructure.logging import ConsoleLoggerService
+
+
+class FailingEventSink:
+    def publish(self, events):
+        raise ConnectionError("broker unavailable")
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}")
+    Base.metadata.create_all(engine, tables=[UserEventModel.__table__])
+    yield engine
+    engine.dispose()
+
+
+def store_events(engine, count):
+    events = [
+        UserEvent(type=UserEventType.UPDATED, user_id=uuid4(), data={"n": n})
+        for n in range(count)
+    ]
+    with engine.begin() as connection:
+        connection.execute(
+            insert(UserEventModel.__table__).values(
+                [event_to_row(event) for event in events]
+            )
+        )
+    return events
+
+
+def pending(engine):
+    with engine.connect() as connection:
+        return connection.execute(
+            select(func.count()).select_from(UserEventModel.__table__)
+        ).scalar()
+
+
+class TestOutboxDispatcher:
+
+    def test_delivers_batches_in_order_and_empties_the_outbox(self, engine):
+        # GIVEN: Five stored events and a dispatcher with batches of two
+        stored = store_events(engine, 5)
+        sink = InMemoryEventSink()
+        dispatcher = OutboxDispatcher(engine, sink, ConsoleLoggerService(), 2)
+
+        # WHEN: Batches are dispatched until the outbox is empty
+        batches = []
+        while dispatched := dispatcher.dispatch_once():
+            batches.append(dispatched)
+
+        # THEN: Every event is delivered once, in the order it was stored
+        delivered = [sink.events.get_nowait() for _ in range(sink.events.qsize())]
+        assert batches == [2, 2, 1]
+        assert [event.data for event in delivered] == [e.data for e in stored]
+        assert [event.user_id for event in delivered] == [e.user_id for e in stored]
+        assert pending(engine) == 0
+
+    def test_failed_batch_stays_in_the_outbox(self, engine):
+        # GIVEN: Stored events and a sink that cannot be reached
+        store_events(engine, 3)
+        dispatcher = OutboxDispatcher(
+            engine, FailingEventSink(), ConsoleLoggerService()
+        )
+
+        # WHEN/THEN: Dispatching fails and every event is kept for a retry
+        with pytest.raises(ConnectionError):
+            dispatcher.dispatch_once()
+        assert pending(engine) == 3
+
+    def test_background_thread_drains_the_outbox(self, engine):
+        # GIVEN: A running dispatcher
+        sink = InMemoryEventSink()
+        dispatcher = OutboxDispatcher(
+            engine, sink, ConsoleLoggerService(), poll_interval=0.05
+        )
+        dispatcher.start()
+
+        # WHEN: Events are stored after it started
+        stored = store_events(engine, 2)
+
+        # THEN: They are delivered without any request waiting on it
+        try:
+            delivered = [sink.events.get(timeout=5) for _ in stored]
+        finally:
+            dispatcher.stop()
+        assert [event.data for event in delivered] == [e.data for e in stored]
+
+
+class TestEventSinkSetting:
+
+    def test_unknown_sink_is_rejected(self, monkeypatch):
+        # GIVEN: A misspelled sink
+        monkeypatch.setattr(get_environment_variables(), "OUTBOX_SINK", "fiel")
+
+        # WHEN/THEN: Building the sink fails instead of discarding events
+        with pytest.raises(ValueError):
+            get_event_sink()
@@ -0,0 +1,82 @@
+from concurrent.futures import Future
+from uuid import uuid4
+
+import pytest
+
+from app.domain.exceptions import ServiceOverloadedError
+from app.infrastructure.logging import ConsoleLoggerService
+from app.infrastructure.security.password_rehasher import BackgroundPasswordRehasher
+
+
+class FakeHashingExecutor:
+    def __init__(self, overloaded=False):
+        self.overloaded = overloaded
+
+    def submit(self, data_to_hash):
+        if self.overloaded:
+            raise ServiceOverloadedError("saturated")
+        future = Future()
+        future.set_result("new-" + data_to_hash)
+        return future
+
+
+class RecordingRehashUseCase:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def set_params(self, params):
+        self.params = params
+
+    def execute(self):
+        self.calls.append(self.params)
+        return True
+
+
+class FakeProvider:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def get(self):
+        return RecordingRehashUseCase(self.calls)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+def rehasher(calls, overloaded=False):
+    return BackgroundPasswordRehasher(
+        hashing_executor=FakeHashingExecutor(overloaded),
+        rehash_use_case=FakeProvider(calls),
+        logger_service=ConsoleLoggerService(),
+    )
+
+
+class TestBackgroundPasswordRehasher:
+
+    def test_stores_the_new_hash_guarded_by_the_old_one(self, calls):
+        # GIVEN: A rehasher over an executor that hashes immediately
+        service = rehasher(calls)
+        user_id = uuid4()
+
+        # WHEN: A rehash is scheduled and the writer drains
+        service.schedule(user_id, "secret", "old-hash")
+        service._writer.shutdown(wait=True)
+
+        # THEN: The use case stores the new hash for the old one
+        (params,) = calls
+        assert params.user_id == user_id
+        assert params.current_hash == "old-hash"
+        assert params.new_hash == "new-secret"
+
+    def test_skips_the_rehash_when_hashing_is_saturated(self, calls):
+        # GIVEN: A rehasher over a saturated executor
+        service = rehasher(calls, overloaded=True)
+
+        # WHEN: A rehash is scheduled
+        service.schedule(uuid4(), "secret", "old-hash")
+        service._writer.shutdown(wait=True)
+
+        # THEN: It is dropped without raising
+        assert calls == []
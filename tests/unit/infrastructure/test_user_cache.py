@@ -0,0 +1,216 @@
+import multiprocessing
+import time
+from types import SimpleNamespace
+
+from app.domain.entities.users import UserInDBBase
+from app.infrastructure.cache.invalidation_board import InvalidationBoard
+from app.infrastructure.cache.lru_cache import LRUTTLCache
+from app.infrastructure.cache.tiered_cache import TieredCache
+from app.infrastructure.cache.user_cache import UserCache
+from app.infrastructure.database.repositories.cached_user_repository import (
+    CachedUserRepository,
+)
+from app.ports.transactional.transaction_context import bind_session, reset_session
+from tests.fixtures.in_memory_cache import InMemorySharedCache
+
+
+def make_user(**overrides):
+    data = {
+        "email": "jane@example.com",
+        "username": "jane",
+        "first_name": "Jane",
+        "last_name": "Doe",
+    }
+    data.update(overrides)
+    return UserInDBBase(**data)
+
+
+class TestLRUTTLCache:
+
+    def test_evicts_least_recently_used(self):
+        # GIVEN: A cache with room for two entries
+        cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        # WHEN: A third entry is added
+        cache.set("c", 3)
+
+        # THEN: The least recently used entry is evicted
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats().evictions == 1
+
+    def test_entries_expire_after_ttl(self):
+        # GIVEN: A cache with a very short TTL
+        cache = LRUTTLCache(max_size=10, ttl_seconds=0.01)
+        cache.set("a", 1)
+
+        # WHEN: The TTL elapses
+        time.sleep(0.02)
+
+        # THEN: The entry is a miss
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (0, 1)
+
+    def test_delete_reaches_forked_workers(self):
+        # GIVEN: A worker caching an entry, and one forked after the board
+        board = InvalidationBoard()
+        cache = LRUTTLCache(board=board)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # WHEN: The forked worker deletes the entry from its own cache
+        fork = multiprocessing.get_context("fork")
+        worker = fork.Process(target=cache.delete, args=("a",))
+        worker.start()
+        worker.join()
+
+        # THEN: This worker's copy is a miss too; other keys are untouched
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        # AND: Caching the key again after the delete is served normally
+        cache.set("a", 3)
+        assert cache.get("a") == 3
+
+
+class TestUserCache:
+
+    def test_invalidating_id_drops_email_and_username_lookups(self):
+        # GIVEN: A cached user
+        user_cache = UserCache(LRUTTLCache())
+        user = make_user()
+        user_cache.put(user)
+        assert user_cache.get_by_email(user.email) == user
+
+        # WHEN: The user is invalidated by id
+        user_cache.invalidate(user.id)
+
+        # THEN: No lookup returns the stale record
+        assert user_cache.get_by_id(user.id) is None
+        assert user_cache.get_by_email(user.email) is None
+        assert user_cache.get_by_username(user.username) is None
+
+    def test_stale_email_pointer_is_ignored(self):
+        # GIVEN: A user cached under an old email and re-cached under a new one
+        user_cache = UserCache(LRUTTLCache())
+        user = make_user()
+        user_cache.put(user)
+        user_cache.put(user.model_copy(update={"email": "new@example.com"}))
+
+        # WHEN/THEN: The old email no longer resolves to the user
+        assert user_cache.get_by_email("jane@example.com") is None
+        assert user_cache.get_by_email("new@example.com").id == user.id
+
+    def test_shared_tier_serves_other_workers(self):
+        # GIVEN: Two workers with their own local tier and a shared backend
+        shared = InMemorySharedCache()
+        board = InvalidationBoard()
+        worker_a = UserCache(TieredCache(LRUTTLCache(board=board), shared))
+        worker_b = UserCache(TieredCache(LRUTTLCache(board=board), shared))
+        user = make_user()
+
+        # WHEN: One worker caches the user and the other invalidates it
+        worker_a.put(user)
+        assert worker_b.get_by_id(user.id) == user
+        worker_b.invalidate(user.id)
+
+        # THEN: Neither the shared tier nor the first worker serves it
+        assert shared.get(f"user:id:{user.id}") is None
+        assert worker_a.get_by_id(user.id) is None
+
+
+class RecordingRepository:
+    def __init__(self, users):
+        self.users = {user.id: user for user in users}
+        self.requested = []
+
+    def get_many_by_ids(self, user_ids):
+        self.requested.append(list(user_ids))
+        return [self.users[user_id] for user_id in user_ids if user_id in self.users]
+
+    def get_version(self, user_id):
+        self.requested.append([user_id])
+        user = self.users.get(user_id)
+        return user.updated_at if user else None
+
+
+class TestCachedUserRepository:
+
+    def test_get_many_by_ids_only_fetches_cache_misses(self):
+        # GIVEN: Two users, only one of them cached
+        cached = make_user()
+        uncached = make_user(email="john@example.com", username="john")
+        user_cache = UserCache(LRUTTLCache())
+        user_cache.put(cached)
+        repository = RecordingRepository([cached, uncached])
+        cached_repository = CachedUserRepository(repository, user_cache)
+
+        # WHEN: Both are requested, uncached first
+        users = cached_repository.get_many_by_ids([uncached.id, cached.id])
+
+        # THEN: Only the miss hits the repository, and the request order is kept
+        assert repository.requested == [[uncached.id]]
+        assert [user.id for user in users] == [uncached.id, cached.id]
+
+        # AND: The fetched user is cached for the next lookup
+        assert user_cache.get_by_id(uncached.id) == uncached
+
+    def test_row_invalidated_during_its_read_is_not_cached(self):
+        # GIVEN: A repository whose read is overtaken by an update's invalidation
+        user = make_user()
+        user_cache = UserCache(LRUTTLCache(board=InvalidationBoard()))
+
+        class RacingRepository(RecordingRepository):
+            def get_many_by_ids(self, user_ids):
+                users = super().get_many_by_ids(user_ids)
+                user_cache.invalidate(user.id)
+                return users
+
+        cached_repository = CachedUserRepository(RacingRepository([user]), user_cache)
+
+        # WHEN: The user is fetched
+        users = cached_repository.get_many_by_ids([user.id])
+
+        # THEN: The pre-update row is returned but not cached
+        assert users == [user]
+        assert user_cache.get_by_id(user.id) is None
+
+    def test_rows_read_from_a_replica_are_not_cached(self):
+        # GIVEN: A user only in the repository, read in a replica session
+        user = make_user()
+        user_cache = UserCache(LRUTTLCache())
+        repository = RecordingRepository([user])
+        cached_repository = CachedUserRepository(repository, user_cache)
+        token = bind_session(SimpleNamespace(info={"replica": True}))
+
+        # WHEN: The user is fetched
+        try:
+            users = cached_repository.get_many_by_ids([user.id])
+        finally:
+            reset_session(token)
+
+        # THEN: It is returned but not cached
+        assert users == [user]
+        assert user_cache.get_by_id(user.id) is None
+
+    def test_get_version_is_answered_from_the_cache(self):
+        # GIVEN: A cached user and one only in the repository
+        cached = make_user()
+        uncached = make_user(email="john@example.com", username="john")
+        user_cache = UserCache(LRUTTLCache())
+        user_cache.put(cached)
+        repository = RecordingRepository([cached, uncached])
+        cached_repository = CachedUserRepository(repository, user_cache)
+
+        # WHEN: Both versions are requested
+        versions = [
+            cached_repository.get_version(user.id) for user in (cached, uncached)
+        ]
+
+        # THEN: Only the uncached one reaches the repository
+        assert versions == [cached.updated_at, uncached.updated_at]
+        assert repository.requested == [[uncached.id]]
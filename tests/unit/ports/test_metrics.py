@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.metrics import PrometheusMetricsService
+from app.ports import metrics as metrics_port
+from app.ports.metrics import (
+    REPOSITORY_SECONDS,
+    USE_CASE_SECONDS,
+    NoopMetrics,
+    instrument,
+    instrumented,
+    set_metrics,
+    timed,
+)
+
+
+class RecordingMetrics(PrometheusMetricsService):
+    def __init__(self):
+        super().__init__()
+        self.observed = []
+
+    def observe(self, name, seconds, labels):
+        self.observed.append((name, labels))
+
+
+@pytest.fixture
+def recorded():
+    previous = metrics_port.get_metrics()
+    metrics = RecordingMetrics()
+    set_metrics(metrics)
+    yield metrics.observed
+    set_metrics(previous)
+
+
+class TestTimed:
+
+    def test_records_outcome(self, recorded):
+        # GIVEN/WHEN: One block succeeds and another raises
+        with timed(USE_CASE_SECONDS, use_case="GetUser"):
+            pass
+        with pytest.raises(ValueError):
+            with timed(USE_CASE_SECONDS, use_case="GetUser"):
+                raise ValueError()
+
+        # THEN: Both are observed with their outcome
+        assert [labels["outcome"] for _, labels in recorded] == ["success", "error"]
+
+    def test_disabled_metrics_skip_timing(self):
+        # GIVEN: The default, disabled metrics
+        set_metrics(NoopMetrics())
+
+        # WHEN/THEN: timed hands back the shared no-op context
+        assert timed(USE_CASE_SECONDS) is timed(REPOSITORY_SECONDS)
+
+
+class TestInstrument:
+
+    def test_generator_is_timed_until_exhausted(self, recorded):
+        # GIVEN: An instrumented generator function
+        def rows():
+            yield 1
+            yield 2
+
+        stream = instrument(rows, USE_CASE_SECONDS, use_case="ExportUsers")()
+
+        # WHEN: It is only partially consumed
+        next(stream)
+
+        # THEN: Nothing is recorded until it finishes
+        assert recorded == []
+        assert list(stream) == [2]
+        assert recorded == [
+            (USE_CASE_SECONDS, {"use_case": "ExportUsers", "outcome": "success"})
+        ]
+
+    def test_instrumented_class_times_public_methods(self, recorded):
+        # GIVEN: A repository with a public coroutine and a private helper
+        @instrumented
+        class Repository:
+            async def get_by_id(self, user_id):
+                return self._load(user_id)
+
+            def _load(self, user_id):
+                return user_id
+
+        # WHEN: The public method is awaited
+        assert asyncio.run(Repository().get_by_id(7)) == 7
+
+        # THEN: Only the public method is observed, with its class and name
+        assert recorded == [
+            (
+                REPOSITORY_SECONDS,
+                {
+                    "repository": "Repository",
+                    "method": "get_by_id",
+                    "outcome": "success",
+                },
+            )
+        ]
@@ -0,0 +1,103 @@
+import pytest
+
+from app.infrastructure.tracing import InMemorySpanExporter
+from app.ports.tracing import (
+    NoopSpanExporter,
+    SpanContext,
+    current_span,
+    set_span_exporter,
+    span,
+    traced,
+)
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    set_span_exporter(exporter)
+    yield exporter
+    set_span_exporter(NoopSpanExporter())
+
+
+class TestSpanContext:
+
+    def test_traceparent_round_trip(self):
+        # GIVEN: A valid W3C traceparent header
+        header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+        # WHEN: It is parsed and serialized again
+        context = SpanContext.from_traceparent(header)
+
+        # THEN: The ids survive unchanged
+        assert context.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert context.span_id == "00f067aa0ba902b7"
+        assert context.traceparent == header
+
+    @pytest.mark.parametrize(
+        "header",
+        [None, "", "garbage", "00-" + "0" * 32 + "-00f067aa0ba902b7-01", "00-xyz-1-01"],
+    )
+    def test_invalid_traceparent_is_ignored(self, header):
+        # GIVEN/WHEN/THEN: Malformed or all-zero headers start a new trace
+        assert SpanContext.from_traceparent(header) is None
+
+
+class TestSpan:
+
+    def test_nested_spans_share_the_trace(self, exporter):
+        # GIVEN/WHEN: A span opened inside another
+        with span("outer") as outer:
+            with span("inner", **{"db.read_only": True}) as inner:
+                assert current_span() is inner
+
+        # THEN: The inner span is a child of the outer one, exported first
+        assert [s.name for s in exporter.spans] == ["inner", "outer"]
+        assert inner.trace_id == outer.trace_id
+        assert inner.parent_id == outer.span_id
+        assert inner.attributes == {"db.read_only": True}
+        assert current_span() is None
+
+    def test_exception_marks_span_as_error(self, exporter):
+        # GIVEN/WHEN: A span whose block raises
+        with pytest.raises(ValueError):
+            with span("failing"):
+                raise ValueError()
+
+        # THEN: It is exported with an error status and the exception type
+        (failed,) = exporter.spans
+        assert failed.status == "ERROR"
+        assert failed.attributes["exception.type"] == "ValueError"
+
+    def test_disabled_tracing_exports_nothing(self):
+        # GIVEN: The default, disabled exporter
+        # WHEN: A span is opened
+        with span("ignored") as ignored:
+            pass
+
+        # THEN: No span is created
+        assert ignored is None
+        assert current_span() is None
+
+
+class TestTraced:
+
+    def test_generator_span_is_current_only_while_stepping(self, exporter):
+        # GIVEN: A traced generator that records the current span per step
+        seen = []
+
+        def rows():
+            for row in range(2):
+                seen.append(current_span())
+                yield row
+
+        stream = traced(rows, "stream")()
+
+        # WHEN: It is consumed
+        assert next(stream) == 0
+        outside = current_span()
+        assert list(stream) == [1]
+
+        # THEN: Each step ran inside the span, the consumer never did
+        (streamed,) = exporter.spans
+        assert seen == [streamed, streamed]
+        assert outside is None
@@ -0,0 +1,74 @@
+import threading
+from contextlib import contextmanager
+
+from app.ports.transactional.transaction_context import get_current_session
+from app.ports.transactional.transaction_executor import TransactionExecutor
+from app.ports.transactional.transaction_manager import TransactionManagerPort
+from app.ports.transactional.transactional_atom import Atom, AtomClass
+
+
+class NamedTransactionManager(TransactionManagerPort[str]):
+    def __init__(self, name):
+        self.name = name
+
+    @contextmanager
+    def get_transaction_context(self, read_only=False):
+        yield self.name
+
+
+class SharedRepository:
+    def __init__(self):
+        self.db_handler = TransactionExecutor(logger=None)
+
+    def current(self):
+        with self.db_handler.get_session() as session:
+            return session
+
+
+@Atom.on_class
+class ReadSession(AtomClass):
+    def __init__(self, repository, transaction_manager, barrier):
+        self.repository = repository
+        self.transaction_manager = transaction_manager
+        self.barrier = barrier
+
+    def execute(self):
+        self.barrier.wait()
+        return self.repository.current()
+
+
+class TestTransactionContext:
+
+    def test_session_is_unbound_after_execution(self):
+        # GIVEN: A use case executed inside a transaction
+        use_case = ReadSession(
+            SharedRepository(), NamedTransactionManager("tx"), threading.Barrier(1)
+        )
+
+        # WHEN: The use case is executed
+        seen = use_case.execute()
+
+        # THEN: The session was visible during execution and unbound afterwards
+        assert seen == "tx"
+        assert get_current_session() is None
+
+    def test_concurrent_use_cases_share_a_repository_without_sharing_sessions(self):
+        # GIVEN: Two use cases on different threads sharing one repository
+        repository = SharedRepository()
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def run(name):
+            use_case = ReadSession(repository, NamedTransactionManager(name), barrier)
+            results[name] = use_case.execute()
+
+        threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+
+        # WHEN: Both execute at the same time
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # THEN: Each one saw the session of its own transaction
+        assert results == {"a": "a", "b": "b"}
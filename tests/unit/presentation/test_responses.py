@@ -0,0 +1,54 @@
+import json
+from datetime import datetime, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.domain.entities.users import UserInDBBase
+from app.infrastructure.database.models import row_to_user
+from app.presentation.http.responses import user_response, users_response
+from app.presentation.http.schemas.users import UserResponseApiSchema
+
+
+def make_user(**overrides):
+    data = {
+        "email": "jane@example.com",
+        "username": "jane",
+        "first_name": "Jane",
+        "last_name": "Doe",
+        "hashed_password": "secret-hash",
+        "deleted_at": datetime(2024, 1, 2, tzinfo=timezone.utc),
+    }
+    data.update(overrides)
+    return UserInDBBase(**data)
+
+
+class TestPreSerializedResponses:
+
+    def test_user_body_matches_response_schema(self):
+        # GIVEN: A domain user built from a row without validation
+        user = row_to_user(make_user().model_dump())
+
+        # WHEN: It is serialized for the response
+        response = user_response(user)
+
+        # THEN: The body carries the response schema fields only
+        body = json.loads(response.body)
+        assert set(body) == set(UserResponseApiSchema.model_fields)
+        assert body == json.loads(
+            UserResponseApiSchema.model_validate(user).model_dump_json()
+        )
+        assert response.media_type == "application/json"
+
+    def test_users_body_is_a_list_and_keeps_headers(self):
+        # GIVEN: A page of users
+        users = [make_user(username=f"user{i}") for i in range(3)]
+
+        # WHEN: The page is serialized with a cursor header
+        response = users_response(users, headers={"X-Next-Cursor": "abc"})
+
+        # THEN: Every item validates as the response schema and the header is set
+        items = TypeAdapter(List[UserResponseApiSchema]).validate_json(response.body)
+        assert [item.username for item in items] == ["user0", "user1", "user2"]
+        assert b"hashed_password" not in response.body
+        assert response.headers["X-Next-Cursor"] == "abc"
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+from app.presentation.cli.importtime import parse_importtime
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3500 |       9000 | app.presentation.http.app
+some unrelated line
+"""
+
+
+class TestImportTimeReport:
+
+    def test_parses_importtime_lines(self):
+        # GIVEN: stderr of `python -X importtime`, header and noise included
+        # WHEN: It is parsed
+        entries = parse_importtime(IMPORTTIME_OUTPUT)
+
+        # THEN: Only the measurements are kept, with the module names stripped
+        assert [(e.module, e.self_us, e.cumulative_us) for e in entries] == [
+            ("_io", 120, 120),
+            ("app.presentation.http.app", 3500, 9000),
+        ]
+
+
+class TestAppImport:
+
+    def test_importing_the_app_has_no_side_effects(self):
+        # GIVEN: A fresh interpreter
+        script = (
+            "import gc, threading\n"
+            "from sqlalchemy.engine import Engine\n"
+            "import app.presentation.http.app\n"
+            "import app.app_module as app_module\n"
+            "assert app_module._injector is None, 'injector built at import'\n"
+            "assert not [o for o in gc.get_objects() if isinstance(o, Engine)]\n"
+            "assert threading.active_count() == 1, threading.enumerate()\n"
+        )
+
+        # WHEN: The HTTP app is imported
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+
+        # THEN: No injector, engine or background thread was created
+        assert result.returncode == 0, result.stderr
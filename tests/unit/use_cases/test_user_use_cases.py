@@ -1 +1,398 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
 
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.domain.entities.users import UserCreate, UserInDBBase, UserUpdate
+from app.ports.transactional.transaction_manager import (
+    AsyncTransactionManagerPort,
+    TransactionManagerPort,
+)
+from app.ports.use_cases.users import (
+    CreateUserUseCaseSchema,
+    DeleteUserUseCaseSchema,
+    ExportUsersUseCaseSchema,
+    GetUserUseCaseSchema,
+    RehashUserPasswordUseCaseSchema,
+    UpdateUserUseCaseSchema,
+    VerifyUserPasswordUseCaseSchema,
+)
+from app.ports.services.hasher_service_port import VerifyResultSchema
+from app.use_cases.user.create_user import CreateUser
+from app.use_cases.user.delete_user import DeleteUser
+from app.use_cases.user.export_users import ExportUsers
+from app.use_cases.user.get_user import GetUser
+from app.use_cases.user.update_user import UpdateUser
+from app.use_cases.user.verify_user_password import (
+    RehashUserPassword,
+    VerifyUserPassword,
+)
+from app.use_cases.user.asynchronous.create_user import AsyncCreateUser
+
+
+class RecordingTransactionManager(TransactionManagerPort[bool]):
+    def __init__(self, events):
+        self.events = events
+
+    @contextmanager
+    def get_transaction_context(self, read_only=False):
+        self.events.append("begin read-only" if read_only else "begin")
+        yield True
+        self.events.append("close" if read_only else "commit")
+
+
+class RecordingAsyncTransactionManager(AsyncTransactionManagerPort[bool]):
+    def __init__(self, events):
+        self.events = events
+
+    @asynccontextmanager
+    async def get_transaction_context(self, read_only=False):
+        self.events.append("begin")
+        yield True
+        self.events.append("commit")
+
+
+class RecordingHasher:
+    def __init__(self, events):
+        self.events = events
+
+    def set_params(self, params):
+        self.params = params
+
+    def execute(self):
+        self.events.append("hash")
+        return "hashed-" + self.params.data_to_hash
+
+
+class RecordingAsyncHasher(RecordingHasher):
+    async def execute(self):
+        return super().execute()
+
+
+class RecordingUserRepository:
+    def __init__(self, events):
+        self.events = events
+
+    def add(self, user_data, hashed_password):
+        self.events.append("add")
+        return UserInDBBase(**user_data.model_dump(), hashed_password=hashed_password)
+
+    def update(self, user_id, user_data, hashed_password=None, expected_versions=None):
+        self.events.append("update")
+        return UserInDBBase(id=user_id, **user_data.model_dump())
+
+    def delete(self, user_id):
+        self.events.append("delete")
+        return True
+
+    def get_by_id(self, user_id):
+        self.events.append("get")
+        return None
+
+    def get_password_hash(self, user_id):
+        self.events.append("get hash")
+        return "old-hash"
+
+    def replace_password_hash(self, user_id, current_hash, new_hash):
+        self.events.append(("replace hash", current_hash, new_hash))
+        return True
+
+    def stream_all(self, **filters):
+        for index in range(2):
+            self.events.append(("row", index))
+            yield {"index": index}
+
+
+class RecordingSession:
+    def __init__(self, events):
+        self.events = events
+
+    def commit(self):
+        self.events.append("commit")
+
+
+class RecordingSessionTransactionManager(TransactionManagerPort[RecordingSession]):
+    def __init__(self, events):
+        self.events = events
+
+    @contextmanager
+    def get_transaction_context(self, read_only=False):
+        self.events.append("begin")
+        yield RecordingSession(self.events)
+
+
+class RecordingUserCache:
+    def __init__(self, events):
+        self.events = events
+
+    def invalidate(self, user_id):
+        self.events.append(("invalidate", user_id))
+
+
+class RecordingVerifier:
+    def __init__(self, events, result):
+        self.events = events
+        self.result = result
+
+    def set_params(self, params):
+        self.params = params
+
+    def execute(self):
+        self.events.append("verify")
+        return self.result
+
+
+class RecordingRehasher:
+    def __init__(self, events):
+        self.events = events
+
+    def schedule(self, user_id, plain_data, current_hash):
+        self.events.append(("schedule rehash", plain_data, current_hash))
+
+
+class RecordingAsyncUserRepository(RecordingUserRepository):
+    async def add(self, user_data, hashed_password):
+        return super().add(user_data, hashed_password)
+
+
+def user_create_params():
+    user = UserCreate(
+        email="jane@example.com",
+        username="jane",
+        first_name="Jane",
+        last_name="Doe",
+    )
+    return CreateUserUseCaseSchema(user=user)
+
+
+class TestCreateUser:
+
+    def test_hashes_before_opening_the_transaction(self):
+        # GIVEN: A CreateUser use case wired with recording collaborators
+        events = []
+        use_case = CreateUser(
+            user_service=RecordingUserRepository(events),
+            transaction_manager=RecordingTransactionManager(events),
+            hasher_service=RecordingHasher(events),
+        )
+        use_case.set_params(user_create_params())
+
+        # WHEN: The use case is executed
+        created = use_case.execute()
+
+        # THEN: Hashing happens before the transaction is opened
+        assert events == ["hash", "begin", "add", "commit"]
+        assert created.hashed_password == "hashed-jane@example.com"
+
+
+class TestCacheInvalidation:
+
+    def test_update_invalidates_after_commit(self):
+        # GIVEN: An UpdateUser use case with a recording cache
+        events = []
+        user_id = uuid4()
+        use_case = UpdateUser(
+            user_service=RecordingUserRepository(events),
+            transaction_manager=RecordingSessionTransactionManager(events),
+            hasher_service=RecordingHasher(events),
+            user_cache=RecordingUserCache(events),
+        )
+        use_case.set_params(
+            UpdateUserUseCaseSchema(user_id=user_id, user=UserUpdate(first_name="Jo"))
+        )
+
+        # WHEN: The use case is executed
+        use_case.execute()
+
+        # THEN: The cache entry is dropped only once the update is committed
+        assert events == ["begin", "update", "commit", ("invalidate", user_id)]
+
+    def test_delete_invalidates_after_commit(self):
+        # GIVEN: A DeleteUser use case with a recording cache
+        events = []
+        user_id = uuid4()
+        use_case = DeleteUser(
+            user_service=RecordingUserRepository(events),
+            transaction_manager=RecordingSessionTransactionManager(events),
+            user_cache=RecordingUserCache(events),
+        )
+        use_case.set_params(DeleteUserUseCaseSchema(user_id=user_id))
+
+        # WHEN: The use case is executed
+        use_case.execute()
+
+        # THEN: The cache entry is dropped only once the delete is committed
+        assert events == ["begin", "delete", "commit", ("invalidate", user_id)]
+
+
+class TestConditionalUpdate:
+
+    def test_deleted_user_with_a_cached_version_is_not_a_conflict(self):
+        # GIVEN: A user deleted since it was read, whose version is still cached
+        events = []
+
+        class DeletedUserRepository(RecordingUserRepository):
+            def update(self, user_id, user_data, **kwargs):
+                self.events.append("update")
+                return None
+
+            def get_version(self, user_id):
+                return datetime.now(timezone.utc)
+
+            def get_stored_version(self, user_id):
+                self.events.append("get stored version")
+                return None
+
+        use_case = UpdateUser(
+            user_service=DeletedUserRepository(events),
+            transaction_manager=RecordingSessionTransactionManager(events),
+            hasher_service=RecordingHasher(events),
+            user_cache=RecordingUserCache(events),
+        )
+        use_case.set_params(
+            UpdateUserUseCaseSchema(
+                user_id=uuid4(),
+                user=UserUpdate(first_name="Jo"),
+                expected_versions=[datetime.now(timezone.utc)],
+            )
+        )
+
+        # WHEN: A guarded update is attempted
+        updated = use_case.execute()
+
+        # THEN: The stored version decides: the user is missing, not stale
+        assert updated is None
+        assert "get stored version" in events
+
+
+class TestReadOnlyUseCases:
+
+    def test_get_user_runs_in_a_read_only_transaction(self):
+        # GIVEN: A GetUser use case wired with recording collaborators
+        events = []
+        use_case = GetUser(
+            user_service=RecordingUserRepository(events),
+            transaction_manager=RecordingTransactionManager(events),
+        )
+        use_case.set_params(GetUserUseCaseSchema(user_id=uuid4()))
+
+        # WHEN: The use case is executed
+        use_case.execute()
+
+        # THEN: It asks for a read-only session, which is closed without commit
+        assert events == ["begin read-only", "get", "close"]
+
+
+class TestExportUsers:
+
+    def test_transaction_spans_the_whole_stream(self):
+        # GIVEN: An ExportUsers use case wired with recording collaborators
+        events = []
+        use_case = ExportUsers(
+            user_service=RecordingUserRepository(events),
+            transaction_manager=RecordingTransactionManager(events),
+        )
+        use_case.set_params(ExportUsersUseCaseSchema())
+
+        # WHEN: The use case is executed but not consumed yet
+        rows = use_case.execute()
+
+        # THEN: No transaction is opened until the stream is read
+        assert events == []
+
+        # AND: The transaction is committed only after the last row
+        assert list(rows) == [{"index": 0}, {"index": 1}]
+        assert events == ["begin", ("row", 0), ("row", 1), "commit"]
+
+
+class TestPasswordRehash:
+
+    def verify(self, events, result):
+        use_case = VerifyUserPassword(
+            user_service=RecordingUserRepository(events),
+            transaction_manager=RecordingTransactionManager(events),
+            verifier_service=RecordingVerifier(events, result),
+            password_rehasher=RecordingRehasher(events),
+        )
+        use_case.set_params(
+            VerifyUserPasswordUseCaseSchema(user_id=uuid4(), password="secret")
+        )
+        return use_case.execute()
+
+    def test_outdated_hash_is_rehashed_after_the_read(self):
+        # GIVEN: A valid password whose hash uses outdated parameters
+        events = []
+        result = VerifyResultSchema(is_valid=True, needs_update=True)
+
+        # WHEN: The password is verified
+        is_valid = self.verify(events, result)
+
+        # THEN: The hash is verified and the rehash scheduled once the
+        # read-only session is closed
+        assert is_valid is True
+        assert events == [
+            "begin read-only",
+            "get hash",
+            "close",
+            "verify",
+            ("schedule rehash", "secret", "old-hash"),
+        ]
+
+    def test_invalid_or_current_hashes_are_not_rehashed(self):
+        # GIVEN: A wrong password and a valid one with a current hash
+        wrong, current = [], []
+
+        # WHEN: Both are verified
+        self.verify(wrong, VerifyResultSchema(is_valid=False, needs_update=False))
+        self.verify(current, VerifyResultSchema(is_valid=True, needs_update=False))
+
+        # THEN: Neither schedules a rehash
+        assert wrong == current == ["begin read-only", "get hash", "close", "verify"]
+
+    def test_rehash_replaces_the_hash_and_invalidates_after_commit(self):
+        # GIVEN: A RehashUserPassword use case with a recording cache
+        events = []
+        user_id = uuid4()
+        use_case = RehashUserPassword(
+            user_service=RecordingUserRepository(events),
+            transaction_manager=RecordingSessionTransactionManager(events),
+            user_cache=RecordingUserCache(events),
+        )
+        use_case.set_params(
+            RehashUserPasswordUseCaseSchema(
+                user_id=user_id, current_hash="old-hash", new_hash="new-hash"
+            )
+        )
+
+        # WHEN: The use case is executed
+        replaced = use_case.execute()
+
+        # THEN: The hash is swapped guarded by the old one, then the cache is dropped
+        assert replaced is True
+        assert events == [
+            "begin",
+            ("replace hash", "old-hash", "new-hash"),
+            "commit",
+            ("invalidate", user_id),
+        ]
+
+
+class TestAsyncCreateUser:
+
+    def test_awaits_hashing_before_opening_the_transaction(self):
+        # GIVEN: An AsyncCreateUser use case wired with recording collaborators
+        events = []
+        use_case = AsyncCreateUser(
+            user_service=RecordingAsyncUserRepository(events),
+            transaction_manager=RecordingAsyncTransactionManager(events),
+            hasher_service=RecordingAsyncHasher(events),
+        )
+        use_case.set_params(user_create_params())
+
+        # WHEN: The use case is awaited
+        created = asyncio.run(use_case.execute())
+
+        # THEN: Hashing happens before the transaction is opened
+        assert events == ["hash", "begin", "add", "commit"]
+        assert created.hashed_password == "hashed-jane@example.com"